@@ -1,8 +1,16 @@
 """ The ``data_source.base`` package ``base`` module. """
 
 from abc import ABC, abstractmethod
+from asyncio import CancelledError, get_running_loop
+from functools import partial
 from logging import Logger
-from typing import Optional
+from os import PathLike
+from tempfile import TemporaryDirectory
+from threading import Event
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from data_source.base.utility.download import DataSourceDownloadUtility
+from data_source.base.utility.estimation import DataSourceEstimationUtility
 
 
 class DataSourceBase(ABC):
@@ -52,6 +60,39 @@ class DataSourceBase(ABC):
     ) -> None:
         """ Download the data from the data source. """
 
+    async def download_async(
+            self,
+            **kwargs
+    ) -> None:
+        """
+        Download the data from the data source without blocking the event loop.
+
+        The download runs on the shared download executor, which bounds the number of concurrent downloads. The data
+        is still written to the disk as it is received, so a slow disk slows down the download instead of buffering it
+        in the memory. If the awaiting task is cancelled, the download cancellation event is set, so the running
+        download stops after the chunk that is being received and releases its executor thread. The partial files are
+        kept, so the download is resumed by the next call.
+
+        :parameter kwargs: The keyword arguments of the `download` method.
+        """
+
+        download_cancellation_event = kwargs.pop("download_cancellation_event", None) or Event()
+
+        try:
+            await get_running_loop().run_in_executor(
+                DataSourceDownloadUtility.get_download_executor(),
+                partial(
+                    self.download,
+                    download_cancellation_event=download_cancellation_event,
+                    **kwargs
+                )
+            )
+
+        except CancelledError:
+            download_cancellation_event.set()
+
+            raise
+
     @abstractmethod
     def extract(
             self,
@@ -65,3 +106,193 @@ class DataSourceBase(ABC):
             **kwargs
     ) -> None:
         """ Format the data from the data source. """
+
+    def _is_streaming_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the data source can be formatted directly from the download stream.
+
+        :parameter version: The version of the data source.
+
+        :returns: The indicator of whether the version of the data source can be formatted directly from the download
+            stream.
+        """
+
+        return False
+
+    def _is_chunked_formatting_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the data source is formatted in chunks of the number of rows that is
+        specified by the `number_of_rows_per_chunk` keyword argument.
+
+        :parameter version: The version of the data source.
+
+        :returns: The indicator of whether the version of the data source is formatted in chunks.
+        """
+
+        return False
+
+    def _get_file_urls_and_names(
+            self,
+            version: str,
+            **kwargs
+    ) -> List[Tuple[str, str]]:
+        """
+        Get the URLs and names of the files that are downloaded for a version of the data source.
+
+        :parameter version: The version of the data source.
+        :parameter kwargs: The keyword arguments of the `download` method.
+
+        :returns: The URLs and names of the files.
+        """
+
+        file_urls_and_names = list()
+
+        logger = self.logger
+
+        self.logger = None
+
+        try:
+            with TemporaryDirectory() as temporary_directory_path:
+                self.download(
+                    version=version,
+                    output_directory_path=temporary_directory_path,
+                    **{
+                        **kwargs,
+                        "file_download_recorder": file_urls_and_names,
+                    }
+                )
+
+        finally:
+            self.logger = logger
+
+        return file_urls_and_names
+
+    def estimate_resource_usage(
+            self,
+            version: str,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Estimate the resource usage of the download, extraction, and formatting of a version of the data source.
+
+        The files are not downloaded. The streaming mode and the number of rows per chunk are only taken into account if
+        the version supports them.
+
+        :parameter version: The version of the data source.
+        :parameter kwargs: The keyword arguments of the `download`, `extract`, and `format` methods.
+
+        :returns: The estimated download size, extracted size, formatted size, peak disk usage, and peak memory usage
+            in bytes, the number of files of unknown size, and the indicator of whether the streaming mode is utilized.
+        """
+
+        is_streaming_enabled = kwargs.get("is_streaming_enabled", False) and self._is_streaming_supported(
+            version=version
+        )
+
+        resource_usage = DataSourceEstimationUtility.estimate_resource_usage(
+            file_urls_and_names=self._get_file_urls_and_names(
+                version=version,
+                **{
+                    **kwargs,
+                    "is_streaming_enabled": False,
+                }
+            ),
+            is_streaming_enabled=is_streaming_enabled,
+            is_input_file_deletion_enabled=kwargs.get("is_input_file_deletion_enabled", False),
+            number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None) if (
+                self._is_chunked_formatting_supported(
+                    version=version
+                )
+            ) else None
+        )
+
+        resource_usage["is_streaming_enabled"] = is_streaming_enabled
+
+        return resource_usage
+
+    def check_resource_usage(
+            self,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            maximum_disk_usage: Optional[int] = None,
+            maximum_memory_usage: Optional[int] = None,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Check whether the estimated resource usage of a version of the data source is within the limits.
+
+        If the limits would be exceeded, the deletion of the input files and then the streaming mode are enabled in turn
+        until the estimated resource usage is within the limits.
+
+        :parameter version: The version of the data source.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter maximum_disk_usage: The maximum disk usage in bytes. The value `None` indicates that the available
+            disk space of the output directory should be utilized.
+        :parameter maximum_memory_usage: The maximum memory usage in bytes. The value `None` indicates that the
+            available physical memory should be utilized, if it can be determined.
+        :parameter kwargs: The keyword arguments of the `download`, `extract`, and `format` methods.
+
+        :returns: The keyword arguments of the `download`, `extract`, and `format` methods that should be utilized.
+        """
+
+        if maximum_disk_usage is None:
+            maximum_disk_usage = DataSourceEstimationUtility.get_available_disk_space(
+                directory_path=output_directory_path
+            )
+
+        if maximum_memory_usage is None:
+            maximum_memory_usage = DataSourceEstimationUtility.get_available_memory()
+
+        for adjusted_kwargs in [
+            kwargs,
+            {
+                **kwargs,
+                "is_input_file_deletion_enabled": True,
+            },
+            {
+                **kwargs,
+                "is_input_file_deletion_enabled": True,
+                "is_streaming_enabled": True,
+            },
+        ]:
+            resource_usage = self.estimate_resource_usage(
+                version=version,
+                **adjusted_kwargs
+            )
+
+            if resource_usage["peak_disk_usage"] <= maximum_disk_usage and (
+                maximum_memory_usage is None or resource_usage["peak_memory_usage"] <= maximum_memory_usage
+            ):
+                if adjusted_kwargs != kwargs and self.logger is not None:
+                    self.logger.warning(
+                        msg="The keyword arguments have been adjusted to fit the resource limits: {kwargs:s}.".format(
+                            kwargs=str({
+                                key: value for key, value in adjusted_kwargs.items() if kwargs.get(key, None) != value
+                            })
+                        )
+                    )
+
+                return adjusted_kwargs
+
+        exception_handle = ValueError(
+            "The estimated peak disk usage of {peak_disk_usage:d} bytes and peak memory usage of {peak_memory_usage:d} "
+            "bytes exceed the limits of {maximum_disk_usage:d} and {maximum_memory_usage:s} bytes.".format(
+                peak_disk_usage=resource_usage["peak_disk_usage"],
+                peak_memory_usage=resource_usage["peak_memory_usage"],
+                maximum_disk_usage=maximum_disk_usage,
+                maximum_memory_usage=str(maximum_memory_usage)
+            )
+        )
+
+        if self.logger is not None:
+            self.logger.error(
+                msg=exception_handle
+            )
+
+        raise exception_handle
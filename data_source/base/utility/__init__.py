@@ -1,3 +1,11 @@
 """ The ``data_source.base.utility`` package initialization module. """
 
+from data_source.base.utility.block_index import DataSourceBZ2BlockIndex
+from data_source.base.utility.cache import DataSourceCacheUtility, DataSourceDownloadCache
 from data_source.base.utility.download import DataSourceDownloadUtility
+from data_source.base.utility.estimation import DataSourceEstimationUtility
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.rate_limiting import DataSourceTokenBucket
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
@@ -0,0 +1,783 @@
+""" The ``data_source.base.utility`` package ``block_index`` module. """
+
+from bisect import bisect_left, bisect_right
+from hashlib import sha256
+from io import RawIOBase
+from json import dump, load
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from bz2 import decompress
+
+from pqdm.processes import pqdm
+
+from tarfile import TarError, TarFile
+
+from data_source.base.utility.cache import DataSourceCacheUtility
+from data_source.base.utility.download import DataSourceDownloadUtility
+
+
+class DataSourceBZ2BlockIndex:
+    """
+    The data source BZ2 block index class.
+
+    The blocks of a BZ2 file are compressed independently, but they are not aligned to bytes. The index stores the bit
+    offsets of the blocks and the offsets of their uncompressed data, which allows any range of the uncompressed data to
+    be read by decompressing only the blocks that contain it, concurrently if more than one process is utilized. If the
+    BZ2 file is a TAR archive, the index also stores the offsets of the archive members.
+    """
+
+    _block_magic_number = 0x314159265359
+
+    _end_of_stream_magic_number = 0x177245385090
+
+    _cache_configuration = {
+        "is_enabled": True,
+        "cache_directory_path": None,
+    }
+
+    def __init__(
+            self,
+            archive_file_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter archive_file_path: The path to the BZ2 file.
+        :parameter number_of_processes: The number of processes.
+        """
+
+        self.archive_file_path = archive_file_path
+        self.number_of_processes = number_of_processes
+
+        self._index = None
+
+        self._cached_block_index = None
+        self._cached_block_data = b""
+
+    @property
+    def archive_file_path(
+            self
+    ) -> Path:
+        """
+        Get the value of the path to the BZ2 file.
+
+        :returns: The value of the path to the BZ2 file.
+        """
+
+        return self._archive_file_path
+
+    @archive_file_path.setter
+    def archive_file_path(
+            self,
+            value: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Set the value of the path to the BZ2 file.
+
+        :parameter value: The value of the path to the BZ2 file.
+        """
+
+        self._archive_file_path = Path(value)
+
+    @property
+    def number_of_processes(
+            self
+    ) -> int:
+        """
+        Get the value of the number of processes.
+
+        :returns: The value of the number of processes.
+        """
+
+        return self._number_of_processes
+
+    @number_of_processes.setter
+    def number_of_processes(
+            self,
+            value: int
+    ) -> None:
+        """
+        Set the value of the number of processes.
+
+        :parameter value: The value of the number of processes.
+        """
+
+        self._number_of_processes = max(1, value)
+
+    @staticmethod
+    def configure_cache(
+            cache_directory_path: Optional[Union[str, PathLike[str]]]
+    ) -> None:
+        """
+        Configure the on-disk cache of the BZ2 block indices.
+
+        :parameter cache_directory_path: The path to the directory where the BZ2 block indices should be cached. The
+            value `None` indicates that the BZ2 block indices should not be cached.
+        """
+
+        DataSourceBZ2BlockIndex._cache_configuration = {
+            "is_enabled": cache_directory_path is not None,
+            "cache_directory_path": None if cache_directory_path is None else Path(cache_directory_path),
+        }
+
+    @staticmethod
+    def _find_magic_number_bit_offsets(
+            archive_file_handle: mmap,
+            magic_number: int
+    ) -> List[int]:
+        """
+        Find the bit offsets of a 48-bit magic number in a BZ2 file.
+
+        :parameter archive_file_handle: The memory map of the BZ2 file.
+        :parameter magic_number: The 48-bit magic number.
+
+        :returns: The bit offsets of the magic number.
+        """
+
+        magic_number_bit_offsets = list()
+
+        for bit_shift in range(8):
+            number_of_pattern_bytes = (bit_shift + 48 + 7) // 8
+            number_of_padding_bits = number_of_pattern_bytes * 8 - bit_shift - 48
+
+            pattern = (magic_number << number_of_padding_bits).to_bytes(
+                length=number_of_pattern_bytes,
+                byteorder="big"
+            )
+
+            # Only the bytes of the pattern that are fully covered by the magic number are searched for, and the
+            # partially covered first and last bytes are verified using bit masks.
+            first_byte_mask = 0xFF >> bit_shift
+            last_byte_mask = (0xFF << number_of_padding_bits) & 0xFF
+
+            search_pattern = pattern[
+                (1 if bit_shift > 0 else 0):(-1 if number_of_padding_bits > 0 else None)
+            ]
+
+            search_offset = 0
+
+            while True:
+                search_pattern_offset = archive_file_handle.find(search_pattern, search_offset)
+
+                if search_pattern_offset == -1:
+                    break
+
+                search_offset = search_pattern_offset + 1
+
+                pattern_offset = search_pattern_offset - (1 if bit_shift > 0 else 0)
+
+                if pattern_offset < 0 or pattern_offset + number_of_pattern_bytes > len(archive_file_handle):
+                    continue
+
+                if archive_file_handle[pattern_offset] & first_byte_mask != pattern[0] & first_byte_mask:
+                    continue
+
+                if archive_file_handle[pattern_offset + number_of_pattern_bytes - 1] & last_byte_mask != pattern[-1]:
+                    continue
+
+                magic_number_bit_offsets.append(pattern_offset * 8 + bit_shift)
+
+        return sorted(magic_number_bit_offsets)
+
+    @staticmethod
+    def _decompress_block(
+            archive_file_path: Union[str, PathLike[str]],
+            block_start_bit_offset: int,
+            block_end_bit_offset: int
+    ) -> bytes:
+        """
+        Decompress a block of a BZ2 file.
+
+        The block is shifted to a byte boundary and wrapped into a standalone BZ2 stream whose combined CRC is equal to
+        the CRC of the block.
+
+        :parameter archive_file_path: The path to the BZ2 file.
+        :parameter block_start_bit_offset: The bit offset of the start of the block.
+        :parameter block_end_bit_offset: The bit offset of the end of the block.
+
+        :returns: The decompressed data of the block.
+        """
+
+        block_start_byte_offset = block_start_bit_offset // 8
+        block_end_byte_offset = (block_end_bit_offset + 7) // 8
+
+        with open(
+            file=archive_file_path,
+            mode="rb"
+        ) as archive_file_handle:
+            archive_file_handle.seek(block_start_byte_offset)
+
+            block_bytes = archive_file_handle.read(block_end_byte_offset - block_start_byte_offset)
+
+        number_of_block_bits = block_end_bit_offset - block_start_bit_offset
+
+        block_bits = (
+            int.from_bytes(
+                bytes=block_bytes,
+                byteorder="big"
+            ) >> (block_end_byte_offset * 8 - block_end_bit_offset)
+        ) & ((1 << number_of_block_bits) - 1)
+
+        block_crc = (block_bits >> (number_of_block_bits - 80)) & 0xFFFFFFFF
+
+        number_of_stream_bits = number_of_block_bits + 80
+        number_of_padding_bits = -number_of_stream_bits % 8
+
+        stream_bits = (block_bits << 80) | (DataSourceBZ2BlockIndex._end_of_stream_magic_number << 32) | block_crc
+
+        return decompress(
+            data=b"BZh9" + (stream_bits << number_of_padding_bits).to_bytes(
+                length=(number_of_stream_bits + number_of_padding_bits) // 8,
+                byteorder="big"
+            )
+        )
+
+    @staticmethod
+    def _get_decompressed_block_size(
+            archive_file_path: Union[str, PathLike[str]],
+            block_start_bit_offset: int,
+            block_end_bit_offset: int
+    ) -> Optional[int]:
+        """
+        Get the size of the decompressed data of a block of a BZ2 file.
+
+        The block is valid only if its data is decompressed and matches the CRC of the block, which rejects the ranges
+        that start or end at a magic number that occurs by chance in the compressed data of a block.
+
+        :parameter archive_file_path: The path to the BZ2 file.
+        :parameter block_start_bit_offset: The bit offset of the start of the block.
+        :parameter block_end_bit_offset: The bit offset of the end of the block.
+
+        :returns: The size of the decompressed data of the block. The value `None` indicates that the range is not a
+            valid block.
+        """
+
+        try:
+            return len(DataSourceBZ2BlockIndex._decompress_block(
+                archive_file_path=archive_file_path,
+                block_start_bit_offset=block_start_bit_offset,
+                block_end_bit_offset=block_end_bit_offset
+            ))
+
+        except (EOFError, OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_decompressed_block_range(
+            archive_file_path: Union[str, PathLike[str]],
+            block_start_bit_offset: int,
+            block_end_bit_offset: int,
+            block_range_start_offset: int,
+            block_range_end_offset: int,
+            output_file_path: Union[str, PathLike[str]],
+            output_file_offset: int
+    ) -> None:
+        """
+        Write a range of the decompressed data of a block of a BZ2 file to a specific offset of an output file.
+
+        :parameter archive_file_path: The path to the BZ2 file.
+        :parameter block_start_bit_offset: The bit offset of the start of the block.
+        :parameter block_end_bit_offset: The bit offset of the end of the block.
+        :parameter block_range_start_offset: The offset of the start of the range in the decompressed data of the block.
+        :parameter block_range_end_offset: The offset of the end of the range in the decompressed data of the block.
+        :parameter output_file_path: The path to the output file.
+        :parameter output_file_offset: The offset in the output file where the range should be written.
+        """
+
+        block_data = DataSourceBZ2BlockIndex._decompress_block(
+            archive_file_path=archive_file_path,
+            block_start_bit_offset=block_start_bit_offset,
+            block_end_bit_offset=block_end_bit_offset
+        )
+
+        with open(
+            file=output_file_path,
+            mode="r+b"
+        ) as output_file_handle:
+            output_file_handle.seek(output_file_offset)
+            output_file_handle.write(block_data[block_range_start_offset:block_range_end_offset])
+
+    def _get_index_file_path(
+            self
+    ) -> Optional[Path]:
+        """
+        Get the path to the cached index of the BZ2 file.
+
+        The index is identified by the SHA-256 digest of the BZ2 file if it is available from the digest manifest of the
+        downloaded file, so it is reused across the copies of the same file.
+
+        :returns: The path to the cached index of the BZ2 file. The value `None` indicates that the index should not be
+            cached.
+        """
+
+        cache_directory_path = DataSourceCacheUtility.get_cache_directory_path(
+            cache_configuration=DataSourceBZ2BlockIndex._cache_configuration,
+            cache_name="bz2_block_indices"
+        )
+
+        if cache_directory_path is None:
+            return None
+
+        file_digests = DataSourceDownloadUtility.get_file_digests(
+            file_path=self.archive_file_path
+        )
+
+        if file_digests is not None and "sha256" in file_digests.keys():
+            index_key = file_digests["sha256"]
+
+        else:
+            index_key = sha256(
+                "\n".join([
+                    self.archive_file_path.resolve().as_posix(),
+                    str(self.archive_file_path.stat().st_size),
+                    str(self.archive_file_path.stat().st_mtime_ns),
+                ]).encode(
+                    encoding="utf-8"
+                )
+            ).hexdigest()
+
+        return Path(cache_directory_path, "{index_key:s}.json".format(
+            index_key=index_key
+        ))
+
+    def _build_index(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Build the index of the BZ2 file.
+
+        :returns: The index of the BZ2 file.
+        """
+
+        with open(
+            file=self.archive_file_path,
+            mode="rb"
+        ) as archive_file_handle:
+            with mmap(
+                fileno=archive_file_handle.fileno(),
+                length=0,
+                access=ACCESS_READ
+            ) as archive_file_memory_map:
+                block_start_bit_offsets = self._find_magic_number_bit_offsets(
+                    archive_file_handle=archive_file_memory_map,
+                    magic_number=self._block_magic_number
+                )
+
+                end_of_stream_bit_offsets = self._find_magic_number_bit_offsets(
+                    archive_file_handle=archive_file_memory_map,
+                    magic_number=self._end_of_stream_magic_number
+                )
+
+        if len(block_start_bit_offsets) == 0 or len(end_of_stream_bit_offsets) == 0:
+            raise ValueError(
+                "The file '{archive_file_path:s}' is not a valid BZ2 file.".format(
+                    archive_file_path=self.archive_file_path.as_posix()
+                )
+            )
+
+        # A block ends where either the next block or the end-of-stream marker of its stream starts.
+        block_bit_offsets = list()
+
+        for block_index, block_start_bit_offset in enumerate(block_start_bit_offsets):
+            end_of_stream_index = bisect_right(end_of_stream_bit_offsets, block_start_bit_offset)
+
+            block_end_bit_offset = min(
+                block_start_bit_offsets[block_index + 1]
+                if block_index + 1 < len(block_start_bit_offsets) else end_of_stream_bit_offsets[-1],
+                end_of_stream_bit_offsets[end_of_stream_index]
+                if end_of_stream_index < len(end_of_stream_bit_offsets) else end_of_stream_bit_offsets[-1]
+            )
+
+            block_bit_offsets.append([
+                block_start_bit_offset,
+                block_end_bit_offset,
+            ])
+
+        decompressed_block_sizes = pqdm(
+            array=[
+                {
+                    "archive_file_path": self.archive_file_path,
+                    "block_start_bit_offset": block_start_bit_offset,
+                    "block_end_bit_offset": block_end_bit_offset,
+                } for block_start_bit_offset, block_end_bit_offset in block_bit_offsets
+            ],
+            function=DataSourceBZ2BlockIndex._get_decompressed_block_size,
+            n_jobs=min(self.number_of_processes, len(block_bit_offsets)),
+            argument_type="kwargs",
+            exception_behaviour="immediate",
+            desc="Indexing the {archive_file_name:s} archive".format(
+                archive_file_name=self.archive_file_path.name
+            ),
+            ncols=150
+        )
+
+        # The 48-bit magic numbers can also occur by chance in the compressed data of a block, so a range that is not a
+        # valid block is extended to the following candidate offsets until it is, and the candidate block start bit
+        # offsets that it covers are skipped.
+        boundary_bit_offsets = sorted(set(block_start_bit_offsets).union(end_of_stream_bit_offsets))
+
+        validated_block_bit_offsets = list()
+
+        block_uncompressed_offsets = [0, ]
+
+        block_index = 0
+
+        while block_index < len(block_bit_offsets):
+            block_start_bit_offset, block_end_bit_offset = block_bit_offsets[block_index]
+            decompressed_block_size = decompressed_block_sizes[block_index]
+
+            while decompressed_block_size is None:
+                boundary_index = bisect_right(boundary_bit_offsets, block_end_bit_offset)
+
+                if boundary_index == len(boundary_bit_offsets):
+                    raise ValueError(
+                        "The block at the bit offset {bit_offset:d} of the file '{archive_file_path:s}' is not a "
+                        "valid BZ2 block.".format(
+                            bit_offset=block_start_bit_offset,
+                            archive_file_path=self.archive_file_path.as_posix()
+                        )
+                    )
+
+                block_end_bit_offset = boundary_bit_offsets[boundary_index]
+
+                decompressed_block_size = DataSourceBZ2BlockIndex._get_decompressed_block_size(
+                    archive_file_path=self.archive_file_path,
+                    block_start_bit_offset=block_start_bit_offset,
+                    block_end_bit_offset=block_end_bit_offset
+                )
+
+            validated_block_bit_offsets.append([
+                block_start_bit_offset,
+                block_end_bit_offset,
+            ])
+
+            block_uncompressed_offsets.append(block_uncompressed_offsets[-1] + decompressed_block_size)
+
+            block_index = bisect_left(block_start_bit_offsets, block_end_bit_offset)
+
+        self._index = {
+            "archive_file_size": self.archive_file_path.stat().st_size,
+            "block_bit_offsets": validated_block_bit_offsets,
+            "block_uncompressed_offsets": block_uncompressed_offsets,
+            "archive_members": dict(),
+        }
+
+        try:
+            with TarFile.open(
+                fileobj=_DataSourceBZ2BlockReader(
+                    block_index=self
+                ),
+                mode="r:"
+            ) as tar_archive_file_handle:
+                for tar_archive_member in tar_archive_file_handle:
+                    if tar_archive_member.isfile():
+                        self._index["archive_members"][tar_archive_member.name] = [
+                            tar_archive_member.offset_data,
+                            tar_archive_member.size,
+                        ]
+
+        except TarError:
+            self._index["archive_members"] = dict()
+
+        return self._index
+
+    def _get_index(
+            self
+    ) -> Dict[str, Any]:
+        """
+        Get the index of the BZ2 file from the cache or build it if it is not cached.
+
+        :returns: The index of the BZ2 file.
+        """
+
+        if self._index is not None:
+            return self._index
+
+        index_file_path = self._get_index_file_path()
+
+        if index_file_path is not None:
+            try:
+                with open(
+                    file=index_file_path
+                ) as index_file_handle:
+                    index = load(
+                        fp=index_file_handle
+                    )
+
+                if index["archive_file_size"] == self.archive_file_path.stat().st_size:
+                    self._index = index
+
+                    return self._index
+
+            except (OSError, ValueError, KeyError):
+                pass
+
+        self._build_index()
+
+        if index_file_path is not None:
+            try:
+                index_file_path.parent.mkdir(
+                    parents=True,
+                    exist_ok=True
+                )
+
+                temporary_index_file_path = index_file_path.with_suffix(".tmp")
+
+                with open(
+                    file=temporary_index_file_path,
+                    mode="w"
+                ) as index_file_handle:
+                    dump(
+                        obj=self._index,
+                        fp=index_file_handle
+                    )
+
+                temporary_index_file_path.replace(
+                    target=index_file_path
+                )
+
+            except OSError:
+                pass
+
+        return self._index
+
+    def get_uncompressed_size(
+            self
+    ) -> int:
+        """
+        Get the size of the uncompressed data of the BZ2 file.
+
+        :returns: The size of the uncompressed data of the BZ2 file.
+        """
+
+        return self._get_index()["block_uncompressed_offsets"][-1]
+
+    def get_archive_member_names(
+            self
+    ) -> List[str]:
+        """
+        Get the names of the regular file members if the BZ2 file is a TAR archive.
+
+        :returns: The names of the regular file members.
+        """
+
+        return list(self._get_index()["archive_members"].keys())
+
+    def read(
+            self,
+            offset: int,
+            size: int
+    ) -> bytes:
+        """
+        Read a range of the uncompressed data of the BZ2 file.
+
+        :parameter offset: The offset of the start of the range in the uncompressed data.
+        :parameter size: The size of the range.
+
+        :returns: The uncompressed data of the range.
+        """
+
+        index = self._get_index()
+
+        range_end_offset = min(offset + size, index["block_uncompressed_offsets"][-1])
+
+        data = list()
+
+        while offset < range_end_offset:
+            block_index = bisect_right(index["block_uncompressed_offsets"], offset) - 1
+
+            # The most recently decompressed block is kept, since the consecutive small reads of the TAR headers and
+            # the sequential reads of the data usually fall into the same block.
+            if block_index != self._cached_block_index:
+                self._cached_block_data = self._decompress_block(
+                    archive_file_path=self.archive_file_path,
+                    block_start_bit_offset=index["block_bit_offsets"][block_index][0],
+                    block_end_bit_offset=index["block_bit_offsets"][block_index][1]
+                )
+
+                self._cached_block_index = block_index
+
+            block_data = self._cached_block_data
+
+            block_range_start_offset = offset - index["block_uncompressed_offsets"][block_index]
+            block_range_end_offset = min(range_end_offset - index["block_uncompressed_offsets"][block_index], len(
+                block_data
+            ))
+
+            data.append(block_data[block_range_start_offset:block_range_end_offset])
+
+            offset += block_range_end_offset - block_range_start_offset
+
+        return b"".join(data)
+
+    def extract_archive_member(
+            self,
+            archive_member_name: str,
+            output_file_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Extract a regular file member if the BZ2 file is a TAR archive, decompressing only the blocks that contain it.
+
+        :parameter archive_member_name: The name of the archive member.
+        :parameter output_file_path: The path to the output file.
+        """
+
+        index = self._get_index()
+
+        if archive_member_name not in index["archive_members"].keys():
+            raise ValueError(
+                "The archive '{archive_file_path:s}' does not contain the member '{archive_member_name:s}'.".format(
+                    archive_file_path=self.archive_file_path.as_posix(),
+                    archive_member_name=archive_member_name
+                )
+            )
+
+        archive_member_offset, archive_member_size = index["archive_members"][archive_member_name]
+
+        with open(
+            file=output_file_path,
+            mode="wb"
+        ) as output_file_handle:
+            output_file_handle.truncate(archive_member_size)
+
+        if archive_member_size == 0:
+            return
+
+        first_block_index = bisect_right(index["block_uncompressed_offsets"], archive_member_offset) - 1
+        last_block_index = bisect_right(
+            index["block_uncompressed_offsets"],
+            archive_member_offset + archive_member_size - 1
+        ) - 1
+
+        block_ranges = list()
+
+        for block_index in range(first_block_index, last_block_index + 1):
+            block_uncompressed_offset = index["block_uncompressed_offsets"][block_index]
+
+            block_ranges.append({
+                "archive_file_path": self.archive_file_path,
+                "block_start_bit_offset": index["block_bit_offsets"][block_index][0],
+                "block_end_bit_offset": index["block_bit_offsets"][block_index][1],
+                "block_range_start_offset": max(archive_member_offset - block_uncompressed_offset, 0),
+                "block_range_end_offset": min(
+                    archive_member_offset + archive_member_size,
+                    index["block_uncompressed_offsets"][block_index + 1]
+                ) - block_uncompressed_offset,
+                "output_file_path": output_file_path,
+                "output_file_offset": max(block_uncompressed_offset - archive_member_offset, 0),
+            })
+
+        pqdm(
+            array=block_ranges,
+            function=DataSourceBZ2BlockIndex._write_decompressed_block_range,
+            n_jobs=min(self.number_of_processes, len(block_ranges)),
+            argument_type="kwargs",
+            exception_behaviour="immediate",
+            desc="Extracting the {archive_member_name:s} archive member".format(
+                archive_member_name=Path(archive_member_name).name
+            ),
+            ncols=150
+        )
+
+
+class _DataSourceBZ2BlockReader(RawIOBase):
+    """ The data source BZ2 block reader class, which exposes the uncompressed data of a BZ2 file as a file. """
+
+    def __init__(
+            self,
+            block_index: DataSourceBZ2BlockIndex
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter block_index: The BZ2 block index.
+        """
+
+        super().__init__()
+
+        self._block_index = block_index
+        self._offset = 0
+
+    def readable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the reader is readable.
+
+        :returns: The indicator of whether the reader is readable.
+        """
+
+        return True
+
+    def seekable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the reader is seekable.
+
+        :returns: The indicator of whether the reader is seekable.
+        """
+
+        return True
+
+    def tell(
+            self
+    ) -> int:
+        """
+        Get the current offset in the uncompressed data.
+
+        :returns: The current offset in the uncompressed data.
+        """
+
+        return self._offset
+
+    def seek(
+            self,
+            offset: int,
+            whence: int = 0
+    ) -> int:
+        """
+        Change the current offset in the uncompressed data.
+
+        :parameter offset: The offset relative to the position indicated by `whence`.
+        :parameter whence: The start (0), the current offset (1), or the end (2) of the uncompressed data.
+
+        :returns: The new offset in the uncompressed data.
+        """
+
+        if whence == 1:
+            offset += self._offset
+
+        elif whence == 2:
+            offset += self._block_index.get_uncompressed_size()
+
+        self._offset = max(offset, 0)
+
+        return self._offset
+
+    def readinto(
+            self,
+            buffer: Any
+    ) -> int:
+        """
+        Read the uncompressed data at the current offset into a buffer.
+
+        :parameter buffer: The buffer.
+
+        :returns: The number of bytes that are read.
+        """
+
+        data = self._block_index.read(
+            offset=self._offset,
+            size=len(buffer)
+        )
+
+        buffer[:len(data)] = data
+
+        self._offset += len(data)
+
+        return len(data)
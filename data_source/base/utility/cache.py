@@ -0,0 +1,534 @@
+""" The ``data_source.base.utility`` package ``cache`` module. """
+
+from contextlib import contextmanager
+from hashlib import sha256
+from json import dump, load
+from os import PathLike, environ, link
+from pathlib import Path
+from shutil import copyfile
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Any, Dict, Iterator, Optional, Union
+
+try:
+    from fcntl import LOCK_EX, LOCK_UN, flock
+
+except ImportError:
+    flock = None
+
+
+class DataSourceCacheUtility:
+    """ The data source cache utility class. """
+
+    @staticmethod
+    def get_cache_directory_path(
+            cache_configuration: Dict[str, Any],
+            cache_name: str
+    ) -> Optional[Path]:
+        """
+        Get the path to the directory of an on-disk cache of the data sources from the configuration of the cache.
+
+        If no path is configured, the path is resolved from the `XDG_CACHE_HOME` environment variable, or from the home
+        directory if the variable is not set, each time the method is called, so the environment can be changed after
+        the package is imported.
+
+        :parameter cache_configuration: The configuration of the cache, which holds the indicator of whether the cache
+            is enabled and the configured path to the directory of the cache.
+        :parameter cache_name: The name of the directory of the cache in the default cache directory of the data
+            sources.
+
+        :returns: The path to the directory of the cache. The value `None` indicates that the cache is disabled.
+        """
+
+        if not cache_configuration["is_enabled"]:
+            return None
+
+        if cache_configuration["cache_directory_path"] is not None:
+            return Path(cache_configuration["cache_directory_path"])
+
+        return Path(
+            environ.get("XDG_CACHE_HOME", None) or Path.home().joinpath(".cache"),
+            "data_source",
+            cache_name
+        )
+
+
+class DataSourceDownloadCache:
+    """
+    The data source download cache class.
+
+    The cache directory can be shared by multiple processes. The index of the cache is locked using an advisory lock on
+    the `index.lock` file, if the platform supports it, and it is replaced atomically once it is written.
+    """
+
+    def __init__(
+            self,
+            cache_directory_path: Union[str, PathLike[str]],
+            maximum_cache_size: Optional[int] = None,
+            is_revalidation_enabled: bool = True
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter cache_directory_path: The path to the directory where the downloaded files should be cached.
+        :parameter maximum_cache_size: The maximum size of the cached files in bytes. The least recently used files are
+            evicted once the size is exceeded. The value `None` indicates that the size should not be limited.
+        :parameter is_revalidation_enabled: The indicator of whether a cached file should be revalidated against the
+            validators of the file on the server before it is used. If the value is `False`, the most recently cached
+            file of a URL is used without sending any HTTP requests.
+        """
+
+        self.cache_directory_path = cache_directory_path
+        self.maximum_cache_size = maximum_cache_size
+        self.is_revalidation_enabled = is_revalidation_enabled
+
+        self._index_lock = Lock()
+
+    @property
+    def cache_directory_path(
+            self
+    ) -> Path:
+        """
+        Get the value of the path to the directory where the downloaded files should be cached.
+
+        :returns: The value of the path to the directory where the downloaded files should be cached.
+        """
+
+        return self._cache_directory_path
+
+    @cache_directory_path.setter
+    def cache_directory_path(
+            self,
+            value: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Set the value of the path to the directory where the downloaded files should be cached.
+
+        :parameter value: The value of the path to the directory where the downloaded files should be cached.
+        """
+
+        self._cache_directory_path = Path(value)
+
+        Path(self._cache_directory_path, "objects").mkdir(
+            parents=True,
+            exist_ok=True
+        )
+
+    @property
+    def maximum_cache_size(
+            self
+    ) -> Optional[int]:
+        """
+        Get the value of the maximum size of the cached files in bytes.
+
+        :returns: The value of the maximum size of the cached files in bytes.
+        """
+
+        return self._maximum_cache_size
+
+    @maximum_cache_size.setter
+    def maximum_cache_size(
+            self,
+            value: Optional[int]
+    ) -> None:
+        """
+        Set the value of the maximum size of the cached files in bytes.
+
+        :parameter value: The value of the maximum size of the cached files in bytes.
+        """
+
+        self._maximum_cache_size = value
+
+    @property
+    def is_revalidation_enabled(
+            self
+    ) -> bool:
+        """
+        Get the value of the indicator of whether a cached file should be revalidated before it is used.
+
+        :returns: The value of the indicator of whether a cached file should be revalidated before it is used.
+        """
+
+        return self._is_revalidation_enabled
+
+    @is_revalidation_enabled.setter
+    def is_revalidation_enabled(
+            self,
+            value: bool
+    ) -> None:
+        """
+        Set the value of the indicator of whether a cached file should be revalidated before it is used.
+
+        :parameter value: The value of the indicator of whether a cached file should be revalidated before it is used.
+        """
+
+        self._is_revalidation_enabled = value
+
+    @staticmethod
+    def get_file_key(
+            file_url: str,
+            file_validators: Dict[str, Optional[str]]
+    ) -> str:
+        """
+        Get the key of a file from the URL and the validators of the file.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_validators: The `ETag`, `Last-Modified`, and `Content-Length` validators of the file.
+
+        :returns: The key of the file.
+        """
+
+        return sha256(
+            "\n".join([
+                file_url,
+                file_validators.get("ETag", None) or "",
+                file_validators.get("Last-Modified", None) or "",
+                file_validators.get("Content-Length", None) or "",
+            ]).encode(
+                encoding="utf-8"
+            )
+        ).hexdigest()
+
+    @staticmethod
+    def get_file_sha256(
+            file_path: Union[str, PathLike[str]]
+    ) -> str:
+        """
+        Get the SHA-256 digest of a file.
+
+        :parameter file_path: The path to the file.
+
+        :returns: The SHA-256 digest of the file.
+        """
+
+        file_hash = sha256()
+
+        with open(
+            file=file_path,
+            mode="rb"
+        ) as file_handle:
+            while True:
+                file_chunk = file_handle.read(1024 * 1024)
+
+                if not file_chunk:
+                    break
+
+                file_hash.update(file_chunk)
+
+        return file_hash.hexdigest()
+
+    def _get_object_file_path(
+            self,
+            file_sha256: str
+    ) -> Path:
+        """
+        Get the path to the cached object of a file.
+
+        :parameter file_sha256: The SHA-256 digest of the file.
+
+        :returns: The path to the cached object of the file.
+        """
+
+        return Path(self.cache_directory_path, "objects", file_sha256[:2], file_sha256)
+
+    @contextmanager
+    def _lock_index(
+            self
+    ) -> Iterator[None]:
+        """
+        Lock the index of the cache against the other threads and processes.
+
+        :returns: The context manager of the lock of the index of the cache.
+        """
+
+        with self._index_lock:
+            with open(
+                file=Path(self.cache_directory_path, "index.lock"),
+                mode="a"
+            ) as index_lock_file_handle:
+                if flock is not None:
+                    flock(index_lock_file_handle.fileno(), LOCK_EX)
+
+                try:
+                    yield
+
+                finally:
+                    if flock is not None:
+                        flock(index_lock_file_handle.fileno(), LOCK_UN)
+
+    def _read_index(
+            self
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the index of the cache.
+
+        :returns: The index of the cache.
+        """
+
+        try:
+            with open(
+                file=Path(self.cache_directory_path, "index.json")
+            ) as index_file_handle:
+                return load(
+                    fp=index_file_handle
+                )
+
+        except (OSError, ValueError):
+            return dict()
+
+    def _write_index(
+            self,
+            index: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """
+        Write the index of the cache.
+
+        :parameter index: The index of the cache.
+        """
+
+        with NamedTemporaryFile(
+            mode="w",
+            dir=self.cache_directory_path,
+            prefix="index.json.",
+            suffix=".tmp",
+            delete=False
+        ) as index_file_handle:
+            dump(
+                obj=index,
+                fp=index_file_handle,
+                indent=2
+            )
+
+        try:
+            Path(index_file_handle.name).replace(
+                target=Path(self.cache_directory_path, "index.json")
+            )
+
+        except OSError:
+            Path(index_file_handle.name).unlink(
+                missing_ok=True
+            )
+
+            raise
+
+    @staticmethod
+    def _link_or_copy_file(
+            source_file_path: Union[str, PathLike[str]],
+            destination_file_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Hard link a file or copy it if hard linking is not possible.
+
+        :parameter source_file_path: The path to the source file.
+        :parameter destination_file_path: The path to the destination file.
+        """
+
+        Path(destination_file_path).unlink(
+            missing_ok=True
+        )
+
+        try:
+            link(
+                src=source_file_path,
+                dst=destination_file_path
+            )
+
+        except OSError:
+            copyfile(
+                src=source_file_path,
+                dst=destination_file_path
+            )
+
+    def restore_file(
+            self,
+            file_url: str,
+            file_validators: Optional[Dict[str, Optional[str]]],
+            output_file_path: Union[str, PathLike[str]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Restore a file from the cache.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_validators: The `ETag`, `Last-Modified`, and `Content-Length` validators of the file. The value
+            `None` indicates that the most recently cached file of the URL should be restored.
+        :parameter output_file_path: The path to the output file.
+
+        :returns: The digests of the restored file. The value `None` indicates that the file was not restored from the
+            cache.
+        """
+
+        with self._lock_index():
+            index = self._read_index()
+
+            if file_validators is None:
+                file_keys = sorted(
+                    [
+                        file_key for file_key, file_entry in index.items() if file_entry["file_url"] == file_url
+                    ],
+                    key=lambda file_key: index[file_key]["cache_time"]
+                )
+
+                file_key = file_keys[-1] if len(file_keys) > 0 else None
+
+            else:
+                file_key = self.get_file_key(
+                    file_url=file_url,
+                    file_validators=file_validators
+                )
+
+            if file_key is None or file_key not in index.keys():
+                return None
+
+            object_file_path = self._get_object_file_path(
+                file_sha256=index[file_key]["sha256"]
+            )
+
+            if not object_file_path.is_file() or object_file_path.stat().st_size != index[file_key]["size"]:
+                del index[file_key]
+
+                self._write_index(
+                    index=index
+                )
+
+                return None
+
+            self._link_or_copy_file(
+                source_file_path=object_file_path,
+                destination_file_path=output_file_path
+            )
+
+            index[file_key]["access_time"] = time()
+
+            self._write_index(
+                index=index
+            )
+
+            return index[file_key].get("file_digests", {
+                "sha256": index[file_key]["sha256"],
+            })
+
+    def store_file(
+            self,
+            file_url: str,
+            file_validators: Dict[str, Optional[str]],
+            file_path: Union[str, PathLike[str]],
+            file_digests: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store a file in the cache.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_validators: The `ETag`, `Last-Modified`, and `Content-Length` validators of the file.
+        :parameter file_path: The path to the file.
+        :parameter file_digests: The digests of the file computed while it was downloaded. The value `None` indicates
+            that the SHA-256 digest should be computed from the file.
+        """
+
+        if file_digests is None or "sha256" not in file_digests.keys():
+            file_digests = {
+                "sha256": self.get_file_sha256(
+                    file_path=file_path
+                ),
+            }
+
+        file_sha256 = file_digests["sha256"]
+
+        object_file_path = self._get_object_file_path(
+            file_sha256=file_sha256
+        )
+
+        with self._lock_index():
+            if not object_file_path.is_file():
+                object_file_path.parent.mkdir(
+                    parents=True,
+                    exist_ok=True
+                )
+
+                temporary_object_file_path = object_file_path.with_suffix(".tmp")
+
+                self._link_or_copy_file(
+                    source_file_path=file_path,
+                    destination_file_path=temporary_object_file_path
+                )
+
+                temporary_object_file_path.replace(
+                    target=object_file_path
+                )
+
+            index = self._read_index()
+
+            index[
+                self.get_file_key(
+                    file_url=file_url,
+                    file_validators=file_validators
+                )
+            ] = {
+                "file_url": file_url,
+                "file_validators": file_validators,
+                "sha256": file_sha256,
+                "file_digests": file_digests,
+                "size": object_file_path.stat().st_size,
+                "cache_time": time(),
+                "access_time": time(),
+            }
+
+            self._evict_least_recently_used_files(
+                index=index,
+                stored_file_sha256=file_sha256
+            )
+
+            self._write_index(
+                index=index
+            )
+
+    def _evict_least_recently_used_files(
+            self,
+            index: Dict[str, Dict[str, Any]],
+            stored_file_sha256: str
+    ) -> None:
+        """
+        Evict the least recently used files from the cache until the size of the cache does not exceed the maximum.
+
+        :parameter index: The index of the cache.
+        :parameter stored_file_sha256: The SHA-256 digest of the file that is being stored, which is never evicted.
+        """
+
+        if self.maximum_cache_size is None:
+            return
+
+        object_access_times = dict()
+        object_sizes = dict()
+
+        for file_entry in index.values():
+            object_access_times[file_entry["sha256"]] = max(
+                object_access_times.get(file_entry["sha256"], 0.0),
+                file_entry["access_time"]
+            )
+
+            object_sizes[file_entry["sha256"]] = file_entry["size"]
+
+        cache_size = sum(object_sizes.values())
+
+        for file_sha256 in sorted(
+            object_access_times.keys(),
+            key=lambda object_sha256: object_access_times[object_sha256]
+        ):
+            if cache_size <= self.maximum_cache_size:
+                break
+
+            if file_sha256 == stored_file_sha256:
+                continue
+
+            for file_key in [
+                file_key for file_key, file_entry in index.items() if file_entry["sha256"] == file_sha256
+            ]:
+                del index[file_key]
+
+            self._get_object_file_path(
+                file_sha256=file_sha256
+            ).unlink(
+                missing_ok=True
+            )
+
+            cache_size -= object_sizes[file_sha256]
@@ -1,37 +1,345 @@
 """ The ``data_source.base.utility`` package ``download`` module. """
 
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from functools import partial
-from os import PathLike
+from hashlib import md5, sha256
+from io import RawIOBase
+from json import dump, load
+from os import PathLike, fsync
 from pathlib import Path
-from shutil import copyfileobj
-from typing import Union
+from re import fullmatch
+from threading import BoundedSemaphore, Event, Lock
+from time import sleep, time
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
-from requests import Response, get
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, RequestException
+
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 
 from tqdm.auto import tqdm
 
+from data_source.base.utility.cache import DataSourceCacheUtility, DataSourceDownloadCache
+from data_source.base.utility.rate_limiting import DataSourceTokenBucket
+
 
 class DataSourceDownloadUtility:
     """ The data source download utility class. """
 
+    _file_chunk_size = 64 * 1024
+
+    _file_synchronization_interval_size = 64 * 1024 * 1024
+
+    _minimum_file_segment_size = 8 * 1024 * 1024
+
+    _http_session = None
+
+    _http_session_lock = Lock()
+
+    _http_session_configuration = {
+        "maximum_number_of_pooled_hosts": 16,
+        "maximum_number_of_connections_per_host": 32,
+        "maximum_number_of_connection_retries": 3,
+        "timeout": (30.0, 300.0),
+    }
+
+    _http_response_cache_configuration = {
+        "is_enabled": True,
+        "cache_directory_path": None,
+        "time_to_live": 24 * 60 * 60,
+    }
+
+    _rate_limit_configuration = {
+        "maximum_number_of_bytes_per_second_per_host": None,
+        "maximum_number_of_requests_per_second_per_host": None,
+        "maximum_number_of_bytes_per_second": None,
+        "maximum_number_of_requests_per_second": None,
+    }
+
+    _rate_limit_token_buckets = dict()
+
+    _rate_limit_lock = Lock()
+
+    _download_cache = None
+
+    _download_executor = None
+
+    _download_executor_lock = Lock()
+
+    _maximum_number_of_concurrent_downloads = 4
+
+    @staticmethod
+    def configure_rate_limits(
+            maximum_number_of_bytes_per_second_per_host: Optional[float] = None,
+            maximum_number_of_requests_per_second_per_host: Optional[float] = None,
+            maximum_number_of_bytes_per_second: Optional[float] = None,
+            maximum_number_of_requests_per_second: Optional[float] = None
+    ) -> None:
+        """
+        Configure the bandwidth and request rate limits that are shared by all downloads of the data sources.
+
+        :parameter maximum_number_of_bytes_per_second_per_host: The maximum number of bytes downloaded per second from
+            each host. The value `None` indicates that the value should not be limited.
+        :parameter maximum_number_of_requests_per_second_per_host: The maximum number of HTTP requests sent per second
+            to each host. The value `None` indicates that the value should not be limited.
+        :parameter maximum_number_of_bytes_per_second: The maximum number of bytes downloaded per second from all hosts.
+            The value `None` indicates that the value should not be limited.
+        :parameter maximum_number_of_requests_per_second: The maximum number of HTTP requests sent per second to all
+            hosts. The value `None` indicates that the value should not be limited.
+        """
+
+        with DataSourceDownloadUtility._rate_limit_lock:
+            DataSourceDownloadUtility._rate_limit_configuration = {
+                "maximum_number_of_bytes_per_second_per_host": maximum_number_of_bytes_per_second_per_host,
+                "maximum_number_of_requests_per_second_per_host": maximum_number_of_requests_per_second_per_host,
+                "maximum_number_of_bytes_per_second": maximum_number_of_bytes_per_second,
+                "maximum_number_of_requests_per_second": maximum_number_of_requests_per_second,
+            }
+
+            DataSourceDownloadUtility._rate_limit_token_buckets = dict()
+
+    @staticmethod
+    def _get_rate_limit_token_bucket(
+            rate_limit_name: str,
+            host: Optional[str]
+    ) -> Optional[DataSourceTokenBucket]:
+        """
+        Get the token bucket that enforces a rate limit.
+
+        :parameter rate_limit_name: The name of the rate limit.
+        :parameter host: The host to which the rate limit applies. The value `None` indicates that the rate limit
+            applies to all hosts.
+
+        :returns: The token bucket that enforces the rate limit. The value `None` indicates that the rate limit is not
+            configured.
+        """
+
+        with DataSourceDownloadUtility._rate_limit_lock:
+            rate = DataSourceDownloadUtility._rate_limit_configuration[rate_limit_name]
+
+            if rate is None:
+                return None
+
+            if (rate_limit_name, host) not in DataSourceDownloadUtility._rate_limit_token_buckets.keys():
+                DataSourceDownloadUtility._rate_limit_token_buckets[(rate_limit_name, host)] = DataSourceTokenBucket(
+                    rate=rate
+                )
+
+            return DataSourceDownloadUtility._rate_limit_token_buckets[(rate_limit_name, host)]
+
+    @staticmethod
+    def _consume_rate_limits(
+            url: str,
+            number_of_requests: int = 0,
+            number_of_bytes: int = 0
+    ) -> None:
+        """
+        Consume the rate limits of a host, blocking until the configured rates allow the requests or bytes.
+
+        :parameter url: The URL whose host is used.
+        :parameter number_of_requests: The number of HTTP requests to be sent.
+        :parameter number_of_bytes: The number of bytes that were downloaded.
+        """
+
+        host = urlsplit(
+            url=url
+        ).netloc
+
+        for rate_limit_name, rate_limit_host, number_of_tokens in [
+            ("maximum_number_of_requests_per_second_per_host", host, number_of_requests),
+            ("maximum_number_of_requests_per_second", None, number_of_requests),
+            ("maximum_number_of_bytes_per_second_per_host", host, number_of_bytes),
+            ("maximum_number_of_bytes_per_second", None, number_of_bytes),
+        ]:
+            if number_of_tokens > 0:
+                rate_limit_token_bucket = DataSourceDownloadUtility._get_rate_limit_token_bucket(
+                    rate_limit_name=rate_limit_name,
+                    host=rate_limit_host
+                )
+
+                if rate_limit_token_bucket is not None:
+                    rate_limit_token_bucket.consume(
+                        number_of_tokens=number_of_tokens
+                    )
+
+    @staticmethod
+    def get_rate_limited_stream(
+            stream: Any,
+            url: str
+    ) -> RawIOBase:
+        """
+        Wrap the stream of an HTTP response in a reader that consumes the bandwidth rate limits of the host of the URL
+        for each read, so the data that is read directly from the stream is throttled as the downloaded files are.
+
+        :parameter stream: The stream of the HTTP response.
+        :parameter url: The URL whose host is used.
+
+        :returns: The rate-limited reader of the stream.
+        """
+
+        return _DataSourceRateLimitedStream(
+            stream=stream,
+            url=url
+        )
+
+    @staticmethod
+    def get_resumable_stream(
+            url: str,
+            maximum_number_of_retries: int = 5
+    ) -> RawIOBase:
+        """
+        Get a rate-limited reader of a file that is downloaded without writing it to the disk. If the connection is
+        interrupted, the reader resumes the download from the last byte it read, like the `download_file` method does
+        for the partial files, so the data that is read from the reader is neither lost nor repeated.
+
+        :parameter url: The URL of the file.
+        :parameter maximum_number_of_retries: The maximum number of times an interrupted download is resumed.
+
+        :returns: The resumable reader of the file.
+        """
+
+        return _DataSourceResumableStream(
+            url=url,
+            maximum_number_of_retries=maximum_number_of_retries
+        )
+
+    @staticmethod
+    def configure_download_cache(
+            cache_directory_path: Optional[Union[str, PathLike[str]]],
+            maximum_cache_size: Optional[int] = None,
+            is_revalidation_enabled: bool = True
+    ) -> None:
+        """
+        Configure the local cache of the downloaded files that is shared by all downloads of the data sources.
+
+        :parameter cache_directory_path: The path to the directory where the downloaded files should be cached. The
+            value `None` indicates that the downloaded files should not be cached.
+        :parameter maximum_cache_size: The maximum size of the cached files in bytes. The value `None` indicates that
+            the size should not be limited.
+        :parameter is_revalidation_enabled: The indicator of whether a cached file should be revalidated against the
+            validators of the file on the server before it is used.
+        """
+
+        if cache_directory_path is None:
+            DataSourceDownloadUtility._download_cache = None
+
+        else:
+            DataSourceDownloadUtility._download_cache = DataSourceDownloadCache(
+                cache_directory_path=cache_directory_path,
+                maximum_cache_size=maximum_cache_size,
+                is_revalidation_enabled=is_revalidation_enabled
+            )
+
+    @staticmethod
+    def get_download_cache() -> Optional[DataSourceDownloadCache]:
+        """
+        Get the local cache of the downloaded files that is shared by all downloads of the data sources.
+
+        :returns: The local cache of the downloaded files. The value `None` indicates that the downloaded files are not
+            cached.
+        """
+
+        return DataSourceDownloadUtility._download_cache
+
+    @staticmethod
+    def configure_http_session(
+            maximum_number_of_pooled_hosts: int = 16,
+            maximum_number_of_connections_per_host: int = 32,
+            maximum_number_of_connection_retries: int = 3,
+            timeout: Optional[Union[float, Tuple[float, float]]] = (30.0, 300.0)
+    ) -> None:
+        """
+        Configure the HTTP session that is shared by all HTTP requests of the data sources.
+
+        :parameter maximum_number_of_pooled_hosts: The maximum number of hosts for which the connections are kept alive.
+        :parameter maximum_number_of_connections_per_host: The maximum number of connections that are kept alive for
+            each host.
+        :parameter maximum_number_of_connection_retries: The maximum number of retries of failed connection attempts.
+        :parameter timeout: The default connect and read timeouts of the HTTP requests in seconds. The value `None`
+            indicates that the HTTP requests should not time out.
+        """
+
+        with DataSourceDownloadUtility._http_session_lock:
+            DataSourceDownloadUtility._http_session_configuration = {
+                "maximum_number_of_pooled_hosts": maximum_number_of_pooled_hosts,
+                "maximum_number_of_connections_per_host": maximum_number_of_connections_per_host,
+                "maximum_number_of_connection_retries": maximum_number_of_connection_retries,
+                "timeout": timeout,
+            }
+
+            if DataSourceDownloadUtility._http_session is not None:
+                DataSourceDownloadUtility._http_session.close()
+
+                DataSourceDownloadUtility._http_session = None
+
+    @staticmethod
+    def get_http_session() -> Session:
+        """
+        Get the HTTP session that is shared by all HTTP requests of the data sources.
+
+        :returns: The HTTP session that is shared by all HTTP requests of the data sources.
+        """
+
+        with DataSourceDownloadUtility._http_session_lock:
+            if DataSourceDownloadUtility._http_session is None:
+                http_adapter = HTTPAdapter(
+                    pool_connections=DataSourceDownloadUtility._http_session_configuration[
+                        "maximum_number_of_pooled_hosts"
+                    ],
+                    pool_maxsize=DataSourceDownloadUtility._http_session_configuration[
+                        "maximum_number_of_connections_per_host"
+                    ],
+                    max_retries=DataSourceDownloadUtility._http_session_configuration[
+                        "maximum_number_of_connection_retries"
+                    ]
+                )
+
+                http_session = Session()
+
+                http_session.mount(
+                    prefix="http://",
+                    adapter=http_adapter
+                )
+
+                http_session.mount(
+                    prefix="https://",
+                    adapter=http_adapter
+                )
+
+                DataSourceDownloadUtility._http_session = http_session
+
+            return DataSourceDownloadUtility._http_session
+
     @staticmethod
     def send_http_get_request(
             http_get_request_url: str,
             **kwargs
     ) -> Response:
         """
-        Send an HTTP GET request.
+        Send an HTTP GET request using the shared HTTP session.
 
         :parameter http_get_request_url: The URL of the HTTP GET request.
         :parameter kwargs: The keyword arguments for the adjustment of the following underlying functions:
-            { `requests.api.get` }.
+            { `requests.sessions.Session.get` }.
 
         :returns: The response to the HTTP GET request.
         """
 
         kwargs.pop("url", None)
 
-        http_get_request_response = get(
+        DataSourceDownloadUtility._consume_rate_limits(
+            url=http_get_request_url,
+            number_of_requests=1
+        )
+
+        kwargs.setdefault(
+            "timeout",
+            DataSourceDownloadUtility._http_session_configuration["timeout"]
+        )
+
+        http_get_request_response = DataSourceDownloadUtility.get_http_session().get(
             url=http_get_request_url,
             **kwargs
         )
@@ -41,53 +349,1610 @@ class DataSourceDownloadUtility:
         return http_get_request_response
 
     @staticmethod
-    def download_file(
-            file_url: str,
-            file_name: str,
-            output_directory_path: Union[str, PathLike[str]]
+    def configure_download_executor(
+            maximum_number_of_concurrent_downloads: int = 4
     ) -> None:
         """
-        Download a file.
+        Configure the executor that runs the asynchronous downloads of the data sources.
 
-        :parameter file_url: The URL of the file.
-        :parameter file_name: The name of the file.
-        :parameter output_directory_path: The path to the output directory where the file should be downloaded.
+        :parameter maximum_number_of_concurrent_downloads: The maximum number of data source downloads that run at the
+            same time. The remaining asynchronous downloads wait until one of the running downloads is completed.
         """
 
-        http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
-            http_get_request_url=file_url,
-            stream=True
+        with DataSourceDownloadUtility._download_executor_lock:
+            DataSourceDownloadUtility._maximum_number_of_concurrent_downloads = maximum_number_of_concurrent_downloads
+
+            if DataSourceDownloadUtility._download_executor is not None:
+                DataSourceDownloadUtility._download_executor.shutdown(
+                    wait=False
+                )
+
+                DataSourceDownloadUtility._download_executor = None
+
+    @staticmethod
+    def get_download_executor() -> ThreadPoolExecutor:
+        """
+        Get the executor that runs the asynchronous downloads of the data sources.
+
+        :returns: The executor that runs the asynchronous downloads of the data sources.
+        """
+
+        with DataSourceDownloadUtility._download_executor_lock:
+            if DataSourceDownloadUtility._download_executor is None:
+                DataSourceDownloadUtility._download_executor = ThreadPoolExecutor(
+                    max_workers=DataSourceDownloadUtility._maximum_number_of_concurrent_downloads,
+                    thread_name_prefix="data_source_download"
+                )
+
+            return DataSourceDownloadUtility._download_executor
+
+    @staticmethod
+    def configure_http_response_cache(
+            cache_directory_path: Optional[Union[str, PathLike[str]]],
+            time_to_live: Optional[float] = 24 * 60 * 60
+    ) -> None:
+        """
+        Configure the on-disk cache of the HTTP responses that are used to discover the versions of the data sources.
+
+        The cache is enabled by default in the `data_source/http_responses` directory of the `XDG_CACHE_HOME` directory
+        (_i.e._, `~/.cache` if it is not set), and the cached HTTP responses are used for 24 hours without revalidation.
+
+        :parameter cache_directory_path: The path to the directory where the HTTP responses should be cached. The value
+            `None` indicates that the HTTP responses should not be cached.
+        :parameter time_to_live: The time in seconds for which a cached HTTP response is used without revalidation. The
+            value `None` indicates that a cached HTTP response should never be revalidated.
+        """
+
+        DataSourceDownloadUtility._http_response_cache_configuration = {
+            "is_enabled": cache_directory_path is not None,
+            "cache_directory_path": None if cache_directory_path is None else Path(cache_directory_path),
+            "time_to_live": time_to_live,
+        }
+
+    @staticmethod
+    def get_http_response_text(
+            http_get_request_url: str
+    ) -> str:
+        """
+        Get the text of the response to an HTTP GET request using the on-disk cache of the HTTP responses.
+
+        A cached response is used as-is while it is younger than the configured time to live. Afterwards, it is
+        revalidated using the `If-None-Match` and `If-Modified-Since` headers, and it is used regardless of its age if
+        the server cannot be reached.
+
+        :parameter http_get_request_url: The URL of the HTTP GET request.
+
+        :returns: The text of the response to the HTTP GET request.
+        """
+
+        cache_directory_path = DataSourceCacheUtility.get_cache_directory_path(
+            cache_configuration=DataSourceDownloadUtility._http_response_cache_configuration,
+            cache_name="http_responses"
         )
 
-        http_get_request_response.raw.read = partial(
-            http_get_request_response.raw.read,
-            decode_content=True
+        time_to_live = DataSourceDownloadUtility._http_response_cache_configuration["time_to_live"]
+
+        if cache_directory_path is None:
+            return DataSourceDownloadUtility.send_http_get_request(
+                http_get_request_url=http_get_request_url
+            ).text
+
+        cache_entry_file_path = Path(cache_directory_path, "{url_hash:s}.json".format(
+            url_hash=sha256(
+                http_get_request_url.encode(
+                    encoding="utf-8"
+                )
+            ).hexdigest()
+        ))
+
+        try:
+            with open(
+                file=cache_entry_file_path
+            ) as cache_entry_file_handle:
+                cache_entry = load(
+                    fp=cache_entry_file_handle
+                )
+
+        except (OSError, ValueError):
+            cache_entry = None
+
+        if cache_entry is not None and (time_to_live is None or time() - cache_entry["fetch_time"] < time_to_live):
+            return cache_entry["text"]
+
+        http_get_request_headers = dict()
+
+        if cache_entry is not None:
+            if cache_entry["etag"] is not None:
+                http_get_request_headers["If-None-Match"] = cache_entry["etag"]
+
+            if cache_entry["last_modified"] is not None:
+                http_get_request_headers["If-Modified-Since"] = cache_entry["last_modified"]
+
+        try:
+            http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+                http_get_request_url=http_get_request_url,
+                headers=http_get_request_headers
+            )
+
+        except (RequestException, ConnectionError, TimeoutError):
+            if cache_entry is not None:
+                return cache_entry["text"]
+
+            raise
+
+        if http_get_request_response.status_code == 304 and cache_entry is not None:
+            cache_entry["fetch_time"] = time()
+
+        else:
+            cache_entry = {
+                "url": http_get_request_url,
+                "etag": http_get_request_response.headers.get("ETag", None),
+                "last_modified": http_get_request_response.headers.get("Last-Modified", None),
+                "fetch_time": time(),
+                "text": http_get_request_response.text,
+            }
+
+        try:
+            cache_entry_file_path.parent.mkdir(
+                parents=True,
+                exist_ok=True
+            )
+
+            temporary_cache_entry_file_path = cache_entry_file_path.with_suffix(".tmp")
+
+            with open(
+                file=temporary_cache_entry_file_path,
+                mode="w"
+            ) as cache_entry_file_handle:
+                dump(
+                    obj=cache_entry,
+                    fp=cache_entry_file_handle
+                )
+
+            temporary_cache_entry_file_path.replace(
+                target=cache_entry_file_path
+            )
+
+        except OSError:
+            pass
+
+        return cache_entry["text"]
+
+    @staticmethod
+    def _get_file_hashes(
+            is_md5_digest_computed: bool
+    ) -> Dict[str, Any]:
+        """
+        Get the hash objects that compute the digests of a file.
+
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digest of the file should be computed.
+
+        :returns: The hash objects that compute the digests of the file.
+        """
+
+        file_hashes = {
+            "sha256": sha256(),
+        }
+
+        if is_md5_digest_computed:
+            file_hashes["md5"] = md5()
+
+        return file_hashes
+
+    @staticmethod
+    def _compute_file_digests(
+            file_path: Union[str, PathLike[str]],
+            is_md5_digest_computed: bool
+    ) -> Dict[str, str]:
+        """
+        Compute the digests of a file by reading the file.
+
+        :parameter file_path: The path to the file.
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digest of the file should be computed.
+
+        :returns: The digests of the file.
+        """
+
+        file_hashes = DataSourceDownloadUtility._get_file_hashes(
+            is_md5_digest_computed=is_md5_digest_computed
         )
 
+        with open(
+            file=file_path,
+            mode="rb"
+        ) as file_handle:
+            while True:
+                file_chunk = file_handle.read(
+                    DataSourceDownloadUtility._file_chunk_size * 16
+                )
+
+                if not file_chunk:
+                    break
+
+                for file_hash in file_hashes.values():
+                    file_hash.update(file_chunk)
+
+        return {
+            file_hash_name: file_hash.hexdigest() for file_hash_name, file_hash in file_hashes.items()
+        }
+
+    @staticmethod
+    def get_file_digest_manifest_path(
+            file_path: Union[str, PathLike[str]]
+    ) -> Path:
+        """
+        Get the path to the digest manifest of a downloaded file.
+
+        :parameter file_path: The path to the downloaded file.
+
+        :returns: The path to the digest manifest of the downloaded file.
+        """
+
+        return Path(file_path).with_name("{file_name:s}.digests.json".format(
+            file_name=Path(file_path).name
+        ))
+
+    @staticmethod
+    def read_file_digest_manifest(
+            file_path: Union[str, PathLike[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the digest manifest of a downloaded file, regardless of whether the file has been modified since.
+
+        :parameter file_path: The path to the downloaded file.
+
+        :returns: The URL, size, and digests of the file when it was downloaded. The value `None` indicates that the
+            digest manifest is not available.
+        """
+
         try:
-            file_size = http_get_request_response.headers.get("Content-Length", None)
+            with open(
+                file=DataSourceDownloadUtility.get_file_digest_manifest_path(
+                    file_path=file_path
+                )
+            ) as file_digest_manifest_file_handle:
+                file_digest_manifest = load(
+                    fp=file_digest_manifest_file_handle
+                )
 
-            if file_size is not None:
-                file_size = float(file_size)
+            if not isinstance(file_digest_manifest, dict) or not isinstance(file_digest_manifest["file_size"], int):
+                return None
 
-        except:
-            file_size = None
+            return file_digest_manifest
 
-        tqdm_description = "Downloading the {file_name:s} file".format(
-            file_name=file_name
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def get_file_digests(
+            file_path: Union[str, PathLike[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the digests of a downloaded file from the digest manifest of the file.
+
+        :parameter file_path: The path to the downloaded file.
+
+        :returns: The URL, size, and digests of the downloaded file. The value `None` indicates that the digest manifest
+            is not available or that the file has been modified since it was downloaded.
+        """
+
+        file_digest_manifest = DataSourceDownloadUtility.read_file_digest_manifest(
+            file_path=file_path
         )
 
-        with tqdm.wrapattr(
-            stream=http_get_request_response.raw,
-            method="read",
-            total=file_size,
-            desc=tqdm_description,
-            ncols=len(tqdm_description) + 50
-        ) as file_download_stream_handle:
-            with Path(output_directory_path, file_name).open(
-                mode="wb"
-            ) as destination_file_handle:
-                copyfileobj(
-                    fsrc=file_download_stream_handle,
-                    fdst=destination_file_handle
+        try:
+            if file_digest_manifest is None or file_digest_manifest["file_size"] != Path(file_path).stat().st_size:
+                return None
+
+        except OSError:
+            return None
+
+        return file_digest_manifest
+
+    @staticmethod
+    def _write_file_digest_manifest(
+            file_path: Union[str, PathLike[str]],
+            file_url: str,
+            file_digests: Dict[str, str]
+    ) -> None:
+        """
+        Write the digest manifest of a downloaded file.
+
+        :parameter file_path: The path to the downloaded file.
+        :parameter file_url: The URL of the downloaded file.
+        :parameter file_digests: The digests of the downloaded file.
+        """
+
+        with open(
+            file=DataSourceDownloadUtility.get_file_digest_manifest_path(
+                file_path=file_path
+            ),
+            mode="w"
+        ) as file_digest_manifest_file_handle:
+            dump(
+                obj={
+                    "file_url": file_url,
+                    "file_size": Path(file_path).stat().st_size,
+                    **file_digests,
+                },
+                fp=file_digest_manifest_file_handle,
+                indent=2
+            )
+
+    @staticmethod
+    def _read_partial_file_metadata(
+            partial_file_metadata_path: Union[str, PathLike[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the metadata of a partially downloaded file.
+
+        :parameter partial_file_metadata_path: The path to the metadata file of the partially downloaded file.
+
+        :returns: The metadata of the partially downloaded file. The value `None` indicates that the metadata is not
+            available.
+        """
+
+        try:
+            with open(
+                file=partial_file_metadata_path
+            ) as partial_file_metadata_file_handle:
+                return load(
+                    fp=partial_file_metadata_file_handle
                 )
+
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_partial_file_metadata(
+            partial_file_metadata_path: Union[str, PathLike[str]],
+            partial_file_metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Write the metadata of a partially downloaded file.
+
+        :parameter partial_file_metadata_path: The path to the metadata file of the partially downloaded file.
+        :parameter partial_file_metadata: The metadata of the partially downloaded file.
+        """
+
+        with open(
+            file=partial_file_metadata_path,
+            mode="w"
+        ) as partial_file_metadata_file_handle:
+            dump(
+                obj=partial_file_metadata,
+                fp=partial_file_metadata_file_handle
+            )
+
+            partial_file_metadata_file_handle.flush()
+
+            fsync(
+                partial_file_metadata_file_handle.fileno()
+            )
+
+    @staticmethod
+    def _raise_if_download_is_cancelled(
+            file_url: str,
+            download_cancellation_event: Optional[Event]
+    ) -> None:
+        """
+        Raise an exception if the download of a file is cancelled.
+
+        :parameter file_url: The URL of the file.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+        """
+
+        if download_cancellation_event is not None and download_cancellation_event.is_set():
+            raise CancelledError(
+                "The download of the file '{file_url:s}' is cancelled.".format(
+                    file_url=file_url
+                )
+            )
+
+    @staticmethod
+    def _download_file_part(
+            file_url: str,
+            file_name: str,
+            partial_file_path: Path,
+            partial_file_metadata_path: Path,
+            is_md5_digest_computed: bool,
+            download_cancellation_event: Optional[Event] = None
+    ) -> Dict[str, str]:
+        """
+        Download a file into a partial file, resuming from the last durably written byte if the server allows it.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter partial_file_path: The path to the partial file.
+        :parameter partial_file_metadata_path: The path to the metadata file of the partial file.
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digest of the file should be computed.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+
+        :returns: The digests of the file computed from the download stream.
+        """
+
+        partial_file_metadata = DataSourceDownloadUtility._read_partial_file_metadata(
+            partial_file_metadata_path=partial_file_metadata_path
+        )
+
+        http_get_request_headers = {
+            "Accept-Encoding": "identity",
+        }
+
+        if partial_file_metadata is not None and partial_file_metadata.get("file_url") == file_url and \
+                partial_file_path.is_file():
+            resume_position = min(partial_file_metadata["number_of_durable_bytes"], partial_file_path.stat().st_size)
+
+            if resume_position > 0:
+                http_get_request_headers["Range"] = "bytes={resume_position:d}-".format(
+                    resume_position=resume_position
+                )
+
+                http_get_request_headers["If-Range"] = partial_file_metadata["validator"]
+
+        else:
+            resume_position = 0
+
+        http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_url=file_url,
+            headers=http_get_request_headers,
+            stream=True
+        )
+
+        http_get_request_response.raw.read = partial(
+            http_get_request_response.raw.read,
+            decode_content=True
+        )
+
+        if http_get_request_response.status_code != 206 or not http_get_request_response.headers.get(
+            "Content-Range",
+            ""
+        ).startswith("bytes {resume_position:d}-".format(
+            resume_position=resume_position
+        )):
+            resume_position = 0
+
+        validator = http_get_request_response.headers.get(
+            "ETag",
+            http_get_request_response.headers.get("Last-Modified", None)
+        )
+
+        is_resumable = (
+            http_get_request_response.headers.get("Accept-Ranges", "none").lower() == "bytes" and
+            http_get_request_response.headers.get("Content-Encoding", "identity").lower() == "identity" and
+            validator is not None
+        )
+
+        if is_resumable:
+            partial_file_metadata = {
+                "file_url": file_url,
+                "validator": validator,
+                "number_of_durable_bytes": resume_position,
+            }
+
+            DataSourceDownloadUtility._write_partial_file_metadata(
+                partial_file_metadata_path=partial_file_metadata_path,
+                partial_file_metadata=partial_file_metadata
+            )
+
+        else:
+            partial_file_metadata_path.unlink(
+                missing_ok=True
+            )
+
+        try:
+            file_size = http_get_request_response.headers.get("Content-Length", None)
+
+            if file_size is not None:
+                file_size = float(file_size) + resume_position
+
+        except:
+            file_size = None
+
+        tqdm_description = "Downloading the {file_name:s} file".format(
+            file_name=file_name
+        )
+
+        with tqdm.wrapattr(
+            stream=DataSourceDownloadUtility.get_rate_limited_stream(
+                stream=http_get_request_response.raw,
+                url=file_url
+            ),
+            method="read",
+            total=file_size,
+            initial=resume_position,
+            desc=tqdm_description,
+            ncols=len(tqdm_description) + 50
+        ) as file_download_stream_handle:
+            with partial_file_path.open(
+                mode="r+b" if resume_position > 0 else "wb"
+            ) as destination_file_handle:
+                file_hashes = DataSourceDownloadUtility._get_file_hashes(
+                    is_md5_digest_computed=is_md5_digest_computed
+                )
+
+                while destination_file_handle.tell() < resume_position:
+                    file_chunk = destination_file_handle.read(
+                        min(
+                            DataSourceDownloadUtility._file_chunk_size * 16,
+                            resume_position - destination_file_handle.tell()
+                        )
+                    )
+
+                    for file_hash in file_hashes.values():
+                        file_hash.update(file_chunk)
+
+                destination_file_handle.seek(resume_position)
+                destination_file_handle.truncate()
+
+                number_of_written_bytes = resume_position
+                number_of_durable_bytes = resume_position
+
+                try:
+                    while True:
+                        DataSourceDownloadUtility._raise_if_download_is_cancelled(
+                            file_url=file_url,
+                            download_cancellation_event=download_cancellation_event
+                        )
+
+                        file_chunk = file_download_stream_handle.read(
+                            DataSourceDownloadUtility._file_chunk_size
+                        )
+
+                        if not file_chunk:
+                            break
+
+                        destination_file_handle.write(file_chunk)
+
+                        for file_hash in file_hashes.values():
+                            file_hash.update(file_chunk)
+
+                        number_of_written_bytes += len(file_chunk)
+
+                        if is_resumable and number_of_written_bytes - number_of_durable_bytes >= \
+                                DataSourceDownloadUtility._file_synchronization_interval_size:
+                            destination_file_handle.flush()
+
+                            fsync(
+                                destination_file_handle.fileno()
+                            )
+
+                            number_of_durable_bytes = number_of_written_bytes
+                            partial_file_metadata["number_of_durable_bytes"] = number_of_durable_bytes
+
+                            DataSourceDownloadUtility._write_partial_file_metadata(
+                                partial_file_metadata_path=partial_file_metadata_path,
+                                partial_file_metadata=partial_file_metadata
+                            )
+
+                finally:
+                    destination_file_handle.flush()
+
+                    fsync(
+                        destination_file_handle.fileno()
+                    )
+
+                    if is_resumable:
+                        partial_file_metadata["number_of_durable_bytes"] = number_of_written_bytes
+
+                        DataSourceDownloadUtility._write_partial_file_metadata(
+                            partial_file_metadata_path=partial_file_metadata_path,
+                            partial_file_metadata=partial_file_metadata
+                        )
+
+        return {
+            file_hash_name: file_hash.hexdigest() for file_hash_name, file_hash in file_hashes.items()
+        }
+
+    @staticmethod
+    def _is_download_exception_retryable(
+            exception_handle: Exception
+    ) -> bool:
+        """
+        Check whether an exception that interrupted a download is transient and the download should be retried.
+
+        :parameter exception_handle: The exception that interrupted the download.
+
+        :returns: The indicator of whether the download should be retried.
+        """
+
+        if isinstance(exception_handle, HTTPError) and exception_handle.response is not None:
+            return exception_handle.response.status_code == 416 or exception_handle.response.status_code >= 500
+
+        return isinstance(exception_handle, (RequestException, ConnectionError, TimeoutError, Urllib3HTTPError))
+
+    @staticmethod
+    def probe_file(
+            file_url: str
+    ) -> Dict[str, Any]:
+        """
+        Probe a file with a single HTTP range request for its first byte, without downloading the content of the file.
+        The result is used both to decide how the file is downloaded and to estimate the size of the file.
+
+        :parameter file_url: The URL of the file.
+
+        :returns: The URL of the file after redirection, the size of the file, the indicator of whether the server
+            supports HTTP range requests for the file, and the `ETag`, `Last-Modified`, and `Content-Length` validators
+            of the file. The value `None` indicates that the size of the file is unknown.
+        """
+
+        http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_url=file_url,
+            headers={
+                "Accept-Encoding": "identity",
+                "Range": "bytes=0-0",
+            },
+            stream=True
+        )
+
+        http_get_request_response.close()
+
+        content_range_match = fullmatch(
+            pattern=r"bytes\s+0-0/(\d+)",
+            string=http_get_request_response.headers.get("Content-Range", "").strip()
+        )
+
+        is_range_supported = http_get_request_response.status_code == 206 and content_range_match is not None
+
+        if is_range_supported:
+            file_size = content_range_match.group(1)
+
+        elif http_get_request_response.status_code == 200:
+            file_size = http_get_request_response.headers.get("Content-Length", None)
+
+        else:
+            file_size = None
+
+        return {
+            "file_url": http_get_request_response.url,
+            "file_size": None if file_size is None else int(file_size),
+            "is_range_supported": is_range_supported,
+            "file_validators": {
+                "ETag": http_get_request_response.headers.get("ETag", None),
+                "Last-Modified": http_get_request_response.headers.get("Last-Modified", None),
+                "Content-Length": file_size,
+            },
+        }
+
+    @staticmethod
+    def _read_segment_file_metadata(
+            segment_file_metadata_path: Path,
+            file_url: str,
+            file_size: int,
+            file_validator: Optional[str],
+            partial_file_path: Path
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the metadata of the segments of a partially downloaded file if the segments can be resumed.
+
+        :parameter segment_file_metadata_path: The path to the metadata file of the segments of the partial file.
+        :parameter file_url: The URL of the file.
+        :parameter file_size: The size of the file.
+        :parameter file_validator: The validator of the file.
+        :parameter partial_file_path: The path to the partial file.
+
+        :returns: The metadata of the segments of the partially downloaded file. The value `None` indicates that the
+            metadata is not available or that the segments cannot be resumed, for example, because the file has changed.
+        """
+
+        segment_file_metadata = DataSourceDownloadUtility._read_partial_file_metadata(
+            partial_file_metadata_path=segment_file_metadata_path
+        )
+
+        try:
+            if file_validator is None or segment_file_metadata is None or \
+                    segment_file_metadata["file_url"] != file_url or \
+                    segment_file_metadata["file_size"] != file_size or \
+                    segment_file_metadata["validator"] != file_validator or \
+                    not partial_file_path.is_file() or partial_file_path.stat().st_size != file_size:
+                return None
+
+            for segment in segment_file_metadata["segments"]:
+                if not segment["start_position"] <= segment["durable_position"] <= segment["end_position"] + 1:
+                    return None
+
+        except (KeyError, TypeError):
+            return None
+
+        return segment_file_metadata
+
+    @staticmethod
+    def _update_segment_file_metadata(
+            segment_file_metadata: Optional[Dict[str, Any]],
+            segment_file_metadata_path: Path,
+            segment_file_metadata_lock: Lock,
+            segment_index: int,
+            durable_position: int
+    ) -> None:
+        """
+        Update the durably written position of a segment in the metadata of the segments of a partial file.
+
+        :parameter segment_file_metadata: The metadata of the segments of the partial file. The value `None` indicates
+            that the segments cannot be resumed and that the metadata should not be written.
+        :parameter segment_file_metadata_path: The path to the metadata file of the segments of the partial file.
+        :parameter segment_file_metadata_lock: The lock of the metadata of the segments of the partial file.
+        :parameter segment_index: The index of the segment.
+        :parameter durable_position: The position of the first byte of the segment that is not durably written.
+        """
+
+        if segment_file_metadata is None:
+            return
+
+        with segment_file_metadata_lock:
+            segment_file_metadata["segments"][segment_index]["durable_position"] = durable_position
+
+            DataSourceDownloadUtility._write_partial_file_metadata(
+                partial_file_metadata_path=segment_file_metadata_path,
+                partial_file_metadata=segment_file_metadata
+            )
+
+    @staticmethod
+    def _download_file_segment(
+            file_url: str,
+            file_validator: Optional[str],
+            partial_file_path: Path,
+            segment_start_position: int,
+            segment_end_position: int,
+            progress_bar: tqdm,
+            maximum_number_of_retries: int,
+            segment_index: int = 0,
+            segment_file_metadata: Optional[Dict[str, Any]] = None,
+            segment_file_metadata_path: Optional[Path] = None,
+            segment_file_metadata_lock: Optional[Lock] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> bool:
+        """
+        Download a byte range of a file into the same byte range of a preallocated partial file.
+
+        If the connection drops or is closed before the end of the byte range, the download of the segment is resumed
+        from the last received byte, and each such interruption counts as a retry.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_validator: The validator of the file.
+        :parameter partial_file_path: The path to the preallocated partial file.
+        :parameter segment_start_position: The position of the first byte of the segment that should be downloaded.
+        :parameter segment_end_position: The position of the last byte of the segment.
+        :parameter progress_bar: The progress bar of the download.
+        :parameter maximum_number_of_retries: The maximum number of times an interrupted segment download is resumed.
+        :parameter segment_index: The index of the segment.
+        :parameter segment_file_metadata: The metadata of the segments of the partial file in which the durably written
+            position of the segment is recorded. The value `None` indicates that the position should not be recorded.
+        :parameter segment_file_metadata_path: The path to the metadata file of the segments of the partial file.
+        :parameter segment_file_metadata_lock: The lock of the metadata of the segments of the partial file.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+
+        :returns: The indicator of whether the segment was downloaded. The value `False` indicates that the server
+            stopped honouring the HTTP range requests, for example, because the file has changed.
+        """
+
+        position = segment_start_position
+        durable_position = segment_start_position
+        retry_index = 0
+
+        with partial_file_path.open(
+            mode="r+b"
+        ) as destination_file_handle:
+            try:
+                while position <= segment_end_position:
+                    http_get_request_headers = {
+                        "Accept-Encoding": "identity",
+                        "Range": "bytes={position:d}-{segment_end_position:d}".format(
+                            position=position,
+                            segment_end_position=segment_end_position
+                        ),
+                    }
+
+                    if file_validator is not None:
+                        http_get_request_headers["If-Range"] = file_validator
+
+                    try:
+                        http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+                            http_get_request_url=file_url,
+                            headers=http_get_request_headers,
+                            stream=True
+                        )
+
+                        if http_get_request_response.status_code != 206:
+                            http_get_request_response.close()
+
+                            return False
+
+                        destination_file_handle.seek(position)
+
+                        file_download_stream_handle = DataSourceDownloadUtility.get_rate_limited_stream(
+                            stream=http_get_request_response.raw,
+                            url=file_url
+                        )
+
+                        while position <= segment_end_position:
+                            DataSourceDownloadUtility._raise_if_download_is_cancelled(
+                                file_url=file_url,
+                                download_cancellation_event=download_cancellation_event
+                            )
+
+                            file_chunk = file_download_stream_handle.read(
+                                min(DataSourceDownloadUtility._file_chunk_size, segment_end_position - position + 1)
+                            )
+
+                            if not file_chunk:
+                                break
+
+                            destination_file_handle.write(file_chunk)
+
+                            position += len(file_chunk)
+
+                            progress_bar.update(len(file_chunk))
+
+                            if position - durable_position >= \
+                                    DataSourceDownloadUtility._file_synchronization_interval_size:
+                                destination_file_handle.flush()
+
+                                fsync(
+                                    destination_file_handle.fileno()
+                                )
+
+                                durable_position = position
+
+                                DataSourceDownloadUtility._update_segment_file_metadata(
+                                    segment_file_metadata=segment_file_metadata,
+                                    segment_file_metadata_path=segment_file_metadata_path,
+                                    segment_file_metadata_lock=segment_file_metadata_lock,
+                                    segment_index=segment_index,
+                                    durable_position=durable_position
+                                )
+
+                        http_get_request_response.close()
+
+                        if position <= segment_end_position:
+                            raise ConnectionError(
+                                "The connection was closed before the bytes {position:d}-{end_position:d} of the file "
+                                "'{file_url:s}' were received.".format(
+                                    position=position,
+                                    end_position=segment_end_position,
+                                    file_url=file_url
+                                )
+                            )
+
+                    except (RequestException, ConnectionError, TimeoutError, Urllib3HTTPError) as exception_handle:
+                        if not DataSourceDownloadUtility._is_download_exception_retryable(
+                            exception_handle=exception_handle
+                        ) or retry_index >= maximum_number_of_retries:
+                            raise
+
+                        retry_index += 1
+
+                        sleep(min(2 ** retry_index, 60))
+
+            finally:
+                if position > durable_position:
+                    destination_file_handle.flush()
+
+                    fsync(
+                        destination_file_handle.fileno()
+                    )
+
+                    DataSourceDownloadUtility._update_segment_file_metadata(
+                        segment_file_metadata=segment_file_metadata,
+                        segment_file_metadata_path=segment_file_metadata_path,
+                        segment_file_metadata_lock=segment_file_metadata_lock,
+                        segment_index=segment_index,
+                        durable_position=position
+                    )
+
+        return True
+
+    @staticmethod
+    def _download_file_in_segments(
+            file_url: str,
+            file_name: str,
+            partial_file_path: Path,
+            segment_file_metadata_path: Path,
+            number_of_segments: int,
+            maximum_number_of_retries: int,
+            file_probe: Optional[Dict[str, Any]] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> bool:
+        """
+        Download a file by fetching byte ranges of the file concurrently into a preallocated sparse partial file.
+
+        The durably written position of each segment is recorded in a metadata file next to the partial file, so an
+        interrupted download is resumed by the next call from the recorded positions as long as the file is unchanged.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter partial_file_path: The path to the partial file.
+        :parameter segment_file_metadata_path: The path to the metadata file of the segments of the partial file.
+        :parameter number_of_segments: The number of byte ranges that are downloaded concurrently.
+        :parameter maximum_number_of_retries: The maximum number of times an interrupted segment download is resumed.
+        :parameter file_probe: The result of the probe of the file. The value `None` indicates that the file should be
+            probed.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+
+        :returns: The indicator of whether the file was downloaded. The value `False` indicates that the file should be
+            downloaded as a single stream instead.
+        """
+
+        if file_probe is None:
+            file_probe = DataSourceDownloadUtility.probe_file(
+                file_url=file_url
+            )
+
+        if not file_probe["is_range_supported"]:
+            segment_file_metadata_path.unlink(
+                missing_ok=True
+            )
+
+            return False
+
+        redirected_file_url = file_probe["file_url"]
+        file_size = file_probe["file_size"]
+        file_validator = file_probe["file_validators"]["ETag"] or file_probe["file_validators"]["Last-Modified"]
+
+        segment_file_metadata = DataSourceDownloadUtility._read_segment_file_metadata(
+            segment_file_metadata_path=segment_file_metadata_path,
+            file_url=file_url,
+            file_size=file_size,
+            file_validator=file_validator,
+            partial_file_path=partial_file_path
+        )
+
+        if segment_file_metadata is None:
+            number_of_segments = min(
+                number_of_segments,
+                file_size // DataSourceDownloadUtility._minimum_file_segment_size
+            )
+
+            if number_of_segments < 2:
+                segment_file_metadata_path.unlink(
+                    missing_ok=True
+                )
+
+                return False
+
+            segment_start_positions = [
+                segment_index * file_size // number_of_segments for segment_index in range(number_of_segments)
+            ]
+
+            segment_end_positions = [
+                segment_start_position - 1 for segment_start_position in segment_start_positions[1:]
+            ] + [file_size - 1, ]
+
+            with partial_file_path.open(
+                mode="wb"
+            ) as destination_file_handle:
+                destination_file_handle.truncate(file_size)
+
+            segment_file_metadata = {
+                "file_url": file_url,
+                "file_size": file_size,
+                "validator": file_validator,
+                "segments": [
+                    {
+                        "start_position": segment_start_position,
+                        "end_position": segment_end_position,
+                        "durable_position": segment_start_position,
+                    } for segment_start_position, segment_end_position in zip(
+                        segment_start_positions,
+                        segment_end_positions
+                    )
+                ],
+            }
+
+            if file_validator is None:
+                segment_file_metadata_path.unlink(
+                    missing_ok=True
+                )
+
+            else:
+                DataSourceDownloadUtility._write_partial_file_metadata(
+                    partial_file_metadata_path=segment_file_metadata_path,
+                    partial_file_metadata=segment_file_metadata
+                )
+
+        segments = [
+            dict(segment) for segment in segment_file_metadata["segments"]
+        ]
+
+        tqdm_description = "Downloading the {file_name:s} file ({number_of_segments:d} segments)".format(
+            file_name=file_name,
+            number_of_segments=len(segments)
+        )
+
+        with tqdm(
+            total=file_size,
+            initial=sum([
+                segment["durable_position"] - segment["start_position"] for segment in segments
+            ]),
+            desc=tqdm_description,
+            ncols=len(tqdm_description) + 50,
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024
+        ) as progress_bar:
+            segment_file_metadata_lock = Lock()
+
+            with ThreadPoolExecutor(
+                max_workers=len(segments)
+            ) as thread_pool_executor:
+                futures = [
+                    thread_pool_executor.submit(
+                        DataSourceDownloadUtility._download_file_segment,
+                        file_url=redirected_file_url,
+                        file_validator=file_validator,
+                        partial_file_path=partial_file_path,
+                        segment_start_position=segment["durable_position"],
+                        segment_end_position=segment["end_position"],
+                        progress_bar=progress_bar,
+                        maximum_number_of_retries=maximum_number_of_retries,
+                        segment_index=segment_index,
+                        segment_file_metadata=None if file_validator is None else segment_file_metadata,
+                        segment_file_metadata_path=segment_file_metadata_path,
+                        segment_file_metadata_lock=segment_file_metadata_lock,
+                        download_cancellation_event=download_cancellation_event
+                    ) for segment_index, segment in enumerate(segments)
+                ]
+
+                try:
+                    are_segments_downloaded = [
+                        future.result() for future in futures
+                    ]
+
+                except:
+                    for future in futures:
+                        future.cancel()
+
+                    raise
+
+        if not all(are_segments_downloaded):
+            segment_file_metadata_path.unlink(
+                missing_ok=True
+            )
+
+            return False
+
+        return True
+
+    @staticmethod
+    def download_file(
+            file_url: str,
+            file_name: str,
+            output_directory_path: Union[str, PathLike[str]],
+            maximum_number_of_retries: int = 5,
+            number_of_segments: int = 1,
+            is_md5_digest_computed: bool = False,
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> None:
+        """
+        Download a file.
+
+        The file is downloaded into a `*.part` file that is renamed once the download is completed. If the connection
+        drops and the server supports HTTP range requests, the download is resumed from the last durably written byte.
+        If the download cache is configured, the file is restored from the cache if possible and stored in the cache
+        otherwise. The digests of the file are computed from the download stream and written to a `*.digests.json`
+        manifest next to the file.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter output_directory_path: The path to the output directory where the file should be downloaded.
+        :parameter maximum_number_of_retries: The maximum number of times an interrupted download is resumed.
+        :parameter number_of_segments: The number of byte ranges of the file that are downloaded concurrently. The file
+            is downloaded as a single stream if the value is `1` or if the server does not support HTTP range requests.
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digest of the file should be computed in
+            addition to the SHA-256 digest.
+        :parameter file_download_recorder: The list to which the URL and name of the file are appended instead of
+            downloading the file. The value `None` indicates that the file should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. Once it is set, the
+            download stops after the chunk that is being received, and the partial file is kept to be resumed later.
+            The value `None` indicates that the download cannot be cancelled.
+        """
+
+        if file_download_recorder is not None:
+            file_download_recorder.append((
+                file_url,
+                file_name,
+            ))
+
+            return
+
+        DataSourceDownloadUtility._raise_if_download_is_cancelled(
+            file_url=file_url,
+            download_cancellation_event=download_cancellation_event
+        )
+
+        file_path = Path(output_directory_path, file_name)
+
+        download_cache = DataSourceDownloadUtility.get_download_cache()
+
+        file_probe = None
+
+        if download_cache is not None:
+            file_digests = None
+
+            if not download_cache.is_revalidation_enabled:
+                file_digests = download_cache.restore_file(
+                    file_url=file_url,
+                    file_validators=None,
+                    output_file_path=file_path
+                )
+
+            if file_digests is None:
+                file_probe = DataSourceDownloadUtility.probe_file(
+                    file_url=file_url
+                )
+
+                file_validators = file_probe["file_validators"]
+
+                is_file_cacheable = file_validators["ETag"] is not None or file_validators["Last-Modified"] is not None
+
+                if is_file_cacheable:
+                    file_digests = download_cache.restore_file(
+                        file_url=file_url,
+                        file_validators=file_validators,
+                        output_file_path=file_path
+                    )
+
+            if file_digests is not None:
+                if is_md5_digest_computed and "md5" not in file_digests.keys():
+                    file_digests = DataSourceDownloadUtility._compute_file_digests(
+                        file_path=file_path,
+                        is_md5_digest_computed=is_md5_digest_computed
+                    )
+
+                DataSourceDownloadUtility._write_file_digest_manifest(
+                    file_path=file_path,
+                    file_url=file_url,
+                    file_digests=file_digests
+                )
+
+                return
+
+        else:
+            file_validators = None
+
+            is_file_cacheable = False
+
+        partial_file_path = Path(output_directory_path, "{file_name:s}.part".format(
+            file_name=file_name
+        ))
+
+        partial_file_metadata_path = Path(output_directory_path, "{file_name:s}.part.json".format(
+            file_name=file_name
+        ))
+
+        segment_file_metadata_path = Path(output_directory_path, "{file_name:s}.part.segments.json".format(
+            file_name=file_name
+        ))
+
+        if number_of_segments > 1:
+            is_file_downloaded = DataSourceDownloadUtility._download_file_in_segments(
+                file_url=file_url,
+                file_name=file_name,
+                partial_file_path=partial_file_path,
+                segment_file_metadata_path=segment_file_metadata_path,
+                number_of_segments=number_of_segments,
+                maximum_number_of_retries=maximum_number_of_retries,
+                file_probe=file_probe,
+                download_cancellation_event=download_cancellation_event
+            )
+
+        else:
+            is_file_downloaded = False
+
+        if is_file_downloaded:
+            file_digests = DataSourceDownloadUtility._compute_file_digests(
+                file_path=partial_file_path,
+                is_md5_digest_computed=is_md5_digest_computed
+            )
+
+        retry_index = 0
+
+        while not is_file_downloaded:
+            try:
+                file_digests = DataSourceDownloadUtility._download_file_part(
+                    file_url=file_url,
+                    file_name=file_name,
+                    partial_file_path=partial_file_path,
+                    partial_file_metadata_path=partial_file_metadata_path,
+                    is_md5_digest_computed=is_md5_digest_computed,
+                    download_cancellation_event=download_cancellation_event
+                )
+
+                is_file_downloaded = True
+
+            except (RequestException, ConnectionError, TimeoutError, Urllib3HTTPError) as exception_handle:
+                if not DataSourceDownloadUtility._is_download_exception_retryable(
+                    exception_handle=exception_handle
+                ) or retry_index >= maximum_number_of_retries:
+                    raise
+
+                if isinstance(exception_handle, HTTPError) and exception_handle.response.status_code == 416:
+                    partial_file_metadata_path.unlink(
+                        missing_ok=True
+                    )
+
+                retry_index += 1
+
+                sleep(min(2 ** retry_index, 60))
+
+                DataSourceDownloadUtility._raise_if_download_is_cancelled(
+                    file_url=file_url,
+                    download_cancellation_event=download_cancellation_event
+                )
+
+        partial_file_path.replace(
+            target=file_path
+        )
+
+        partial_file_metadata_path.unlink(
+            missing_ok=True
+        )
+
+        segment_file_metadata_path.unlink(
+            missing_ok=True
+        )
+
+        DataSourceDownloadUtility._write_file_digest_manifest(
+            file_path=file_path,
+            file_url=file_url,
+            file_digests=file_digests
+        )
+
+        if is_file_cacheable:
+            try:
+                download_cache.store_file(
+                    file_url=file_url,
+                    file_validators=file_validators,
+                    file_path=file_path,
+                    file_digests=file_digests
+                )
+
+            except OSError:
+                pass
+
+    @staticmethod
+    def _download_file_with_host_semaphore(
+            file_url: str,
+            file_name: str,
+            output_directory_path: Union[str, PathLike[str]],
+            host_semaphore: BoundedSemaphore,
+            number_of_segments: int,
+            is_md5_digest_computed: bool,
+            download_cancellation_event: Optional[Event] = None
+    ) -> None:
+        """
+        Download a file while holding the semaphore of the host of the file.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+        :parameter output_directory_path: The path to the output directory where the file should be downloaded.
+        :parameter host_semaphore: The semaphore that limits the number of concurrent downloads from the host.
+        :parameter number_of_segments: The number of byte ranges of the file that are downloaded concurrently.
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digest of the file should be computed.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+        """
+
+        with host_semaphore:
+            DataSourceDownloadUtility.download_file(
+                file_url=file_url,
+                file_name=file_name,
+                output_directory_path=output_directory_path,
+                number_of_segments=number_of_segments,
+                is_md5_digest_computed=is_md5_digest_computed,
+                download_cancellation_event=download_cancellation_event
+            )
+
+    @staticmethod
+    def download_files(
+            file_urls_and_names: List[Tuple[str, str]],
+            output_directory_path: Union[str, PathLike[str]],
+            maximum_number_of_threads: int = 8,
+            maximum_number_of_threads_per_host: int = 4,
+            number_of_segments_per_file: int = 1,
+            is_md5_digest_computed: bool = False,
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> None:
+        """
+        Download multiple files concurrently.
+
+        :parameter file_urls_and_names: The URLs and names of the files.
+        :parameter output_directory_path: The path to the output directory where the files should be downloaded.
+        :parameter maximum_number_of_threads: The maximum number of files that are downloaded at the same time.
+        :parameter maximum_number_of_threads_per_host: The maximum number of files that are downloaded at the same time
+            from the same host.
+        :parameter number_of_segments_per_file: The number of byte ranges of each file that are downloaded concurrently.
+        :parameter is_md5_digest_computed: The indicator of whether the MD5 digests of the files should be computed in
+            addition to the SHA-256 digests.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+        """
+
+        if file_download_recorder is not None:
+            file_download_recorder.extend(
+                file_urls_and_names
+            )
+
+            return
+
+        host_semaphores = dict()
+
+        for file_url, _ in file_urls_and_names:
+            host_semaphores.setdefault(
+                urlsplit(
+                    url=file_url
+                ).netloc,
+                BoundedSemaphore(
+                    value=maximum_number_of_threads_per_host
+                )
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(maximum_number_of_threads, len(file_urls_and_names)))
+        ) as thread_pool_executor:
+            futures = [
+                thread_pool_executor.submit(
+                    DataSourceDownloadUtility._download_file_with_host_semaphore,
+                    file_url=file_url,
+                    file_name=file_name,
+                    output_directory_path=output_directory_path,
+                    host_semaphore=host_semaphores[
+                        urlsplit(
+                            url=file_url
+                        ).netloc
+                    ],
+                    number_of_segments=number_of_segments_per_file,
+                    is_md5_digest_computed=is_md5_digest_computed,
+                    download_cancellation_event=download_cancellation_event
+                ) for file_url, file_name in file_urls_and_names
+            ]
+
+            try:
+                for future in as_completed(
+                    fs=futures
+                ):
+                    future.result()
+
+            except:
+                for future in futures:
+                    future.cancel()
+
+                raise
+
+
+class _DataSourceRateLimitedStream(RawIOBase):
+    """ The data source rate-limited stream class, which consumes the bandwidth rate limits for the bytes it reads. """
+
+    def __init__(
+            self,
+            stream: Any,
+            url: str
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter stream: The stream.
+        :parameter url: The URL whose host is used.
+        """
+
+        super().__init__()
+
+        self._stream = stream
+        self._url = url
+
+    def readable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the stream is readable.
+
+        :returns: The indicator of whether the stream is readable.
+        """
+
+        return True
+
+    def readinto(
+            self,
+            buffer: Any
+    ) -> int:
+        """
+        Read the stream into a buffer.
+
+        :parameter buffer: The buffer.
+
+        :returns: The number of bytes that are read.
+        """
+
+        data = self._stream.read(len(buffer))
+
+        buffer[:len(data)] = data
+
+        DataSourceDownloadUtility._consume_rate_limits(
+            url=self._url,
+            number_of_bytes=len(data)
+        )
+
+        return len(data)
+
+
+class _DataSourceResumableStream(RawIOBase):
+    """
+    The data source resumable stream class, which resumes an interrupted HTTP response from the last byte it read using
+    an HTTP range request that is conditional on the validator of the file.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            maximum_number_of_retries: int
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter url: The URL of the file.
+        :parameter maximum_number_of_retries: The maximum number of times an interrupted response is resumed.
+        """
+
+        super().__init__()
+
+        self._url = url
+        self._maximum_number_of_retries = maximum_number_of_retries
+
+        self._http_get_request_response = None
+        self._stream = None
+
+        self._position = 0
+        self._file_size = None
+        self._validator = None
+        self._retry_index = 0
+
+    def readable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the stream is readable.
+
+        :returns: The indicator of whether the stream is readable.
+        """
+
+        return True
+
+    def _open(
+            self
+    ) -> None:
+        """ Send the HTTP GET request for the bytes of the file from the current position. """
+
+        http_get_request_headers = {
+            "Accept-Encoding": "identity",
+            "Range": "bytes={position:d}-".format(
+                position=self._position
+            ),
+        }
+
+        if self._position > 0:
+            http_get_request_headers["If-Range"] = self._validator
+
+        self._http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_url=self._url,
+            headers=http_get_request_headers,
+            stream=True
+        )
+
+        content_range_match = fullmatch(
+            pattern=r"bytes (\d+)-\d+/(\d+)",
+            string=self._http_get_request_response.headers.get("Content-Range", "")
+        )
+
+        if self._http_get_request_response.status_code == 206 and content_range_match is not None:
+            if int(content_range_match.group(1)) != self._position:
+                raise ValueError(
+                    "The server responded with the bytes from the position {start_position:s} instead of the position "
+                    "{position:d} of the file '{file_url:s}'.".format(
+                        start_position=content_range_match.group(1),
+                        position=self._position,
+                        file_url=self._url
+                    )
+                )
+
+            self._file_size = int(content_range_match.group(2))
+
+        elif self._position > 0:
+            raise ValueError(
+                "The download stream of the file '{file_url:s}' cannot be resumed from the position {position:d} "
+                "because the server does not support the HTTP range requests or the file has changed.".format(
+                    file_url=self._url,
+                    position=self._position
+                )
+            )
+
+        elif "Content-Length" in self._http_get_request_response.headers.keys():
+            self._file_size = int(self._http_get_request_response.headers["Content-Length"])
+
+        if self._position == 0:
+            self._validator = self._http_get_request_response.headers.get(
+                "ETag",
+                self._http_get_request_response.headers.get("Last-Modified", None)
+            )
+
+        self._stream = DataSourceDownloadUtility.get_rate_limited_stream(
+            stream=self._http_get_request_response.raw,
+            url=self._url
+        )
+
+    def _close_response(
+            self
+    ) -> None:
+        """ Close the current HTTP response. """
+
+        if self._http_get_request_response is not None:
+            self._http_get_request_response.close()
+
+        self._http_get_request_response = None
+        self._stream = None
+
+    def readinto(
+            self,
+            buffer: Any
+    ) -> int:
+        """
+        Read the stream into a buffer.
+
+        :parameter buffer: The buffer.
+
+        :returns: The number of bytes that are read.
+        """
+
+        while True:
+            try:
+                if self._stream is None:
+                    self._open()
+
+                data = self._stream.read(len(buffer))
+
+                if not data and self._file_size is not None and self._position < self._file_size:
+                    raise ConnectionError(
+                        "The connection was closed before the bytes {position:d}-{end_position:d} of the file "
+                        "'{file_url:s}' were received.".format(
+                            position=self._position,
+                            end_position=self._file_size - 1,
+                            file_url=self._url
+                        )
+                    )
+
+                break
+
+            except (RequestException, ConnectionError, TimeoutError, Urllib3HTTPError) as exception_handle:
+                self._close_response()
+
+                if not DataSourceDownloadUtility._is_download_exception_retryable(
+                    exception_handle=exception_handle
+                ) or self._retry_index >= self._maximum_number_of_retries or (
+                    self._position > 0 and self._validator is None
+                ):
+                    raise
+
+                self._retry_index += 1
+
+                sleep(min(2 ** self._retry_index, 60))
+
+        buffer[:len(data)] = data
+
+        self._position += len(data)
+
+        return len(data)
+
+    def close(
+            self
+    ) -> None:
+        """ Close the stream and the current HTTP response. """
+
+        self._close_response()
+
+        super().close()
@@ -0,0 +1,535 @@
+""" The ``data_source.base.utility`` package ``estimation`` module. """
+
+from hashlib import sha256
+from io import BufferedReader, RawIOBase
+from json import dump, load
+from os import PathLike, sysconf
+from pathlib import Path
+from shutil import disk_usage
+from time import time
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from py7zr import SevenZipFile
+
+from zipfile import ZipFile
+
+from data_source.base.utility.cache import DataSourceCacheUtility
+from data_source.base.utility.download import DataSourceDownloadUtility
+
+
+class DataSourceEstimationUtility:
+    """ The data source resource usage estimation utility class. """
+
+    _file_size_catalog_configuration = {
+        "is_enabled": True,
+        "cache_directory_path": None,
+        "time_to_live": 7 * 24 * 60 * 60,
+    }
+
+    _compression_ratios = {
+        ".7z": 6.0,
+        ".bz2": 5.0,
+        ".gz": 4.0,
+        ".zip": 4.0,
+    }
+
+    _memory_usage_factor = 6.0
+
+    _average_row_size = 256
+
+    _streaming_memory_usage = 1024 ** 3
+
+    @staticmethod
+    def configure_file_size_catalog(
+            cache_directory_path: Optional[Union[str, PathLike[str]]],
+            time_to_live: Optional[float] = 7 * 24 * 60 * 60
+    ) -> None:
+        """
+        Configure the on-disk catalog of the sizes of the remote files.
+
+        :parameter cache_directory_path: The path to the directory where the sizes of the remote files should be cached.
+            The value `None` indicates that the sizes of the remote files should not be cached.
+        :parameter time_to_live: The time in seconds for which a cached size of a remote file is used. The value `None`
+            indicates that a cached size of a remote file should never expire.
+        """
+
+        DataSourceEstimationUtility._file_size_catalog_configuration = {
+            "is_enabled": cache_directory_path is not None,
+            "cache_directory_path": None if cache_directory_path is None else Path(cache_directory_path),
+            "time_to_live": time_to_live,
+        }
+
+    @staticmethod
+    def _get_file_size_catalog_entry_path(
+            file_url: str
+    ) -> Optional[Path]:
+        """
+        Get the path to the entry of a remote file in the catalog of the sizes of the remote files.
+
+        :parameter file_url: The URL of the file.
+
+        :returns: The path to the entry of the file. The value `None` indicates that the catalog is not configured.
+        """
+
+        cache_directory_path = DataSourceCacheUtility.get_cache_directory_path(
+            cache_configuration=DataSourceEstimationUtility._file_size_catalog_configuration,
+            cache_name="file_sizes"
+        )
+
+        if cache_directory_path is None:
+            return None
+
+        return Path(cache_directory_path, "{url_hash:s}.json".format(
+            url_hash=sha256(
+                file_url.encode(
+                    encoding="utf-8"
+                )
+            ).hexdigest()
+        ))
+
+    @staticmethod
+    def _read_file_size_catalog_entry(
+            file_url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the entry of a remote file from the catalog of the sizes of the remote files.
+
+        :parameter file_url: The URL of the file.
+
+        :returns: The entry of the file. The value `None` indicates that the entry is not available or expired.
+        """
+
+        file_size_catalog_entry_path = DataSourceEstimationUtility._get_file_size_catalog_entry_path(
+            file_url=file_url
+        )
+
+        if file_size_catalog_entry_path is None:
+            return None
+
+        try:
+            with open(
+                file=file_size_catalog_entry_path
+            ) as file_size_catalog_entry_file_handle:
+                file_size_catalog_entry = load(
+                    fp=file_size_catalog_entry_file_handle
+                )
+
+        except (OSError, ValueError):
+            return None
+
+        time_to_live = DataSourceEstimationUtility._file_size_catalog_configuration["time_to_live"]
+
+        if time_to_live is not None and time() - file_size_catalog_entry["fetch_time"] >= time_to_live:
+            return None
+
+        return file_size_catalog_entry
+
+    @staticmethod
+    def _write_file_size_catalog_entry(
+            file_url: str,
+            file_size_catalog_entry: Dict[str, Any]
+    ) -> None:
+        """
+        Write the entry of a remote file to the catalog of the sizes of the remote files.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_size_catalog_entry: The entry of the file.
+        """
+
+        file_size_catalog_entry_path = DataSourceEstimationUtility._get_file_size_catalog_entry_path(
+            file_url=file_url
+        )
+
+        if file_size_catalog_entry_path is None:
+            return
+
+        try:
+            file_size_catalog_entry_path.parent.mkdir(
+                parents=True,
+                exist_ok=True
+            )
+
+            temporary_file_size_catalog_entry_path = file_size_catalog_entry_path.with_suffix(".tmp")
+
+            with open(
+                file=temporary_file_size_catalog_entry_path,
+                mode="w"
+            ) as file_size_catalog_entry_file_handle:
+                dump(
+                    obj=file_size_catalog_entry,
+                    fp=file_size_catalog_entry_file_handle
+                )
+
+            temporary_file_size_catalog_entry_path.replace(
+                target=file_size_catalog_entry_path
+            )
+
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_archive_uncompressed_size_from_headers(
+            file_url: str,
+            file_name: str,
+            file_size: int
+    ) -> Optional[int]:
+        """
+        Get the uncompressed size of a remote archive from its headers, which are read using HTTP range requests.
+
+        The sizes of the members of ZIP and 7z archives are read from their central directories. The uncompressed size
+        of a GZIP file is read from its trailer, which stores it modulo 4 GiB.
+
+        :parameter file_url: The URL of the archive file, which must support HTTP range requests.
+        :parameter file_name: The name of the archive file.
+        :parameter file_size: The size of the archive file.
+
+        :returns: The uncompressed size of the archive. The value `None` indicates that it cannot be read.
+        """
+
+        with BufferedReader(
+            raw=_DataSourceHTTPRangeReader(
+                file_url=file_url,
+                file_size=file_size
+            ),
+            buffer_size=64 * 1024
+        ) as remote_file_handle:
+            if file_name.endswith(".zip"):
+                with ZipFile(
+                    file=remote_file_handle
+                ) as zip_archive_file_handle:
+                    return sum(
+                        zip_archive_member.file_size for zip_archive_member in zip_archive_file_handle.infolist()
+                    )
+
+            elif file_name.endswith(".7z"):
+                with SevenZipFile(
+                    file=remote_file_handle
+                ) as seven_zip_archive_file_handle:
+                    return sum(
+                        seven_zip_archive_member.uncompressed or 0
+                        for seven_zip_archive_member in seven_zip_archive_file_handle.list()
+                    )
+
+            elif file_name.endswith(".gz"):
+                remote_file_handle.seek(-4, 2)
+
+                uncompressed_size = int.from_bytes(
+                    bytes=remote_file_handle.read(4),
+                    byteorder="little"
+                )
+
+                # The GZIP trailer stores the uncompressed size modulo 4 GiB, so it is assumed to be the smallest value
+                # that is not smaller than the compressed size.
+                while uncompressed_size < file_size:
+                    uncompressed_size += 2 ** 32
+
+                return uncompressed_size
+
+            return None
+
+    @staticmethod
+    def get_file_sizes(
+            file_url: str,
+            file_name: str
+    ) -> Dict[str, Any]:
+        """
+        Get the download size and the uncompressed size of a remote file without downloading it.
+
+        The download size is read from the response to an HTTP range or `Content-Length` request. The uncompressed size
+        of an archive is read from its headers if the server supports HTTP range requests, and it is approximated using
+        a typical compression ratio otherwise. The sizes are cached in the catalog of the sizes of the remote files.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_name: The name of the file.
+
+        :returns: The download size, the uncompressed size, and the indicator of whether the file is an archive. The
+            value `None` indicates that a size is unknown.
+        """
+
+        file_sizes = DataSourceEstimationUtility._read_file_size_catalog_entry(
+            file_url=file_url
+        )
+
+        if file_sizes is not None:
+            return file_sizes
+
+        file_extension = Path(file_name).suffix
+
+        is_archive = file_extension in DataSourceEstimationUtility._compression_ratios.keys()
+
+        file_probe = DataSourceDownloadUtility.probe_file(
+            file_url=file_url
+        )
+
+        file_size = file_probe["file_size"]
+
+        if file_probe["is_range_supported"]:
+            try:
+                uncompressed_size = DataSourceEstimationUtility._get_archive_uncompressed_size_from_headers(
+                    file_url=file_probe["file_url"],
+                    file_name=file_name,
+                    file_size=file_size
+                ) if is_archive else file_size
+
+            except Exception:
+                uncompressed_size = None
+
+        else:
+            uncompressed_size = None
+
+        if uncompressed_size is None and file_size is not None:
+            uncompressed_size = int(
+                file_size * DataSourceEstimationUtility._compression_ratios.get(file_extension, 1.0)
+            )
+
+        file_sizes = {
+            "download_size": file_size,
+            "uncompressed_size": uncompressed_size,
+            "is_archive": is_archive,
+            "fetch_time": time(),
+        }
+
+        if file_size is not None:
+            DataSourceEstimationUtility._write_file_size_catalog_entry(
+                file_url=file_url,
+                file_size_catalog_entry=file_sizes
+            )
+
+        return file_sizes
+
+    @staticmethod
+    def estimate_resource_usage(
+            file_urls_and_names: Sequence[Tuple[str, str]],
+            is_streaming_enabled: bool = False,
+            is_input_file_deletion_enabled: bool = False,
+            number_of_rows_per_chunk: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate the resource usage of the download, extraction, and formatting of remote files.
+
+        The size of the formatted data is approximated by the uncompressed size of the input data, and the peak memory
+        usage of the formatting is approximated by a multiple of the size of the data that is parsed at once, which is
+        the whole input data unless it is parsed in chunks. The size of a chunk is approximated using a typical row
+        size. If the streaming mode is enabled, only the formatted data is written to the disk and the peak memory usage
+        is bounded by the size of the parsed chunks.
+
+        :parameter file_urls_and_names: The URLs and names of the files.
+        :parameter is_streaming_enabled: The indicator of whether the data is formatted directly from the download
+            stream.
+        :parameter is_input_file_deletion_enabled: The indicator of whether the downloaded and extracted files are
+            deleted as soon as they are consumed.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value `None`
+            indicates that the whole input data is parsed at once.
+
+        :returns: The estimated download size, extracted size, formatted size, peak disk usage, and peak memory usage
+            in bytes, and the number of files of unknown size.
+        """
+
+        all_file_sizes = [
+            DataSourceEstimationUtility.get_file_sizes(
+                file_url=file_url,
+                file_name=file_name
+            ) for file_url, file_name in file_urls_and_names
+        ]
+
+        download_size = sum(
+            file_sizes["download_size"] or 0 for file_sizes in all_file_sizes
+        )
+
+        extracted_size = sum(
+            file_sizes["uncompressed_size"] or 0 for file_sizes in all_file_sizes if file_sizes["is_archive"]
+        )
+
+        formatted_size = sum(
+            file_sizes["uncompressed_size"] or 0 for file_sizes in all_file_sizes
+        )
+
+        if is_streaming_enabled:
+            peak_disk_usage = formatted_size
+            peak_memory_usage = DataSourceEstimationUtility._streaming_memory_usage
+
+        else:
+            if is_input_file_deletion_enabled:
+                peak_disk_usage = max(download_size + extracted_size, extracted_size + formatted_size)
+
+            else:
+                peak_disk_usage = download_size + extracted_size + formatted_size
+
+            parsed_size = formatted_size
+
+            if number_of_rows_per_chunk is not None:
+                parsed_size = min(parsed_size, number_of_rows_per_chunk * DataSourceEstimationUtility._average_row_size)
+
+            peak_memory_usage = int(parsed_size * DataSourceEstimationUtility._memory_usage_factor)
+
+        return {
+            "download_size": download_size,
+            "extracted_size": extracted_size,
+            "formatted_size": formatted_size,
+            "peak_disk_usage": peak_disk_usage,
+            "peak_memory_usage": peak_memory_usage,
+            "number_of_files_of_unknown_size": sum(
+                file_sizes["download_size"] is None for file_sizes in all_file_sizes
+            ),
+        }
+
+    @staticmethod
+    def get_available_disk_space(
+            directory_path: Union[str, PathLike[str]]
+    ) -> int:
+        """
+        Get the available disk space of the file system of a directory.
+
+        :parameter directory_path: The path to the directory.
+
+        :returns: The available disk space in bytes.
+        """
+
+        return disk_usage(
+            path=directory_path
+        ).free
+
+    @staticmethod
+    def get_available_memory() -> Optional[int]:
+        """
+        Get the available physical memory.
+
+        :returns: The available physical memory in bytes. The value `None` indicates that it cannot be determined.
+        """
+
+        try:
+            with open(
+                file="/proc/meminfo"
+            ) as memory_information_file_handle:
+                for memory_information_line in memory_information_file_handle:
+                    if memory_information_line.startswith("MemAvailable:"):
+                        return int(memory_information_line.split()[1]) * 1024
+
+        except (OSError, ValueError, IndexError):
+            pass
+
+        try:
+            return sysconf("SC_AVPHYS_PAGES") * sysconf("SC_PAGE_SIZE")
+
+        except (OSError, ValueError, AttributeError):
+            return None
+
+
+class _DataSourceHTTPRangeReader(RawIOBase):
+    """ The data source HTTP range reader class, which exposes a remote file as a file using HTTP range requests. """
+
+    def __init__(
+            self,
+            file_url: str,
+            file_size: int
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter file_url: The URL of the file.
+        :parameter file_size: The size of the file.
+        """
+
+        super().__init__()
+
+        self._file_url = file_url
+        self._file_size = file_size
+        self._offset = 0
+
+    def readable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the reader is readable.
+
+        :returns: The indicator of whether the reader is readable.
+        """
+
+        return True
+
+    def seekable(
+            self
+    ) -> bool:
+        """
+        Get the indicator of whether the reader is seekable.
+
+        :returns: The indicator of whether the reader is seekable.
+        """
+
+        return True
+
+    def tell(
+            self
+    ) -> int:
+        """
+        Get the current offset in the remote file.
+
+        :returns: The current offset in the remote file.
+        """
+
+        return self._offset
+
+    def seek(
+            self,
+            offset: int,
+            whence: int = 0
+    ) -> int:
+        """
+        Change the current offset in the remote file.
+
+        :parameter offset: The offset relative to the position indicated by `whence`.
+        :parameter whence: The start (0), the current offset (1), or the end (2) of the remote file.
+
+        :returns: The new offset in the remote file.
+        """
+
+        if whence == 1:
+            offset += self._offset
+
+        elif whence == 2:
+            offset += self._file_size
+
+        self._offset = max(offset, 0)
+
+        return self._offset
+
+    def readinto(
+            self,
+            buffer: Any
+    ) -> int:
+        """
+        Read the remote file at the current offset into a buffer.
+
+        :parameter buffer: The buffer.
+
+        :returns: The number of bytes that are read.
+        """
+
+        if self._offset >= self._file_size or len(buffer) == 0:
+            return 0
+
+        http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_url=self._file_url,
+            headers={
+                "Accept-Encoding": "identity",
+                "Range": "bytes={start_position:d}-{end_position:d}".format(
+                    start_position=self._offset,
+                    end_position=min(self._offset + len(buffer), self._file_size) - 1
+                ),
+            }
+        )
+
+        if http_get_request_response.status_code != 206:
+            raise OSError(
+                "The server does not support HTTP range requests for the file '{file_url:s}'.".format(
+                    file_url=self._file_url
+                )
+            )
+
+        data = http_get_request_response.content[:len(buffer)]
+
+        buffer[:len(data)] = data
+
+        self._offset += len(data)
+
+        return len(data)
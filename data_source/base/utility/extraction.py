@@ -0,0 +1,1408 @@
+""" The ``data_source.base.utility`` package ``extraction`` module. """
+
+from contextlib import ExitStack, contextmanager
+from fnmatch import fnmatchcase
+from hashlib import sha256
+from json import dump, load
+from os import PathLike
+from pathlib import Path, PurePosixPath
+from queue import Queue
+from shutil import copyfileobj
+from tarfile import TarFile, is_tarfile
+from tempfile import NamedTemporaryFile
+from threading import Thread
+from typing import IO, Any, ContextManager, Dict, Iterator, List, Optional, Sequence, Union
+
+from bz2 import BZ2File
+
+from gzip import GzipFile
+
+from pqdm.processes import pqdm
+
+from py7zr import SevenZipFile
+
+from zipfile import ZipFile
+
+from zlib import MAX_WBITS, decompressobj
+
+from data_source.base.utility.block_index import DataSourceBZ2BlockIndex
+from data_source.base.utility.cache import DataSourceCacheUtility
+from data_source.base.utility.download import DataSourceDownloadUtility
+
+try:
+    from rapidgzip import RapidgzipFile
+
+except ImportError:
+    RapidgzipFile = None
+
+
+class DataSourceExtractionUtility:
+    """ The data source extraction utility class. """
+
+    _compressed_chunk_size = 1024 * 1024
+
+    _decompressed_chunk_size = 4 * 1024 * 1024
+
+    _maximum_number_of_queued_decompressed_chunks = 16
+
+    _maximum_fully_verified_gzip_file_size = 16 * 1024 * 1024
+
+    _verified_archive_cache_configuration = {
+        "is_enabled": True,
+        "cache_directory_path": None,
+    }
+
+    @staticmethod
+    def select_archive_member_names(
+            archive_member_names: Sequence[str],
+            archive_member_name_patterns: Optional[Sequence[str]] = None
+    ) -> List[str]:
+        """
+        Select the names of the archive members that match at least one of the glob patterns.
+
+        The wildcard `*` also matches the `/` separator, so the pattern `data/*.pb.gz` matches the members in the nested
+        directories of the `data` directory as well.
+
+        :parameter archive_member_names: The names of the archive members.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members. The value `None`
+            indicates that all archive members should be selected.
+
+        :returns: The names of the selected archive members.
+        """
+
+        if archive_member_name_patterns is None:
+            return list(archive_member_names)
+
+        return [
+            archive_member_name for archive_member_name in archive_member_names
+            if any(
+                fnmatchcase(
+                    name=archive_member_name,
+                    pat=archive_member_name_pattern
+                ) for archive_member_name_pattern in archive_member_name_patterns
+            )
+        ]
+
+    @staticmethod
+    def _raise_if_no_archive_member_is_selected(
+            archive_file_path: Union[str, PathLike[str]],
+            archive_member_names: Sequence[str],
+            archive_member_name_patterns: Optional[Sequence[str]]
+    ) -> None:
+        """
+        Raise an error if none of the archive members is selected by the glob patterns.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter archive_member_names: The names of the selected archive members.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members.
+        """
+
+        if archive_member_name_patterns is not None and len(archive_member_names) == 0:
+            raise ValueError(
+                "The archive '{archive_file_path:s}' does not contain any members matching {patterns:s}.".format(
+                    archive_file_path=Path(archive_file_path).as_posix(),
+                    patterns=", ".join(archive_member_name_patterns)
+                )
+            )
+
+    @staticmethod
+    def get_extraction_manifest_path(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> Path:
+        """
+        Get the path to the extraction manifest of an archive.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+
+        :returns: The path to the extraction manifest of the archive.
+        """
+
+        return Path(output_directory_path, "{archive_file_name:s}.extraction.json".format(
+            archive_file_name=Path(archive_file_path).name
+        ))
+
+    @staticmethod
+    def _get_archive_fingerprint(
+            archive_file_path: Union[str, PathLike[str]]
+    ) -> Dict[str, Any]:
+        """
+        Get the fingerprint of an archive.
+
+        The SHA-256 digest of the archive is used if it is available from the digest manifest of the downloaded file.
+        Otherwise, the modification time of the archive is used, so the archive is never hashed just for this purpose.
+
+        :parameter archive_file_path: The path to the archive file.
+
+        :returns: The fingerprint of the archive.
+        """
+
+        file_digests = DataSourceDownloadUtility.get_file_digests(
+            file_path=archive_file_path
+        )
+
+        if file_digests is not None and "sha256" in file_digests.keys():
+            return {
+                "size": Path(archive_file_path).stat().st_size,
+                "sha256": file_digests["sha256"],
+            }
+
+        return {
+            "size": Path(archive_file_path).stat().st_size,
+            "modification_time": Path(archive_file_path).stat().st_mtime_ns,
+        }
+
+    @staticmethod
+    def _read_extraction_manifest(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read the extraction manifest of an archive.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+
+        :returns: The extraction manifest of the archive. The value `None` indicates that the manifest is not available.
+        """
+
+        try:
+            with open(
+                file=DataSourceExtractionUtility.get_extraction_manifest_path(
+                    archive_file_path=archive_file_path,
+                    output_directory_path=output_directory_path
+                )
+            ) as extraction_manifest_file_handle:
+                return load(
+                    fp=extraction_manifest_file_handle
+                )
+
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_extraction_manifest(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]],
+            archive_members: Dict[str, Dict[str, Optional[int]]]
+    ) -> None:
+        """
+        Write the extraction manifest of an archive.
+
+        The manifest is written to a temporary file in the output directory that replaces the manifest atomically, so
+        an interrupted write never leaves a partial manifest behind.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the extracted archive members.
+        :parameter archive_members: The sizes and CRC-32 checksums of the extracted archive members.
+        """
+
+        extraction_manifest_path = DataSourceExtractionUtility.get_extraction_manifest_path(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path
+        )
+
+        with NamedTemporaryFile(
+            mode="w",
+            dir=extraction_manifest_path.parent,
+            prefix="{extraction_manifest_file_name:s}.".format(
+                extraction_manifest_file_name=extraction_manifest_path.name
+            ),
+            suffix=".tmp",
+            delete=False
+        ) as extraction_manifest_file_handle:
+            dump(
+                obj={
+                    "archive_fingerprint": DataSourceExtractionUtility._get_archive_fingerprint(
+                        archive_file_path=archive_file_path
+                    ),
+                    "archive_member_name_patterns": None if archive_member_name_patterns is None else list(
+                        archive_member_name_patterns
+                    ),
+                    "archive_members": archive_members,
+                },
+                fp=extraction_manifest_file_handle,
+                indent=2
+            )
+
+        try:
+            Path(extraction_manifest_file_handle.name).replace(
+                target=extraction_manifest_path
+            )
+
+        except OSError:
+            Path(extraction_manifest_file_handle.name).unlink(
+                missing_ok=True
+            )
+
+            raise
+
+    @staticmethod
+    def _is_archive_member_extracted(
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name: str,
+            archive_member_size: Optional[int]
+    ) -> bool:
+        """
+        Get the indicator of whether an archive member is extracted to the output directory with the expected size.
+
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+        :parameter archive_member_name: The name of the archive member.
+        :parameter archive_member_size: The expected size of the extracted archive member.
+
+        :returns: The indicator of whether the archive member is extracted to the output directory.
+        """
+
+        archive_member_file_path = Path(output_directory_path, archive_member_name)
+
+        return archive_member_file_path.is_file() and archive_member_file_path.stat().st_size == archive_member_size
+
+    @staticmethod
+    def is_extraction_up_to_date(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]] = None
+    ) -> bool:
+        """
+        Get the indicator of whether the extraction of an archive is up to date.
+
+        The extraction is up to date if the archive and the glob patterns are unchanged since the extraction manifest
+        was written and all extracted archive members still have their recorded sizes, in which case the archive does
+        not need to be opened at all.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members that should be
+            extracted. The value `None` indicates that all archive members should be extracted.
+
+        :returns: The indicator of whether the extraction of the archive is up to date.
+        """
+
+        if not Path(archive_file_path).is_file():
+            return False
+
+        extraction_manifest = DataSourceExtractionUtility._read_extraction_manifest(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path
+        )
+
+        if extraction_manifest is None:
+            return False
+
+        if extraction_manifest.get("archive_fingerprint", None) != DataSourceExtractionUtility._get_archive_fingerprint(
+            archive_file_path=archive_file_path
+        ):
+            return False
+
+        if extraction_manifest.get("archive_member_name_patterns", None) != (
+            None if archive_member_name_patterns is None else list(archive_member_name_patterns)
+        ):
+            return False
+
+        return all(
+            DataSourceExtractionUtility._is_archive_member_extracted(
+                output_directory_path=output_directory_path,
+                archive_member_name=archive_member_name,
+                archive_member_size=archive_member["size"]
+            ) for archive_member_name, archive_member in extraction_manifest.get("archive_members", dict()).items()
+        )
+
+    @staticmethod
+    def _select_changed_archive_member_names(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_members: Dict[str, Dict[str, Optional[int]]]
+    ) -> List[str]:
+        """
+        Select the names of the archive members that are changed or missing since the extraction manifest was written.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members are extracted.
+        :parameter archive_members: The sizes and CRC-32 checksums of the archive members.
+
+        :returns: The names of the archive members that should be extracted.
+        """
+
+        extraction_manifest = DataSourceExtractionUtility._read_extraction_manifest(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path
+        )
+
+        if extraction_manifest is None:
+            return list(archive_members.keys())
+
+        extracted_archive_members = extraction_manifest.get("archive_members", dict())
+
+        changed_archive_member_names = list()
+
+        for archive_member_name, archive_member in archive_members.items():
+            if archive_member["crc"] is not None and extracted_archive_members.get(
+                archive_member_name,
+                None
+            ) == archive_member and DataSourceExtractionUtility._is_archive_member_extracted(
+                output_directory_path=output_directory_path,
+                archive_member_name=archive_member_name,
+                archive_member_size=archive_member["size"]
+            ):
+                continue
+
+            changed_archive_member_names.append(archive_member_name)
+
+        return changed_archive_member_names
+
+    @staticmethod
+    def delete_archive(
+            archive_file_path: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Delete an archive and the digest manifest of the downloaded file.
+
+        :parameter archive_file_path: The path to the archive file.
+        """
+
+        Path(archive_file_path).unlink(
+            missing_ok=True
+        )
+
+        DataSourceDownloadUtility.get_file_digest_manifest_path(
+            file_path=archive_file_path
+        ).unlink(
+            missing_ok=True
+        )
+
+    @staticmethod
+    def configure_verified_archive_cache(
+            cache_directory_path: Optional[Union[str, PathLike[str]]]
+    ) -> None:
+        """
+        Configure the on-disk cache of the SHA-256 digests of the verified archives.
+
+        :parameter cache_directory_path: The path to the directory where the SHA-256 digests of the verified archives
+            should be cached. The value `None` indicates that the SHA-256 digests should not be cached.
+        """
+
+        DataSourceExtractionUtility._verified_archive_cache_configuration = {
+            "is_enabled": cache_directory_path is not None,
+            "cache_directory_path": None if cache_directory_path is None else Path(cache_directory_path),
+        }
+
+    @staticmethod
+    def _get_gzip_file_corruption_reason(
+            archive_file_path: Union[str, PathLike[str]],
+            file_digests: Optional[Dict[str, Any]] = None,
+            is_data_verified: bool = True
+    ) -> Optional[str]:
+        """
+        Get the reason why the header or the trailer of a GZIP file is corrupt, without decompressing the data if
+        possible.
+
+        The header must start with the magic number and the DEFLATE compression method, and the trailer must hold an
+        uncompressed size that the DEFLATE compression can produce from the size of the file. As the trailer cannot
+        prove that the DEFLATE stream before it is intact, the small files are also decompressed entirely. The large
+        files are instead compared to the SHA-256 digest of the downloaded file if it is available, and decompressed
+        entirely otherwise.
+
+        :parameter archive_file_path: The path to the GZIP file.
+        :parameter file_digests: The digests of the downloaded file from its digest manifest. The value `None` indicates
+            that the digests are not available.
+        :parameter is_data_verified: The indicator of whether the data should be verified in addition to the header and
+            the trailer, which is unnecessary if the CRC-32 checksum of the data is verified afterwards.
+
+        :returns: The reason why the GZIP file is corrupt. The value `None` indicates that the GZIP file is intact.
+        """
+
+        archive_file_size = Path(archive_file_path).stat().st_size
+
+        with open(
+            file=archive_file_path,
+            mode="rb"
+        ) as archive_file_handle:
+            gzip_file_header = archive_file_handle.read(10)
+
+            if len(gzip_file_header) < 10 or gzip_file_header[:3] != b"\x1f\x8b\x08" or gzip_file_header[3] & 0xe0:
+                return "The magic number or the header is invalid."
+
+            if archive_file_size < 20:
+                return "The file is too short to hold the compressed data and the trailer."
+
+            archive_file_handle.seek(-4, 2)
+
+            uncompressed_size = int.from_bytes(
+                archive_file_handle.read(4),
+                byteorder="little"
+            )
+
+        # The DEFLATE compression cannot exceed a compression ratio of 1032:1.
+        if archive_file_size * 1032 < 2 ** 32 and uncompressed_size > archive_file_size * 1032:
+            return "The trailer is missing or invalid."
+
+        if not is_data_verified:
+            return None
+
+        if archive_file_size > DataSourceExtractionUtility._maximum_fully_verified_gzip_file_size and \
+                file_digests is not None and "sha256" in file_digests.keys():
+            file_hash = sha256()
+
+            with open(
+                file=archive_file_path,
+                mode="rb"
+            ) as archive_file_handle:
+                while True:
+                    archive_file_chunk = archive_file_handle.read(
+                        DataSourceExtractionUtility._compressed_chunk_size * 4
+                    )
+
+                    if not archive_file_chunk:
+                        break
+
+                    file_hash.update(archive_file_chunk)
+
+            if file_hash.hexdigest() != file_digests["sha256"]:
+                return "The SHA-256 digest differs from the digest of the downloaded file."
+
+        else:
+            with GzipFile(
+                filename=archive_file_path
+            ) as gzip_archive_file_handle:
+                while gzip_archive_file_handle.read(4 * 1024 * 1024):
+                    pass
+
+        return None
+
+    @staticmethod
+    def _get_bz2_file_corruption_reason(
+            archive_file_path: Union[str, PathLike[str]]
+    ) -> Optional[str]:
+        """
+        Get the reason why the header or the end-of-stream marker of a BZ2 file is corrupt, without decompressing the
+        data.
+
+        The header must start with the magic number, and the file must end with the 48-bit end-of-stream marker and the
+        32-bit combined CRC-32 checksum of the last stream, followed by fewer than 8 padding bits.
+
+        :parameter archive_file_path: The path to the BZ2 file.
+
+        :returns: The reason why the BZ2 file is corrupt. The value `None` indicates that the BZ2 file is intact.
+        """
+
+        with open(
+            file=archive_file_path,
+            mode="rb"
+        ) as archive_file_handle:
+            bz2_file_header = archive_file_handle.read(4)
+
+            if len(bz2_file_header) < 4 or bz2_file_header[:3] != b"BZh" or bz2_file_header[3:] not in b"123456789":
+                return "The magic number or the header is invalid."
+
+            if Path(archive_file_path).stat().st_size < 14:
+                return "The file is too short to hold the end-of-stream marker."
+
+            archive_file_handle.seek(-11, 2)
+
+            bz2_file_trailer = int.from_bytes(
+                archive_file_handle.read(11),
+                byteorder="big"
+            )
+
+        if not any(
+            (bz2_file_trailer >> (88 - 48 - bit_offset)) & (2 ** 48 - 1) == 0x177245385090
+            for bit_offset in range(1, 9)
+        ):
+            return "The end-of-stream marker is missing."
+
+        return None
+
+    @staticmethod
+    def verify_archive(
+            archive_file_path: Union[str, PathLike[str]],
+            is_checksum_verified: bool = True
+    ) -> None:
+        """
+        Verify the integrity of a ZIP, 7z, GZIP, or BZ2 archive before it is extracted.
+
+        The headers of the archive are verified first, which takes a fraction of a second: the central directory of a
+        ZIP archive must fit within the file, the header of a 7z archive must pass its CRC-32 checksum, a GZIP file must
+        start with its magic number and end with a plausible trailer, and a BZ2 file must start with its magic number
+        and end with its end-of-stream marker. The archive is corrupt if its size differs from the size in the digest
+        manifest of the downloaded file, and a large GZIP file is compared to the SHA-256 digest from the manifest, or
+        decompressed entirely if the manifest is not available. Then, the CRC-32 checksums of the data are verified if
+        requested, which requires the data to be decompressed. If the SHA-256 digest of the archive is available from
+        the digest manifest of the downloaded file, the archive is verified only once across all runs. The files that
+        are not archives are ignored.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter is_checksum_verified: The indicator of whether the CRC-32 checksums of the data should be verified.
+        """
+
+        archive_file_name = Path(archive_file_path).name
+
+        if not archive_file_name.endswith((".zip", ".7z", ".gz", ".bz2",)):
+            return
+
+        verified_archive_cache_entry_path = None
+
+        verified_archive_cache_directory_path = DataSourceCacheUtility.get_cache_directory_path(
+            cache_configuration=DataSourceExtractionUtility._verified_archive_cache_configuration,
+            cache_name="verified_archives"
+        )
+
+        file_digests = DataSourceDownloadUtility.get_file_digests(
+            file_path=archive_file_path
+        )
+
+        if all([
+            verified_archive_cache_directory_path is not None,
+            file_digests is not None and "sha256" in file_digests.keys(),
+        ]):
+            verified_archive_cache_entry_path = Path(
+                verified_archive_cache_directory_path,
+                "{sha256_digest:s}{suffix:s}".format(
+                    sha256_digest=file_digests["sha256"],
+                    suffix=".crc" if is_checksum_verified else ".header"
+                )
+            )
+
+            if verified_archive_cache_entry_path.is_file() or (
+                not is_checksum_verified and verified_archive_cache_entry_path.with_suffix(".crc").is_file()
+            ):
+                return
+
+        archive_file_size = Path(archive_file_path).stat().st_size
+
+        file_digest_manifest = DataSourceDownloadUtility.read_file_digest_manifest(
+            file_path=archive_file_path
+        )
+
+        corruption_reason = None
+
+        try:
+            if file_digest_manifest is not None and file_digest_manifest["file_size"] != archive_file_size:
+                corruption_reason = "The size of {archive_file_size:d} bytes differs from the size of {file_size:d} " \
+                    "bytes of the downloaded file.".format(
+                        archive_file_size=archive_file_size,
+                        file_size=file_digest_manifest["file_size"]
+                    )
+
+            elif archive_file_name.endswith(".zip"):
+                with ZipFile(
+                    file=archive_file_path
+                ) as zip_archive_file_handle:
+                    truncated_archive_member_names = [
+                        zip_archive_member.filename for zip_archive_member in zip_archive_file_handle.infolist()
+                        if zip_archive_member.header_offset + zip_archive_member.compress_size > archive_file_size
+                    ]
+
+                    if len(truncated_archive_member_names) > 0:
+                        corruption_reason = "The member '{archive_member_name:s}' is truncated.".format(
+                            archive_member_name=truncated_archive_member_names[0]
+                        )
+
+                    elif is_checksum_verified:
+                        corrupt_archive_member_name = zip_archive_file_handle.testzip()
+
+                        if corrupt_archive_member_name is not None:
+                            corruption_reason = "The member '{archive_member_name:s}' fails the CRC-32 check.".format(
+                                archive_member_name=corrupt_archive_member_name
+                            )
+
+            elif archive_file_name.endswith(".7z"):
+                with SevenZipFile(
+                    file=archive_file_path
+                ) as seven_zip_archive_file_handle:
+                    if is_checksum_verified:
+                        corrupt_archive_member_name = seven_zip_archive_file_handle.testzip()
+
+                        if corrupt_archive_member_name is not None:
+                            corruption_reason = "The member '{archive_member_name:s}' fails the CRC-32 check.".format(
+                                archive_member_name=corrupt_archive_member_name
+                            )
+
+            else:
+                is_gzip_file = archive_file_name.endswith(".gz")
+
+                if is_gzip_file:
+                    corruption_reason = DataSourceExtractionUtility._get_gzip_file_corruption_reason(
+                        archive_file_path=archive_file_path,
+                        file_digests=file_digests,
+                        is_data_verified=not is_checksum_verified
+                    )
+
+                else:
+                    corruption_reason = DataSourceExtractionUtility._get_bz2_file_corruption_reason(
+                        archive_file_path=archive_file_path
+                    )
+
+                if corruption_reason is None and is_checksum_verified:
+                    with (GzipFile if is_gzip_file else BZ2File)(
+                        filename=archive_file_path
+                    ) as compressed_file_handle:
+                        while compressed_file_handle.read(4 * 1024 * 1024):
+                            pass
+
+        except Exception as exception_handle:
+            corruption_reason = "{exception_type:s}: {exception:s}".format(
+                exception_type=type(exception_handle).__name__,
+                exception=str(exception_handle)
+            )
+
+        if corruption_reason is not None:
+            raise ValueError(
+                "The archive '{archive_file_path:s}' is corrupt. {corruption_reason:s}".format(
+                    archive_file_path=Path(archive_file_path).as_posix(),
+                    corruption_reason=corruption_reason
+                )
+            )
+
+        if verified_archive_cache_entry_path is not None:
+            try:
+                verified_archive_cache_entry_path.parent.mkdir(
+                    parents=True,
+                    exist_ok=True
+                )
+
+                verified_archive_cache_entry_path.touch()
+
+            except OSError:
+                pass
+
+    @staticmethod
+    def verify_archives(
+            archive_file_paths: Sequence[Union[str, PathLike[str]]],
+            number_of_processes: int = 1,
+            is_checksum_verified: bool = True
+    ) -> None:
+        """
+        Verify the integrity of independent archives, concurrently if more than one process is utilized.
+
+        :parameter archive_file_paths: The paths to the archive files.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_checksum_verified: The indicator of whether the CRC-32 checksums of the data should be verified.
+        """
+
+        pqdm(
+            array=[
+                {
+                    "archive_file_path": archive_file_path,
+                    "is_checksum_verified": is_checksum_verified,
+                } for archive_file_path in archive_file_paths
+            ],
+            function=DataSourceExtractionUtility.verify_archive,
+            n_jobs=max(1, min(number_of_processes, len(archive_file_paths))),
+            argument_type="kwargs",
+            exception_behaviour="immediate",
+            desc="Verifying the archives",
+            ncols=150
+        )
+
+    @staticmethod
+    def _extract_zip_archive_members(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_names: Sequence[str]
+    ) -> None:
+        """
+        Extract specific members of a ZIP archive.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members should be
+            extracted.
+        :parameter archive_member_names: The names of the archive members that should be extracted.
+        """
+
+        with ZipFile(
+            file=archive_file_path
+        ) as zip_archive_file_handle:
+            zip_archive_file_handle.extractall(
+                path=output_directory_path,
+                members=archive_member_names
+            )
+
+    @staticmethod
+    def _decompress_gzip_file_chunks(
+            input_file_path: Union[str, PathLike[str]],
+            decompressed_chunk_queue: Queue
+    ) -> None:
+        """
+        Decompress the chunks of a GZIP file, including all members of a multi-member GZIP file, into a queue.
+
+        Each decompressed chunk is limited to a fixed size, so a highly compressed chunk of the file does not expand
+        into an unbounded amount of the memory while it waits in the queue.
+
+        :parameter input_file_path: The path to the GZIP file.
+        :parameter decompressed_chunk_queue: The queue of the decompressed chunks, which is terminated by the value
+            `None` or by the exception that interrupted the decompression.
+        """
+
+        try:
+            decompressor = decompressobj(
+                wbits=MAX_WBITS | 16
+            )
+
+            is_member_started = False
+
+            with open(
+                file=input_file_path,
+                mode="rb"
+            ) as input_file_handle:
+                while True:
+                    compressed_chunk = input_file_handle.read(
+                        DataSourceExtractionUtility._compressed_chunk_size
+                    )
+
+                    if not compressed_chunk:
+                        break
+
+                    while compressed_chunk:
+                        is_member_started = True
+
+                        decompressed_chunk = decompressor.decompress(
+                            compressed_chunk,
+                            DataSourceExtractionUtility._decompressed_chunk_size
+                        )
+
+                        if decompressed_chunk:
+                            decompressed_chunk_queue.put(decompressed_chunk)
+
+                        if decompressor.eof:
+                            compressed_chunk = decompressor.unused_data
+                            is_member_started = False
+
+                            decompressor = decompressobj(
+                                wbits=MAX_WBITS | 16
+                            )
+
+                        else:
+                            compressed_chunk = decompressor.unconsumed_tail
+
+            if is_member_started:
+                raise EOFError(
+                    "The GZIP file '{input_file_path:s}' ended before the end-of-stream marker was reached.".format(
+                        input_file_path=Path(input_file_path).as_posix()
+                    )
+                )
+
+            decompressed_chunk_queue.put(None)
+
+        except Exception as exception_handle:
+            decompressed_chunk_queue.put(exception_handle)
+
+    @staticmethod
+    def decompress_gzip_file(
+            input_file_path: Union[str, PathLike[str]],
+            output_file_path: Union[str, PathLike[str]],
+            number_of_threads: int = 1,
+            is_input_file_deleted: bool = False
+    ) -> None:
+        """
+        Decompress a single-member or multi-member GZIP file.
+
+        If more than one thread is utilized, the file is decompressed in parallel using the optional `rapidgzip`
+        package, which locates the DEFLATE block boundaries and builds a seek point index while decompressing.
+        Otherwise, if the package is not installed, the decompression is not parallel, but it is pipelined with the
+        writing of the output file in a separate thread, and the decompressed data that is waiting to be written is
+        bounded to a fixed number of fixed-size chunks. The decompression is skipped if it is up to date.
+
+        :parameter input_file_path: The path to the GZIP file.
+        :parameter output_file_path: The path to the output file.
+        :parameter number_of_threads: The number of threads.
+        :parameter is_input_file_deleted: The indicator of whether the GZIP file should be deleted after the
+            decompression.
+        """
+
+        if DataSourceExtractionUtility.is_extraction_up_to_date(
+            archive_file_path=input_file_path,
+            output_directory_path=Path(output_file_path).parent
+        ):
+            if is_input_file_deleted:
+                DataSourceExtractionUtility.delete_archive(
+                    archive_file_path=input_file_path
+                )
+
+            return
+
+        if number_of_threads <= 1:
+            with GzipFile(
+                filename=input_file_path
+            ) as gzip_archive_file_handle:
+                with open(
+                    file=output_file_path,
+                    mode="wb"
+                ) as destination_file_handle:
+                    copyfileobj(
+                        fsrc=gzip_archive_file_handle,
+                        fdst=destination_file_handle
+                    )
+
+        elif RapidgzipFile is not None:
+            with RapidgzipFile(
+                filename=Path(input_file_path).as_posix(),
+                parallelization=number_of_threads
+            ) as gzip_archive_file_handle:
+                with open(
+                    file=output_file_path,
+                    mode="wb"
+                ) as destination_file_handle:
+                    copyfileobj(
+                        fsrc=gzip_archive_file_handle,
+                        fdst=destination_file_handle,
+                        length=4 * 1024 * 1024
+                    )
+
+        else:
+            decompressed_chunk_queue = Queue(
+                maxsize=DataSourceExtractionUtility._maximum_number_of_queued_decompressed_chunks
+            )
+
+            decompression_thread = Thread(
+                target=DataSourceExtractionUtility._decompress_gzip_file_chunks,
+                kwargs={
+                    "input_file_path": input_file_path,
+                    "decompressed_chunk_queue": decompressed_chunk_queue,
+                },
+                daemon=True
+            )
+
+            decompression_thread.start()
+
+            decompressed_chunk = b""
+
+            try:
+                with open(
+                    file=output_file_path,
+                    mode="wb"
+                ) as destination_file_handle:
+                    while True:
+                        decompressed_chunk = decompressed_chunk_queue.get()
+
+                        if decompressed_chunk is None:
+                            break
+
+                        if isinstance(decompressed_chunk, Exception):
+                            raise decompressed_chunk
+
+                        destination_file_handle.write(decompressed_chunk)
+
+            finally:
+                # The queue is drained if the writing is interrupted, so the decompression thread is not blocked.
+                while decompressed_chunk is not None and not isinstance(decompressed_chunk, Exception):
+                    decompressed_chunk = decompressed_chunk_queue.get()
+
+                decompression_thread.join()
+
+        DataSourceExtractionUtility._write_extraction_manifest(
+            archive_file_path=input_file_path,
+            output_directory_path=Path(output_file_path).parent,
+            archive_member_name_patterns=None,
+            archive_members={
+                Path(output_file_path).name: {
+                    "size": Path(output_file_path).stat().st_size,
+                    "crc": None,
+                },
+            }
+        )
+
+        if is_input_file_deleted:
+            DataSourceExtractionUtility.delete_archive(
+                archive_file_path=input_file_path
+            )
+
+    @staticmethod
+    def extract_zip_archive(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]] = None,
+            number_of_processes: int = 1,
+            is_archive_deleted: bool = False
+    ) -> None:
+        """
+        Extract the members of a ZIP archive.
+
+        The members of a ZIP archive are compressed independently, so they are split into groups of similar
+        uncompressed size that are extracted concurrently if more than one process is utilized. The extraction is
+        skipped if it is up to date, and otherwise only the members whose CRC-32 checksum or extracted file changed
+        since the last extraction are extracted.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members should be
+            extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members that should be
+            extracted. The value `None` indicates that all archive members should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_archive_deleted: The indicator of whether the archive should be deleted after the extraction.
+        """
+
+        if DataSourceExtractionUtility.is_extraction_up_to_date(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=archive_member_name_patterns
+        ):
+            if is_archive_deleted:
+                DataSourceExtractionUtility.delete_archive(
+                    archive_file_path=archive_file_path
+                )
+
+            return
+
+        with ZipFile(
+            file=archive_file_path
+        ) as zip_archive_file_handle:
+            archive_members = {
+                zip_archive_member.filename: {
+                    "size": zip_archive_member.file_size,
+                    "crc": zip_archive_member.CRC,
+                } for zip_archive_member in zip_archive_file_handle.infolist() if not zip_archive_member.is_dir()
+            }
+
+        archive_member_names = DataSourceExtractionUtility.select_archive_member_names(
+            archive_member_names=list(archive_members.keys()),
+            archive_member_name_patterns=archive_member_name_patterns
+        )
+
+        DataSourceExtractionUtility._raise_if_no_archive_member_is_selected(
+            archive_file_path=archive_file_path,
+            archive_member_names=archive_member_names,
+            archive_member_name_patterns=archive_member_name_patterns
+        )
+
+        archive_members = {
+            archive_member_name: archive_members[archive_member_name] for archive_member_name in archive_member_names
+        }
+
+        changed_archive_member_names = DataSourceExtractionUtility._select_changed_archive_member_names(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path,
+            archive_members=archive_members
+        )
+
+        number_of_archive_member_groups = max(1, min(number_of_processes, len(changed_archive_member_names)))
+
+        if len(changed_archive_member_names) == 0:
+            pass
+
+        elif number_of_archive_member_groups == 1:
+            DataSourceExtractionUtility._extract_zip_archive_members(
+                archive_file_path=archive_file_path,
+                output_directory_path=output_directory_path,
+                archive_member_names=changed_archive_member_names
+            )
+
+        else:
+            for archive_member_directory_name in {
+                PurePosixPath(archive_member_name).parent.as_posix()
+                for archive_member_name in changed_archive_member_names
+            }:
+                Path(output_directory_path, archive_member_directory_name).mkdir(
+                    parents=True,
+                    exist_ok=True
+                )
+
+            archive_member_name_groups = [list() for _ in range(number_of_archive_member_groups)]
+            archive_member_group_sizes = [0 for _ in range(number_of_archive_member_groups)]
+
+            for archive_member_name in sorted(
+                changed_archive_member_names,
+                key=lambda name: archive_members[name]["size"],
+                reverse=True
+            ):
+                archive_member_group_index = archive_member_group_sizes.index(min(archive_member_group_sizes))
+
+                archive_member_name_groups[archive_member_group_index].append(archive_member_name)
+                archive_member_group_sizes[archive_member_group_index] += archive_members[archive_member_name]["size"]
+
+            pqdm(
+                array=[
+                    {
+                        "archive_file_path": archive_file_path,
+                        "output_directory_path": output_directory_path,
+                        "archive_member_names": archive_member_name_group,
+                    } for archive_member_name_group in archive_member_name_groups
+                ],
+                function=DataSourceExtractionUtility._extract_zip_archive_members,
+                n_jobs=number_of_archive_member_groups,
+                argument_type="kwargs",
+                exception_behaviour="immediate",
+                desc="Extracting the {archive_file_name:s} archive".format(
+                    archive_file_name=Path(archive_file_path).name
+                ),
+                ncols=150
+            )
+
+        DataSourceExtractionUtility._write_extraction_manifest(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=archive_member_name_patterns,
+            archive_members=archive_members
+        )
+
+        if is_archive_deleted:
+            DataSourceExtractionUtility.delete_archive(
+                archive_file_path=archive_file_path
+            )
+
+    @staticmethod
+    def extract_seven_zip_archive(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]] = None,
+            is_archive_deleted: bool = False
+    ) -> None:
+        """
+        Extract the members of a 7z archive.
+
+        The extraction is skipped if it is up to date, and otherwise only the members whose CRC-32 checksum or extracted
+        file changed since the last extraction are extracted.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members should be
+            extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members that should be
+            extracted. The value `None` indicates that all archive members should be extracted.
+        :parameter is_archive_deleted: The indicator of whether the archive should be deleted after the extraction.
+        """
+
+        if DataSourceExtractionUtility.is_extraction_up_to_date(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=archive_member_name_patterns
+        ):
+            if is_archive_deleted:
+                DataSourceExtractionUtility.delete_archive(
+                    archive_file_path=archive_file_path
+                )
+
+            return
+
+        with SevenZipFile(
+            file=archive_file_path
+        ) as seven_zip_archive_file_handle:
+            archive_members = {
+                seven_zip_archive_member.filename: {
+                    "size": seven_zip_archive_member.uncompressed,
+                    "crc": seven_zip_archive_member.crc32,
+                } for seven_zip_archive_member in seven_zip_archive_file_handle.list()
+                if not seven_zip_archive_member.is_directory
+            }
+
+            archive_member_names = DataSourceExtractionUtility.select_archive_member_names(
+                archive_member_names=list(archive_members.keys()),
+                archive_member_name_patterns=archive_member_name_patterns
+            )
+
+            DataSourceExtractionUtility._raise_if_no_archive_member_is_selected(
+                archive_file_path=archive_file_path,
+                archive_member_names=archive_member_names,
+                archive_member_name_patterns=archive_member_name_patterns
+            )
+
+            archive_members = {
+                archive_member_name: archive_members[archive_member_name]
+                for archive_member_name in archive_member_names
+            }
+
+            changed_archive_member_names = DataSourceExtractionUtility._select_changed_archive_member_names(
+                archive_file_path=archive_file_path,
+                output_directory_path=output_directory_path,
+                archive_members=archive_members
+            )
+
+            if archive_member_name_patterns is None and len(changed_archive_member_names) == len(archive_members):
+                seven_zip_archive_file_handle.extractall(
+                    path=output_directory_path
+                )
+
+            elif len(changed_archive_member_names) > 0:
+                seven_zip_archive_file_handle.extract(
+                    path=output_directory_path,
+                    targets=changed_archive_member_names
+                )
+
+        DataSourceExtractionUtility._write_extraction_manifest(
+            archive_file_path=archive_file_path,
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=archive_member_name_patterns,
+            archive_members=archive_members
+        )
+
+        if is_archive_deleted:
+            DataSourceExtractionUtility.delete_archive(
+                archive_file_path=archive_file_path
+            )
+
+    @staticmethod
+    def extract_tar_archive_member(
+            archive_file_path: Union[str, PathLike[str]],
+            archive_member_name: str,
+            output_file_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1,
+            is_archive_deleted: bool = False
+    ) -> None:
+        """
+        Extract a regular file member of a TAR archive that is compressed using GZIP or BZ2 to an output file.
+
+        The member of a BZ2 archive is located using the cached block index of the archive, so only the blocks that
+        contain it are decompressed, concurrently if more than one process is utilized. The archive is read sequentially
+        otherwise, or if it cannot be indexed. The extraction is skipped if it is up to date.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter archive_member_name: The name of the archive member.
+        :parameter output_file_path: The path to the output file.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_archive_deleted: The indicator of whether the archive should be deleted after the extraction.
+        """
+
+        if not DataSourceExtractionUtility.is_extraction_up_to_date(
+            archive_file_path=archive_file_path,
+            output_directory_path=Path(output_file_path).parent,
+            archive_member_name_patterns=[
+                archive_member_name,
+            ]
+        ):
+            is_archive_member_extracted = False
+
+            if Path(archive_file_path).suffix == ".bz2":
+                try:
+                    DataSourceBZ2BlockIndex(
+                        archive_file_path=archive_file_path,
+                        number_of_processes=number_of_processes
+                    ).extract_archive_member(
+                        archive_member_name=archive_member_name,
+                        output_file_path=output_file_path
+                    )
+
+                    is_archive_member_extracted = True
+
+                except (OSError, ValueError, EOFError):
+                    pass
+
+            if not is_archive_member_extracted:
+                with DataSourceExtractionUtility.open_archive_member(
+                    archive_file_path=archive_file_path,
+                    archive_member_name=archive_member_name
+                ) as source_file_handle:
+                    with open(
+                        file=output_file_path,
+                        mode="wb"
+                    ) as destination_file_handle:
+                        copyfileobj(
+                            fsrc=source_file_handle,
+                            fdst=destination_file_handle
+                        )
+
+            DataSourceExtractionUtility._write_extraction_manifest(
+                archive_file_path=archive_file_path,
+                output_directory_path=Path(output_file_path).parent,
+                archive_member_name_patterns=[
+                    archive_member_name,
+                ],
+                archive_members={
+                    Path(output_file_path).name: {
+                        "size": Path(output_file_path).stat().st_size,
+                        "crc": None,
+                    },
+                }
+            )
+
+        if is_archive_deleted:
+            DataSourceExtractionUtility.delete_archive(
+                archive_file_path=archive_file_path
+            )
+
+    @staticmethod
+    def extract_archive(
+            archive_file_path: Union[str, PathLike[str]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]] = None,
+            is_archive_deleted: bool = False
+    ) -> None:
+        """
+        Extract the members of a ZIP or 7z archive.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter output_directory_path: The path to the output directory where the archive members should be
+            extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members that should be
+            extracted. The value `None` indicates that all archive members should be extracted.
+        :parameter is_archive_deleted: The indicator of whether the archive should be deleted after the extraction.
+        """
+
+        if Path(archive_file_path).suffix == ".zip":
+            DataSourceExtractionUtility.extract_zip_archive(
+                archive_file_path=archive_file_path,
+                output_directory_path=output_directory_path,
+                archive_member_name_patterns=archive_member_name_patterns,
+                is_archive_deleted=is_archive_deleted
+            )
+
+        elif Path(archive_file_path).suffix == ".7z":
+            DataSourceExtractionUtility.extract_seven_zip_archive(
+                archive_file_path=archive_file_path,
+                output_directory_path=output_directory_path,
+                archive_member_name_patterns=archive_member_name_patterns,
+                is_archive_deleted=is_archive_deleted
+            )
+
+        else:
+            raise ValueError(
+                "The extraction of the archive '{archive_file_path:s}' is not supported.".format(
+                    archive_file_path=Path(archive_file_path).as_posix()
+                )
+            )
+
+    @staticmethod
+    def extract_archives(
+            archive_file_paths: Sequence[Union[str, PathLike[str]]],
+            output_directory_path: Union[str, PathLike[str]],
+            archive_member_name_patterns: Optional[Sequence[str]] = None,
+            number_of_processes: int = 1,
+            is_archive_deleted: bool = False
+    ) -> None:
+        """
+        Extract the members of independent ZIP or 7z archives, concurrently if more than one process is utilized.
+
+        Each archive is deleted right after its own members are extracted if requested, so the peak disk usage is not
+        the sum of the sizes of all archives and all extracted archive members.
+
+        :parameter archive_file_paths: The paths to the archive files.
+        :parameter output_directory_path: The path to the output directory where the archive members should be
+            extracted.
+        :parameter archive_member_name_patterns: The glob patterns of the names of the archive members that should be
+            extracted. The value `None` indicates that all archive members should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_archive_deleted: The indicator of whether the archives should be deleted after the extraction.
+        """
+
+        pqdm(
+            array=[
+                {
+                    "archive_file_path": archive_file_path,
+                    "output_directory_path": output_directory_path,
+                    "archive_member_name_patterns": archive_member_name_patterns,
+                    "is_archive_deleted": is_archive_deleted,
+                } for archive_file_path in archive_file_paths
+            ],
+            function=DataSourceExtractionUtility.extract_archive,
+            n_jobs=max(1, min(number_of_processes, len(archive_file_paths))),
+            argument_type="kwargs",
+            exception_behaviour="immediate",
+            desc="Extracting the archives",
+            ncols=150
+        )
+
+    @staticmethod
+    @contextmanager
+    def open_archive_member(
+            archive_file_path: Union[str, PathLike[str]],
+            archive_member_name: Optional[str] = None,
+            is_gzip_decompressed: bool = False
+    ) -> Iterator[IO[bytes]]:
+        """
+        Open a member of a ZIP or TAR archive, or the content of a GZIP file, as a binary stream without extracting it.
+
+        :parameter archive_file_path: The path to the archive file.
+        :parameter archive_member_name: The name of the archive member. The value `None` indicates that the archive
+            file is a GZIP file without members.
+        :parameter is_gzip_decompressed: The indicator of whether the archive member is a GZIP file that should be
+            decompressed while it is read.
+
+        :returns: The binary stream of the archive member.
+        """
+
+        with ExitStack() as exit_stack:
+            if archive_member_name is None:
+                yield exit_stack.enter_context(
+                    cm=GzipFile(
+                        filename=archive_file_path
+                    )
+                )
+
+                return
+
+            if Path(archive_file_path).suffix == ".zip":
+                zip_archive_file_handle = exit_stack.enter_context(
+                    cm=ZipFile(
+                        file=archive_file_path
+                    )
+                )
+
+                archive_member_file_handle = exit_stack.enter_context(
+                    cm=zip_archive_file_handle.open(
+                        name=archive_member_name
+                    )
+                )
+
+            elif is_tarfile(archive_file_path):
+                tar_archive_file_handle = exit_stack.enter_context(
+                    cm=TarFile.open(
+                        name=archive_file_path,
+                        mode="r:*"
+                    )
+                )
+
+                archive_member_file_handle = tar_archive_file_handle.extractfile(
+                    member=archive_member_name
+                )
+
+                if archive_member_file_handle is None:
+                    raise ValueError(
+                        "The archive member '{archive_member_name:s}' is not a regular file.".format(
+                            archive_member_name=archive_member_name
+                        )
+                    )
+
+                exit_stack.enter_context(
+                    cm=archive_member_file_handle
+                )
+
+            else:
+                raise ValueError(
+                    "The reading of the archive '{archive_file_path:s}' is not supported.".format(
+                        archive_file_path=Path(archive_file_path).as_posix()
+                    )
+                )
+
+            if is_gzip_decompressed:
+                archive_member_file_handle = exit_stack.enter_context(
+                    cm=GzipFile(
+                        fileobj=archive_member_file_handle
+                    )
+                )
+
+            yield archive_member_file_handle
+
+    @staticmethod
+    def open_input_file(
+            input_directory_path: Union[str, PathLike[str]],
+            input_file_name: str,
+            archive_file_name: Optional[str] = None,
+            archive_member_name: Optional[str] = None,
+            is_gzip_decompressed: bool = False
+    ) -> ContextManager[IO[bytes]]:
+        """
+        Open an input file as a binary stream, either from the input directory or directly from the archive in the
+        input directory that contains it.
+
+        :parameter input_directory_path: The path to the input directory.
+        :parameter input_file_name: The name of the input file if it is extracted to the input directory.
+        :parameter archive_file_name: The name of the archive file that contains the input file. The value `None`
+            indicates that the input file is extracted to the input directory.
+        :parameter archive_member_name: The name of the archive member that contains the input file.
+        :parameter is_gzip_decompressed: The indicator of whether the archive member is a GZIP file that should be
+            decompressed while it is read.
+
+        :returns: The binary stream of the input file.
+        """
+
+        if archive_file_name is None:
+            return open(
+                file=Path(input_directory_path, input_file_name),
+                mode="rb"
+            )
+
+        return DataSourceExtractionUtility.open_archive_member(
+            archive_file_path=Path(input_directory_path, archive_file_name),
+            archive_member_name=archive_member_name,
+            is_gzip_decompressed=is_gzip_decompressed
+        )
@@ -0,0 +1,541 @@
+""" The ``data_source.base.utility`` package ``formatting`` module. """
+
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from re import findall
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from pandas import DataFrame, read_csv
+from pandas.api.types import is_numeric_dtype
+
+from pyarrow import Table, dictionary, float64, int32, int64, string
+from pyarrow.csv import ConvertOptions, ParseOptions, ReadOptions, open_csv
+from pyarrow.csv import read_csv as read_csv_using_pyarrow
+
+from data_source.base.utility.writer import DataSourceDataFrameWriter
+
+
+class DataSourceFormattingUtility:
+    """ The data source formatting utility class. """
+
+    @staticmethod
+    def iterate_file_records(
+            file_path: Union[str, PathLike[str]],
+            record_start_marker: bytes,
+            content_start_marker: Optional[bytes] = None,
+            content_end_marker: Optional[bytes] = None,
+            encoding: str = "utf-8"
+    ) -> Iterator[str]:
+        """
+        Iterate over the records of a text file, each of which starts with a marker.
+
+        The file is memory-mapped and the records are located by their offsets, so only one record at a time is copied
+        into the memory instead of the whole file. The line endings of the records are normalized to `\\n`.
+
+        :parameter file_path: The path to the file.
+        :parameter record_start_marker: The marker that starts each record, which is included in the record.
+        :parameter content_start_marker: The marker after the first occurrence of which the records are located. The
+            value `None` indicates that the records are located from the start of the file.
+        :parameter content_end_marker: The marker before the last occurrence of which the records are located. The value
+            `None` indicates that the records are located until the end of the file.
+        :parameter encoding: The encoding of the file.
+
+        :returns: The iterator of the records of the file.
+        """
+
+        with open(
+            file=file_path,
+            mode="rb"
+        ) as file_handle:
+            try:
+                file_memory_map = mmap(
+                    fileno=file_handle.fileno(),
+                    length=0,
+                    access=ACCESS_READ
+                )
+
+            except ValueError:
+                # The empty files cannot be memory-mapped.
+                return
+
+            with file_memory_map:
+                content_start_offset = 0
+                content_end_offset = len(file_memory_map)
+
+                if content_start_marker is not None:
+                    content_start_offset = file_memory_map.find(content_start_marker)
+
+                    if content_start_offset == -1:
+                        return
+
+                    content_start_offset += len(content_start_marker)
+
+                if content_end_marker is not None:
+                    content_end_offset = file_memory_map.rfind(content_end_marker, content_start_offset)
+
+                    if content_end_offset == -1:
+                        return
+
+                record_start_offset = file_memory_map.find(
+                    record_start_marker,
+                    content_start_offset,
+                    content_end_offset
+                )
+
+                while record_start_offset != -1:
+                    next_record_start_offset = file_memory_map.find(
+                        record_start_marker,
+                        record_start_offset + len(record_start_marker),
+                        content_end_offset
+                    )
+
+                    yield file_memory_map[
+                        record_start_offset:
+                        content_end_offset if next_record_start_offset == -1 else next_record_start_offset
+                    ].decode(
+                        encoding=encoding
+                    ).replace("\r\n", "\n")
+
+                    record_start_offset = next_record_start_offset
+
+    @staticmethod
+    def _get_pyarrow_csv_delimiter(
+            filepath_or_buffer: Any,
+            sep: str
+    ) -> str:
+        """
+        Get the single-character delimiter of a file for the `pyarrow` reader backend.
+
+        The whitespace delimiter `\\s+` is replaced by a single space or tab character only if the leading block of
+        the file shows that its columns are separated by exactly one such character, as the `pyarrow.csv` parser does
+        not support the regular expression delimiters. The remaining rows with additional delimiters are rejected by
+        the parser because their number of columns does not match.
+
+        :parameter filepath_or_buffer: The path to the file or the readable binary buffer of the file.
+        :parameter sep: The delimiter of the file.
+
+        :returns: The single-character delimiter of the file.
+        """
+
+        if sep != r"\s+":
+            return sep
+
+        if hasattr(filepath_or_buffer, "peek"):
+            file_sample = filepath_or_buffer.peek(1024 * 1024)
+
+        else:
+            with open(
+                file=filepath_or_buffer,
+                mode="rb"
+            ) as file_handle:
+                file_sample = file_handle.read(1024 * 1024)
+
+        delimiters = set()
+
+        for file_line in file_sample.splitlines()[:-1] or file_sample.splitlines():
+            if len(file_line) == 0:
+                continue
+
+            if file_line != file_line.strip():
+                delimiters.add(None)
+
+            delimiters.update(
+                findall(rb"\s+", file_line)
+            )
+
+        if len(delimiters) > 1 or not delimiters.issubset({b" ", b"\t", }):
+            raise ValueError(
+                "The reading of the file using the pyarrow reader backend is supported only if the columns of the file "
+                "are separated by a single space or tab character."
+            )
+
+        return delimiters.pop().decode() if len(delimiters) == 1 else " "
+
+    @staticmethod
+    def _get_pyarrow_csv_options(
+            filepath_or_buffer: Any,
+            sep: str = ",",
+            header: Optional[Union[int, str]] = "infer",
+            skiprows: Optional[Union[int, List[int]]] = None,
+            index_col: Optional[int] = None,
+            dtype: Optional[Dict[Union[int, str], str]] = None,
+            low_memory: Optional[bool] = None,
+            **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Get the `pyarrow.csv` options that correspond to the keyword arguments of the `pandas.read_csv` function.
+
+        Only the explicit parse options of the formatters are supported, and the `low_memory` argument is ignored as it
+        only applies to the `pandas` C parser.
+
+        :parameter filepath_or_buffer: The path to the file or the readable binary buffer of the file.
+        :parameter sep: The delimiter of the file, which should be a single character or the whitespace delimiter.
+        :parameter header: The row number of the column names or `None` if the file has no column names.
+        :parameter skiprows: The number of rows or the leading row numbers that should be skipped.
+        :parameter index_col: The column number of the index.
+        :parameter dtype: The data types of the columns, keyed by the names or the numbers of the columns. (_i.e._,
+            category, float64, int64, or string)
+        :parameter low_memory: The indicator of whether the file should be parsed internally in chunks.
+        :parameter kwargs: The unsupported keyword arguments.
+
+        :returns: The `pyarrow.csv` options and the post-processing options.
+        """
+
+        sep = DataSourceFormattingUtility._get_pyarrow_csv_delimiter(
+            filepath_or_buffer=filepath_or_buffer,
+            sep=sep
+        )
+
+        if len(sep) != 1 or len(kwargs) > 0:
+            raise ValueError(
+                "The reading of the file using the pyarrow reader backend is supported only for the single-character "
+                "delimiters and the header, skipped row, index column, and data type arguments."
+            )
+
+        if isinstance(skiprows, list):
+            if skiprows != list(range(len(skiprows))):
+                raise ValueError(
+                    "The reading of the file using the pyarrow reader backend is supported only for the leading "
+                    "skipped rows."
+                )
+
+            skiprows = len(skiprows)
+
+        arrow_data_types = {
+            "category": dictionary(int32(), string()),
+            "float64": float64(),
+            "int64": int64(),
+            "string": string(),
+        }
+
+        column_types = dict()
+
+        for column_name, column_data_type in (dtype or dict()).items():
+            if column_data_type not in arrow_data_types.keys():
+                raise ValueError(
+                    "The reading of the column data type '{column_data_type:s}' using the pyarrow reader backend is "
+                    "not supported.".format(
+                        column_data_type=column_data_type
+                    )
+                )
+
+            column_types[
+                "f{column_number:d}".format(
+                    column_number=column_name
+                ) if header is None else column_name
+            ] = arrow_data_types[column_data_type]
+
+        return {
+            "read_options": ReadOptions(
+                use_threads=True,
+                skip_rows=(skiprows or 0) + (0 if header is None or header == "infer" else header),
+                autogenerate_column_names=header is None
+            ),
+            "parse_options": ParseOptions(
+                delimiter=sep
+            ),
+            "convert_options": ConvertOptions(
+                column_types=column_types,
+                strings_can_be_null=True
+            ),
+            "is_header_generated": header is None,
+            "index_col": index_col,
+            "dtype": dtype,
+        }
+
+    @staticmethod
+    def _convert_pyarrow_table(
+            table: Table,
+            is_header_generated: bool,
+            index_col: Optional[int],
+            dtype: Optional[Dict[Union[int, str], str]] = None
+    ) -> DataFrame:
+        """
+        Convert a `pyarrow` table to a data frame as it would have been read by the `pandas.read_csv` function.
+
+        :parameter table: The table.
+        :parameter is_header_generated: The indicator of whether the column names of the table are generated.
+        :parameter index_col: The column number of the index.
+        :parameter dtype: The data types of the columns, keyed by the names or the numbers of the columns. (_i.e._,
+            category, float64, int64, or string)
+
+        :returns: The data frame.
+        """
+
+        dataframe = table.to_pandas()
+
+        if is_header_generated:
+            dataframe.columns = range(len(dataframe.columns))
+
+        if dtype is not None:
+            dataframe = dataframe.astype(
+                dtype={
+                    column_name: column_data_type
+                    for column_name, column_data_type in dtype.items()
+                    if column_name in dataframe.columns and str(dataframe[column_name].dtype) != column_data_type
+                }
+            )
+
+        if index_col is not None:
+            dataframe = dataframe.set_index(
+                keys=dataframe.columns[index_col]
+            )
+
+        return dataframe
+
+    @staticmethod
+    def read_csv_file(
+            reader_backend: str = "pandas",
+            **kwargs: Any
+    ) -> DataFrame:
+        """
+        Read a CSV file.
+
+        The `pyarrow` reader backend parses the blocks of the file on all of the available CPU cores, but it supports
+        only the single-character delimiters, the whitespace delimiter of the files whose columns are separated by a
+        single space or tab character, and the explicit header and skipped row options.
+
+        :parameter reader_backend: The reader backend. (_i.e._, pandas or pyarrow)
+        :parameter kwargs: The keyword arguments of the `pandas.read_csv` function.
+
+        :returns: The data frame.
+        """
+
+        if reader_backend == "pandas":
+            return read_csv(**kwargs)
+
+        elif reader_backend == "pyarrow":
+            filepath_or_buffer = kwargs.pop("filepath_or_buffer")
+
+            pyarrow_csv_options = DataSourceFormattingUtility._get_pyarrow_csv_options(
+                filepath_or_buffer=filepath_or_buffer,
+                **kwargs
+            )
+
+            return DataSourceFormattingUtility._convert_pyarrow_table(
+                table=read_csv_using_pyarrow(
+                    filepath_or_buffer,
+                    read_options=pyarrow_csv_options["read_options"],
+                    parse_options=pyarrow_csv_options["parse_options"],
+                    convert_options=pyarrow_csv_options["convert_options"]
+                ),
+                is_header_generated=pyarrow_csv_options["is_header_generated"],
+                index_col=pyarrow_csv_options["index_col"],
+                dtype=pyarrow_csv_options["dtype"]
+            )
+
+        else:
+            raise ValueError(
+                "The reader backend '{reader_backend:s}' is not supported.".format(
+                    reader_backend=reader_backend
+                )
+            )
+
+    @staticmethod
+    def _read_csv_chunks(
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            **kwargs: Any
+    ) -> Iterator[DataFrame]:
+        """
+        Read a CSV file in chunks of a fixed number of rows, each of which is parsed with the inference of its own data
+        types.
+
+        :parameter number_of_rows_per_chunk: The number of rows that are read at a time. The value `None` indicates
+            that the whole file should be read as a single chunk.
+        :parameter reader_backend: The reader backend. (_i.e._, pandas or pyarrow)
+        :parameter kwargs: The keyword arguments of the `pandas.read_csv` function.
+
+        :returns: The iterator of the chunks of the file.
+        """
+
+        if number_of_rows_per_chunk is None:
+            yield DataSourceFormattingUtility.read_csv_file(
+                reader_backend=reader_backend,
+                **kwargs
+            )
+
+        elif reader_backend == "pandas":
+            with read_csv(
+                chunksize=number_of_rows_per_chunk,
+                **kwargs
+            ) as dataframe_chunk_reader:
+                yield from dataframe_chunk_reader
+
+        elif reader_backend == "pyarrow":
+            filepath_or_buffer = kwargs.pop("filepath_or_buffer")
+
+            pyarrow_csv_options = DataSourceFormattingUtility._get_pyarrow_csv_options(
+                filepath_or_buffer=filepath_or_buffer,
+                **kwargs
+            )
+
+            record_batches, number_of_rows = list(), 0
+
+            with open_csv(
+                filepath_or_buffer,
+                read_options=pyarrow_csv_options["read_options"],
+                parse_options=pyarrow_csv_options["parse_options"],
+                convert_options=pyarrow_csv_options["convert_options"]
+            ) as record_batch_reader:
+                for record_batch in record_batch_reader:
+                    record_batches.append(
+                        record_batch
+                    )
+
+                    number_of_rows += record_batch.num_rows
+
+                    if number_of_rows >= number_of_rows_per_chunk:
+                        yield DataSourceFormattingUtility._convert_pyarrow_table(
+                            table=Table.from_batches(
+                                batches=record_batches
+                            ),
+                            is_header_generated=pyarrow_csv_options["is_header_generated"],
+                            index_col=pyarrow_csv_options["index_col"],
+                            dtype=pyarrow_csv_options["dtype"]
+                        )
+
+                        record_batches, number_of_rows = list(), 0
+
+                if len(record_batches) > 0:
+                    yield DataSourceFormattingUtility._convert_pyarrow_table(
+                        table=Table.from_batches(
+                            batches=record_batches
+                        ),
+                        is_header_generated=pyarrow_csv_options["is_header_generated"],
+                        index_col=pyarrow_csv_options["index_col"],
+                        dtype=pyarrow_csv_options["dtype"]
+                    )
+
+        else:
+            raise ValueError(
+                "The reader backend '{reader_backend:s}' is not supported.".format(
+                    reader_backend=reader_backend
+                )
+            )
+
+    @staticmethod
+    def _pin_dataframe_chunk_data_types(
+            dataframe_chunk: DataFrame,
+            column_data_types: Dict[Union[int, str], Any]
+    ) -> DataFrame:
+        """
+        Pin the data types of the columns of a data frame chunk to the data types of the columns of the first chunk.
+
+        The columns of the chunk whose values cannot be converted to the data types of the first chunk are converted
+        to strings, except for the numeric columns, which are left to be converted by the writer of the output file, and
+        the categorical columns, which keep their own categories.
+
+        :parameter dataframe_chunk: The data frame chunk.
+        :parameter column_data_types: The data types of the columns of the first chunk.
+
+        :returns: The data frame chunk with the pinned data types of the columns.
+        """
+
+        for column_name, column_data_type in column_data_types.items():
+            if column_name not in dataframe_chunk.columns or dataframe_chunk[column_name].dtype == column_data_type:
+                continue
+
+            if is_numeric_dtype(column_data_type) and is_numeric_dtype(dataframe_chunk[column_name].dtype):
+                continue
+
+            if str(column_data_type) == "category":
+                # The categories of the chunks differ, so only the categorical data type itself is pinned.
+                column_data_type = "category"
+
+                if str(dataframe_chunk[column_name].dtype) == "category":
+                    continue
+
+            try:
+                dataframe_chunk[column_name] = dataframe_chunk[column_name].astype(
+                    dtype=column_data_type
+                )
+
+            except (TypeError, ValueError):
+                dataframe_chunk[column_name] = dataframe_chunk[column_name].astype(
+                    dtype="string"
+                )
+
+        return dataframe_chunk
+
+    @staticmethod
+    def read_csv_chunks(
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            **kwargs: Any
+    ) -> Iterator[DataFrame]:
+        """
+        Read a CSV file in chunks of a fixed number of rows.
+
+        Only one chunk at a time is held in the memory, so the peak memory usage of the formatting of a large file is
+        bounded by the number of rows per chunk instead of the size of the file. The `pyarrow` reader backend streams
+        the record batches of the file, which are combined into chunks of at least the number of rows per chunk.
+
+        The data types of the columns of the following chunks are pinned to the data types of the columns of the first
+        chunk, so the chunks can be appended to the same Parquet or Feather file. The columns of which all values are
+        missing in the first chunk are read as strings, as their data types cannot be inferred.
+
+        :parameter number_of_rows_per_chunk: The number of rows that are read at a time. The value `None` indicates
+            that the whole file should be read as a single chunk.
+        :parameter reader_backend: The reader backend. (_i.e._, pandas or pyarrow)
+        :parameter kwargs: The keyword arguments of the `pandas.read_csv` function.
+
+        :returns: The iterator of the chunks of the file.
+        """
+
+        column_data_types = None
+
+        for dataframe_chunk in DataSourceFormattingUtility._read_csv_chunks(
+            number_of_rows_per_chunk=number_of_rows_per_chunk,
+            reader_backend=reader_backend,
+            **kwargs
+        ):
+            if number_of_rows_per_chunk is None:
+                yield dataframe_chunk
+
+                continue
+
+            if column_data_types is None:
+                for column_name in dataframe_chunk.columns:
+                    if dataframe_chunk[column_name].isna().all() and \
+                            str(dataframe_chunk[column_name].dtype) not in ["category", "string", ]:
+                        dataframe_chunk[column_name] = dataframe_chunk[column_name].astype(
+                            dtype="string"
+                        )
+
+                column_data_types = dataframe_chunk.dtypes.to_dict()
+
+            else:
+                dataframe_chunk = DataSourceFormattingUtility._pin_dataframe_chunk_data_types(
+                    dataframe_chunk=dataframe_chunk,
+                    column_data_types=column_data_types
+                )
+
+            yield dataframe_chunk
+
+    @staticmethod
+    def write_dataframe(
+            dataframe: DataFrame,
+            output_file_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
+    ) -> None:
+        """
+        Write a formatted data frame to an output file.
+
+        :parameter dataframe: The data frame.
+        :parameter output_file_path: The path to the output file. The extension of the file is replaced by the
+            extension of the output file format.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
+        """
+
+        with DataSourceDataFrameWriter(
+            output_file_path=output_file_path,
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
+        ) as dataframe_writer:
+            dataframe_writer.write(
+                dataframe=dataframe
+            )
@@ -0,0 +1,115 @@
+""" The ``data_source.base.utility`` package ``rate_limiting`` module. """
+
+from threading import Lock
+from time import monotonic, sleep
+from typing import Optional
+
+
+class DataSourceTokenBucket:
+    """ The data source token bucket class. """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter rate: The number of tokens that are added to the bucket per second.
+        :parameter capacity: The maximum number of tokens in the bucket. The value `None` indicates that the capacity
+            should be equal to the rate, which allows bursts of one second.
+        """
+
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+
+        self._number_of_tokens = self.capacity
+        self._last_refill_time = monotonic()
+        self._lock = Lock()
+
+    @property
+    def rate(
+            self
+    ) -> float:
+        """
+        Get the value of the number of tokens that are added to the bucket per second.
+
+        :returns: The value of the number of tokens that are added to the bucket per second.
+        """
+
+        return self._rate
+
+    @rate.setter
+    def rate(
+            self,
+            value: float
+    ) -> None:
+        """
+        Set the value of the number of tokens that are added to the bucket per second.
+
+        :parameter value: The value of the number of tokens that are added to the bucket per second.
+        """
+
+        if value <= 0:
+            raise ValueError(
+                "The rate of the token bucket must be positive, not {value:f}.".format(
+                    value=value
+                )
+            )
+
+        self._rate = value
+
+    @property
+    def capacity(
+            self
+    ) -> float:
+        """
+        Get the value of the maximum number of tokens in the bucket.
+
+        :returns: The value of the maximum number of tokens in the bucket.
+        """
+
+        return self._capacity
+
+    @capacity.setter
+    def capacity(
+            self,
+            value: float
+    ) -> None:
+        """
+        Set the value of the maximum number of tokens in the bucket.
+
+        :parameter value: The value of the maximum number of tokens in the bucket.
+        """
+
+        self._capacity = value
+
+    def consume(
+            self,
+            number_of_tokens: float
+    ) -> None:
+        """
+        Consume tokens from the bucket, blocking until the tokens are available.
+
+        The tokens are reserved before waiting, so the threads that share the bucket are served in the order of their
+        requests and a request larger than the capacity of the bucket is not blocked indefinitely.
+
+        :parameter number_of_tokens: The number of tokens to consume.
+        """
+
+        with self._lock:
+            current_time = monotonic()
+
+            self._number_of_tokens = min(
+                self.capacity,
+                self._number_of_tokens + (current_time - self._last_refill_time) * self.rate
+            )
+
+            self._last_refill_time = current_time
+            self._number_of_tokens -= number_of_tokens
+
+            waiting_time = max(0.0, -self._number_of_tokens / self.rate)
+
+        if waiting_time > 0.0:
+            sleep(waiting_time)
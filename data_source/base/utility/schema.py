@@ -0,0 +1,270 @@
+""" The ``data_source.base.utility`` package ``schema`` module. """
+
+from fnmatch import fnmatch
+from typing import Dict, Optional, Union
+
+from pandas import DataFrame
+
+
+class DataSourceSchemaRegistry:
+    """
+    The data source schema registry class.
+
+    The schemas declare the names and data types of the columns of the input and output files of the versions of the
+    data sources, so the input files are parsed without the inference of the data types, and the low-cardinality
+    columns are stored as categorical columns. The schemas are keyed by the name of the data source and the glob
+    pattern of the version, and the versions without a schema are parsed using the inference of the data types.
+    """
+
+    _data_types = [
+        "category",
+        "float64",
+        "int64",
+        "string",
+    ]
+
+    _schemas = {
+        "chembl": {
+            "v_release_*": {
+                "input_column_data_types": {
+                    "chembl_id": "string",
+                    "canonical_smiles": "string",
+                    "standard_inchi": "string",
+                    "standard_inchi_key": "string",
+                },
+                "output_column_data_types": {
+                    "chembl_id": "string",
+                    "canonical_smiles": "string",
+                    "standard_inchi": "string",
+                    "standard_inchi_key": "string",
+                    "file_name": "category",
+                },
+            },
+        },
+        "coconut": {
+            "v_2_0_*by_20241126_chandrasekhar_v_et_al": {
+                "input_column_data_types": {
+                    "identifier": "string",
+                    "canonical_smiles": "string",
+                    "standard_inchi": "string",
+                    "standard_inchi_key": "string",
+                },
+                "output_column_data_types": {
+                    "identifier": "string",
+                    "canonical_smiles": "string",
+                    "standard_inchi": "string",
+                    "standard_inchi_key": "string",
+                    "file_name": "category",
+                },
+            },
+        },
+        "crd": {
+            "v_reaction_smiles_*": {
+                "input_column_data_types": {
+                    0: "string",
+                },
+                "output_column_data_types": {
+                    "reaction_smiles": "string",
+                    "file_name": "category",
+                },
+            },
+        },
+        "rhea": {
+            "v_release_*": {
+                "input_column_data_types": {
+                    0: "int64",
+                    1: "string",
+                },
+                "output_column_data_types": {
+                    "id": "int64",
+                    "reaction_smiles": "string",
+                    "file_name": "category",
+                },
+            },
+        },
+        "uspto": {
+            "v_1976_to_2013_rsmi_by_20121009_lowe_d_m": {
+                "input_column_data_types": {
+                    0: "string",
+                    1: "string",
+                    2: "string",
+                },
+                "output_column_data_types": {
+                    "ReactionSmiles": "string",
+                    "PatentNumber": "string",
+                    "ParagraphNum": "string",
+                    "FileName": "category",
+                },
+            },
+            "v_50k_by_20141226_schneider_n_et_al": {
+                "input_column_data_types": None,
+                "output_column_data_types": {
+                    "reaction_smiles": "string",
+                    "patent_number": "string",
+                    "reaction_class_id": "category",
+                    "reaction_class_name": "category",
+                    "file_name": "category",
+                },
+            },
+            "v_1976_to_2016_cml_by_20121009_lowe_d_m": {
+                "input_column_data_types": None,
+                "output_column_data_types": {
+                    "year": "category",
+                    "document_id": "string",
+                    "paragraph_number": "string",
+                    "heading_text": "string",
+                    "paragraph_text": "string",
+                    "reaction_smiles": "string",
+                    "file_name": "category",
+                },
+            },
+            "v_1976_to_2016_rsmi_by_20121009_lowe_d_m": {
+                "input_column_data_types": {
+                    "ReactionSmiles": "string",
+                    "PatentNumber": "string",
+                    "ParagraphNum": "string",
+                    "Year": "category",
+                    "TextMinedYield": "string",
+                    "CalculatedYield": "string",
+                },
+                "output_column_data_types": {
+                    "ReactionSmiles": "string",
+                    "PatentNumber": "string",
+                    "ParagraphNum": "string",
+                    "Year": "category",
+                    "TextMinedYield": "string",
+                    "CalculatedYield": "string",
+                    "FileName": "category",
+                },
+            },
+        },
+        "zinc": {
+            "v_*": {
+                "input_column_data_types": {
+                    0: "string",
+                    1: "string",
+                },
+                "output_column_data_types": {
+                    "smiles": "string",
+                    "id": "string",
+                    "file_name": "category",
+                },
+            },
+        },
+    }
+
+    @staticmethod
+    def register_schema(
+            data_source_name: str,
+            version_pattern: str,
+            input_column_data_types: Optional[Dict[Union[int, str], str]] = None,
+            output_column_data_types: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Register the schema of the versions of a data source.
+
+        The schema replaces any schema that is already registered for the same glob pattern of the versions, and it
+        takes precedence over the schemas of the other glob patterns that match the same versions.
+
+        :parameter data_source_name: The name of the data source.
+        :parameter version_pattern: The glob pattern of the versions of the data source.
+        :parameter input_column_data_types: The data types of the columns of the input files, keyed by the names or
+            the numbers of the columns. The value `None` indicates that the data types should be inferred.
+        :parameter output_column_data_types: The data types of the columns of the output files, keyed by the names of
+            the columns. The value `None` indicates that the inferred data types should be kept.
+        """
+
+        for column_data_types in [input_column_data_types, output_column_data_types, ]:
+            for column_data_type in (column_data_types or dict()).values():
+                if column_data_type not in DataSourceSchemaRegistry._data_types:
+                    raise ValueError(
+                        "The column data type '{column_data_type:s}' is not supported.".format(
+                            column_data_type=column_data_type
+                        )
+                    )
+
+        data_source_schemas = DataSourceSchemaRegistry._schemas.setdefault(data_source_name, dict())
+
+        data_source_schemas.pop(version_pattern, None)
+
+        data_source_schemas[version_pattern] = {
+            "input_column_data_types": input_column_data_types,
+            "output_column_data_types": output_column_data_types,
+        }
+
+    @staticmethod
+    def _get_schema(
+            data_source_name: str,
+            version: str
+    ) -> Dict[str, Optional[Dict[Union[int, str], str]]]:
+        """
+        Get the schema of a version of a data source.
+
+        :parameter data_source_name: The name of the data source.
+        :parameter version: The version of the data source.
+
+        :returns: The schema of the version of the data source.
+        """
+
+        data_source_schemas = DataSourceSchemaRegistry._schemas.get(data_source_name, dict())
+
+        for version_pattern in reversed(data_source_schemas.keys()):
+            if fnmatch(version, version_pattern):
+                return data_source_schemas[version_pattern]
+
+        return {
+            "input_column_data_types": None,
+            "output_column_data_types": None,
+        }
+
+    @staticmethod
+    def get_input_column_data_types(
+            data_source_name: str,
+            version: str
+    ) -> Optional[Dict[Union[int, str], str]]:
+        """
+        Get the data types of the columns of the input files of a version of a data source.
+
+        :parameter data_source_name: The name of the data source.
+        :parameter version: The version of the data source.
+
+        :returns: The data types of the columns of the input files, which should be passed as the `dtype` argument of
+            the `pandas.read_csv` function. The value `None` indicates that the data types should be inferred.
+        """
+
+        return DataSourceSchemaRegistry._get_schema(
+            data_source_name=data_source_name,
+            version=version
+        )["input_column_data_types"]
+
+    @staticmethod
+    def apply_output_column_data_types(
+            dataframe: DataFrame,
+            data_source_name: str,
+            version: str
+    ) -> DataFrame:
+        """
+        Apply the data types of the columns of the output files of a version of a data source to a data frame.
+
+        :parameter dataframe: The data frame.
+        :parameter data_source_name: The name of the data source.
+        :parameter version: The version of the data source.
+
+        :returns: The data frame with the data types of the columns of the output files.
+        """
+
+        output_column_data_types = DataSourceSchemaRegistry._get_schema(
+            data_source_name=data_source_name,
+            version=version
+        )["output_column_data_types"]
+
+        if output_column_data_types is None:
+            return dataframe
+
+        return dataframe.astype(
+            dtype={
+                column_name: column_data_type
+                for column_name, column_data_type in output_column_data_types.items()
+                if column_name in dataframe.columns and dataframe[column_name].dtype != column_data_type
+            }
+        )
@@ -0,0 +1,538 @@
+""" The ``data_source.base.utility`` package ``writer`` module. """
+
+from os import PathLike
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Type, Union
+
+from pandas import DataFrame, read_csv
+
+from pyarrow import (
+    ArrowInvalid, ArrowNotImplementedError, ArrowTypeError, Schema, Table, dictionary, int32, large_string, nulls,
+    schema
+)
+from pyarrow.ipc import IpcWriteOptions, new_file, open_file
+from pyarrow.parquet import ParquetFile, ParquetWriter
+from pyarrow.types import is_dictionary, is_null, is_string
+
+
+class DataSourceDataFrameWriter:
+    """
+    The data source data frame writer class.
+
+    The data frames are appended to a single CSV, Parquet, or Arrow IPC (Feather) file, so a formatted dataset can be
+    written in chunks without being concatenated in the memory. The Parquet and Feather files are compressed using
+    Zstandard, and the columns and schema of the file are determined by the first data frame, to which the following
+    data frames are converted. As in the case of the concatenation of the data frames, the missing columns of the
+    following data frames are filled with missing values, and their new columns are appended to the columns of the file,
+    which is rewritten with the missing values of the new columns in its already written rows.
+    """
+
+    _output_file_extensions = {
+        "csv": ".csv",
+        "parquet": ".parquet",
+        "feather": ".feather",
+    }
+
+    _number_of_rows_per_rewritten_chunk = 100000
+
+    def __init__(
+            self,
+            output_file_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None,
+            is_empty_output_allowed: bool = True
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter output_file_path: The path to the output file. The extension of the file is replaced by the
+            extension of the output file format.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
+        :parameter is_empty_output_allowed: The indicator of whether the writer can be closed without any data frame
+            being written, as opposed to the concatenation of no data frames.
+        """
+
+        self.output_file_format = output_file_format
+        self.output_file_path = output_file_path
+        self.number_of_rows_per_row_group = number_of_rows_per_row_group
+        self.is_empty_output_allowed = is_empty_output_allowed
+
+        self._column_names = None
+        self._schema = None
+        self._table_writer = None
+        self._number_of_written_rows = None
+
+    @property
+    def output_file_format(
+            self
+    ) -> str:
+        """
+        Get the value of the format of the output file.
+
+        :returns: The value of the format of the output file.
+        """
+
+        return self._output_file_format
+
+    @output_file_format.setter
+    def output_file_format(
+            self,
+            value: str
+    ) -> None:
+        """
+        Set the value of the format of the output file.
+
+        :parameter value: The value of the format of the output file.
+        """
+
+        if value not in DataSourceDataFrameWriter._output_file_extensions.keys():
+            raise ValueError(
+                "The output file format '{output_file_format:s}' is not supported.".format(
+                    output_file_format=value
+                )
+            )
+
+        self._output_file_format = value
+
+    @property
+    def output_file_path(
+            self
+    ) -> Path:
+        """
+        Get the value of the path to the output file.
+
+        :returns: The value of the path to the output file.
+        """
+
+        return self._output_file_path
+
+    @output_file_path.setter
+    def output_file_path(
+            self,
+            value: Union[str, PathLike[str]]
+    ) -> None:
+        """
+        Set the value of the path to the output file.
+
+        :parameter value: The value of the path to the output file.
+        """
+
+        self._output_file_path = Path(value).with_suffix(
+            DataSourceDataFrameWriter._output_file_extensions[self.output_file_format]
+        )
+
+    @property
+    def number_of_rows_per_row_group(
+            self
+    ) -> Optional[int]:
+        """
+        Get the value of the maximum number of rows per Parquet row group or Feather record batch.
+
+        :returns: The value of the maximum number of rows per Parquet row group or Feather record batch.
+        """
+
+        return self._number_of_rows_per_row_group
+
+    @number_of_rows_per_row_group.setter
+    def number_of_rows_per_row_group(
+            self,
+            value: Optional[int]
+    ) -> None:
+        """
+        Set the value of the maximum number of rows per Parquet row group or Feather record batch.
+
+        :parameter value: The value of the maximum number of rows per Parquet row group or Feather record batch.
+        """
+
+        self._number_of_rows_per_row_group = value
+
+    @property
+    def is_empty_output_allowed(
+            self
+    ) -> bool:
+        """
+        Get the value of the indicator of whether the writer can be closed without any data frame being written.
+
+        :returns: The value of the indicator of whether the writer can be closed without any data frame being written.
+        """
+
+        return self._is_empty_output_allowed
+
+    @is_empty_output_allowed.setter
+    def is_empty_output_allowed(
+            self,
+            value: bool
+    ) -> None:
+        """
+        Set the value of the indicator of whether the writer can be closed without any data frame being written.
+
+        :parameter value: The value of the indicator of whether the writer can be closed without any data frame being
+            written.
+        """
+
+        self._is_empty_output_allowed = value
+
+    def __enter__(
+            self
+    ) -> "DataSourceDataFrameWriter":
+        """
+        The `__enter__` method of the class.
+
+        :returns: The data frame writer.
+        """
+
+        return self
+
+    def __exit__(
+            self,
+            exception_type: Optional[Type[BaseException]],
+            exception: Optional[BaseException],
+            exception_traceback: Optional[TracebackType]
+    ) -> None:
+        """
+        The `__exit__` method of the class.
+
+        If an exception is raised while the data frames are written, the incomplete output file is deleted.
+        Otherwise, if no data frame is written and the empty output is not allowed, an exception is raised.
+
+        :parameter exception_type: The type of the exception.
+        :parameter exception: The exception.
+        :parameter exception_traceback: The traceback of the exception.
+        """
+
+        self.close()
+
+        if exception_type is not None:
+            self.output_file_path.unlink(
+                missing_ok=True
+            )
+
+        elif self._number_of_written_rows is None and not self.is_empty_output_allowed:
+            raise ValueError(
+                "No data frames were written to the output file '{path:s}'.".format(
+                    path=self.output_file_path.as_posix()
+                )
+            )
+
+    @staticmethod
+    def _get_schema(
+            table: Table,
+            output_file_format: str
+    ) -> Schema:
+        """
+        Get the schema of the output file from the first table.
+
+        The string columns and the columns of which all values are missing in the first table are stored as large
+        strings, so the values of any type of the following tables can be stored as well. The categorical columns are
+        stored as their values in the Feather files, as the Arrow IPC file format does not support the different
+        dictionaries of the following tables. Otherwise, the indices of the categorical columns are stored as 32-bit
+        integers, so the following tables can have more categories than the first table.
+
+        :parameter table: The first table.
+        :parameter output_file_format: The format of the output file.
+
+        :returns: The schema of the output file.
+        """
+
+        fields = list()
+
+        for field in table.schema:
+            if is_dictionary(field.type) and output_file_format == "feather":
+                field = field.with_type(field.type.value_type)
+
+            elif is_dictionary(field.type):
+                field = field.with_type(dictionary(
+                    index_type=int32(),
+                    value_type=large_string() if is_string(field.type.value_type) else field.type.value_type,
+                    ordered=field.type.ordered
+                ))
+
+            if is_null(field.type) or is_string(field.type):
+                field = field.with_type(large_string())
+
+            fields.append(
+                field
+            )
+
+        return schema(
+            fields=fields
+        )
+
+    def _cast_table(
+            self,
+            table: Table
+    ) -> Table:
+        """
+        Cast a table to the schema of the output file.
+
+        :parameter table: The table.
+
+        :returns: The table with the schema of the output file.
+        """
+
+        columns = list()
+
+        for column_index, field in enumerate(self._schema):
+            column = table.column(column_index)
+
+            # The columns that are missing from the data frame are filled with missing values of any type.
+            if column.type != field.type and column.null_count == len(column):
+                column = nulls(
+                    size=len(column),
+                    type=field.type
+                )
+
+            # The indices of the categorical columns are also converted, as their width depends on the number of the
+            # categories of each table.
+            elif column.type != field.type:
+                try:
+                    column = column.cast(
+                        target_type=field.type
+                    )
+
+                except (ArrowInvalid, ArrowNotImplementedError, ArrowTypeError) as exception_handle:
+                    raise ValueError(
+                        "The column '{column_name:s}' of the type '{column_type:s}' cannot be converted to the type "
+                        "'{field_type:s}' of the column in the output file '{path:s}'.".format(
+                            column_name=str(field.name),
+                            column_type=str(column.type),
+                            field_type=str(field.type),
+                            path=self.output_file_path.as_posix()
+                        )
+                    ) from exception_handle
+
+            columns.append(
+                column
+            )
+
+        return Table.from_arrays(
+            arrays=columns,
+            schema=self._schema
+        )
+
+    def _append_columns(
+            self,
+            dataframe: DataFrame
+    ) -> None:
+        """
+        Append the new columns of a data frame to the columns of the output file.
+
+        The output file is renamed and rewritten in chunks, in which the new columns are filled with missing values.
+
+        :parameter dataframe: The data frame.
+        """
+
+        written_column_names = self._column_names
+
+        self._column_names = written_column_names + [
+            column_name for column_name in dataframe.columns if column_name not in written_column_names
+        ]
+
+        temporary_output_file_path = self.output_file_path.with_name(
+            "{file_name:s}.tmp".format(
+                file_name=self.output_file_path.name
+            )
+        )
+
+        self.close()
+
+        self.output_file_path.replace(
+            target=temporary_output_file_path
+        )
+
+        try:
+            if self.output_file_format == "csv":
+                DataFrame(
+                    columns=self._column_names
+                ).to_csv(
+                    path_or_buf=self.output_file_path,
+                    index=False
+                )
+
+                for dataframe_chunk in read_csv(
+                    filepath_or_buffer=temporary_output_file_path,
+                    header=0,
+                    dtype=str,
+                    keep_default_na=False,
+                    chunksize=DataSourceDataFrameWriter._number_of_rows_per_rewritten_chunk
+                ):
+                    dataframe_chunk.columns = written_column_names
+
+                    dataframe_chunk.reindex(
+                        columns=self._column_names
+                    ).to_csv(
+                        path_or_buf=self.output_file_path,
+                        mode="a",
+                        header=False,
+                        index=False
+                    )
+
+            else:
+                self._schema = schema(
+                    fields=list(self._schema) + list(DataSourceDataFrameWriter._get_schema(
+                        table=Table.from_pandas(
+                            df=dataframe[self._column_names[len(written_column_names):]],
+                            preserve_index=False
+                        ),
+                        output_file_format=self.output_file_format
+                    ))
+                )
+
+                self._open_table_writer()
+
+                with open(
+                    file=temporary_output_file_path,
+                    mode="rb"
+                ) as temporary_output_file_handle:
+                    if self.output_file_format == "parquet":
+                        record_batches = ParquetFile(
+                            source=temporary_output_file_handle
+                        ).iter_batches(
+                            batch_size=DataSourceDataFrameWriter._number_of_rows_per_rewritten_chunk
+                        )
+
+                    else:
+                        record_batch_file_reader = open_file(
+                            source=temporary_output_file_handle
+                        )
+
+                        record_batches = (
+                            record_batch_file_reader.get_batch(record_batch_index)
+                            for record_batch_index in range(record_batch_file_reader.num_record_batches)
+                        )
+
+                    for record_batch in record_batches:
+                        self._write_table(
+                            table=Table.from_arrays(
+                                arrays=list(record_batch.columns) + [
+                                    nulls(
+                                        size=record_batch.num_rows,
+                                        type=field.type
+                                    ) for field in list(self._schema)[len(written_column_names):]
+                                ],
+                                schema=self._schema
+                            )
+                        )
+
+        finally:
+            temporary_output_file_path.unlink(
+                missing_ok=True
+            )
+
+    def _open_table_writer(
+            self
+    ) -> None:
+        """ Open the Parquet or Feather writer of the output file using the schema of the output file. """
+
+        if self.output_file_format == "parquet":
+            self._table_writer = ParquetWriter(
+                where=self.output_file_path,
+                schema=self._schema,
+                compression="zstd"
+            )
+
+        else:
+            self._table_writer = new_file(
+                sink=self.output_file_path,
+                schema=self._schema,
+                options=IpcWriteOptions(
+                    compression="zstd"
+                )
+            )
+
+    def _write_table(
+            self,
+            table: Table
+    ) -> None:
+        """
+        Write a table with the schema of the output file using the Parquet or Feather writer.
+
+        :parameter table: The table.
+        """
+
+        if self.output_file_format == "parquet":
+            self._table_writer.write_table(
+                table=table,
+                row_group_size=self.number_of_rows_per_row_group
+            )
+
+        else:
+            self._table_writer.write_table(
+                table=table,
+                max_chunksize=self.number_of_rows_per_row_group
+            )
+
+    def write(
+            self,
+            dataframe: DataFrame
+    ) -> None:
+        """
+        Append a data frame to the output file.
+
+        :parameter dataframe: The data frame.
+        """
+
+        if self._column_names is None:
+            self._column_names = dataframe.columns.tolist()
+
+        elif dataframe.columns.tolist() != self._column_names:
+            if not set(dataframe.columns).issubset(self._column_names):
+                self._append_columns(
+                    dataframe=dataframe
+                )
+
+            dataframe = dataframe.reindex(
+                columns=self._column_names
+            )
+
+        if self.output_file_format == "csv":
+            dataframe.to_csv(
+                path_or_buf=self.output_file_path,
+                mode="w" if self._number_of_written_rows is None else "a",
+                header=self._number_of_written_rows is None,
+                index=False
+            )
+
+        else:
+            try:
+                table = Table.from_pandas(
+                    df=dataframe,
+                    preserve_index=False
+                )
+
+            except (ArrowInvalid, ArrowTypeError) as exception_handle:
+                raise ValueError(
+                    "The data frame cannot be converted to a table of the output file '{path:s}'. {error:s}".format(
+                        path=self.output_file_path.as_posix(),
+                        error=str(exception_handle)
+                    )
+                ) from exception_handle
+
+            if self._table_writer is None:
+                self._schema = DataSourceDataFrameWriter._get_schema(
+                    table=table,
+                    output_file_format=self.output_file_format
+                )
+
+                self._open_table_writer()
+
+            self._write_table(
+                table=self._cast_table(
+                    table=table
+                )
+            )
+
+        self._number_of_written_rows = (self._number_of_written_rows or 0) + len(dataframe)
+
+    def close(
+            self
+    ) -> None:
+        """ Close the output file. """
+
+        if self._table_writer is not None:
+            self._table_writer.close()
+
+            self._table_writer = None
@@ -30,14 +30,14 @@ class ChEMBLCompoundDatabase(DataSourceBase):
         try:
             http_get_request_url = "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
 
-            http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_response_text = DataSourceDownloadUtility.get_http_response_text(
                 http_get_request_url=http_get_request_url
             )
 
             latest_release_number = int(
                 search(
                     pattern=r"Release:\s*chembl_(\d+)",
-                    string=http_get_request_response.text
+                    string=http_get_request_response_text
                 ).group(1)
             )
 
@@ -57,6 +57,36 @@ class ChEMBLCompoundDatabase(DataSourceBase):
 
             raise
 
+    def _is_streaming_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the database can be formatted directly from the download stream.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database can be formatted directly from the download
+            stream.
+        """
+
+        return version.startswith("v_release")
+
+    def _is_chunked_formatting_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the database is formatted in chunks of the number of rows that is
+        specified by the `number_of_rows_per_chunk` keyword argument.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database is formatted in chunks.
+        """
+
+        return version.startswith("v_release")
+
     def download(
             self,
             version: str,
@@ -81,10 +111,12 @@ class ChEMBLCompoundDatabase(DataSourceBase):
                         )
                     )
 
-                if version.startswith("v_release"):
+                if version.startswith("v_release") and not kwargs.get("is_streaming_enabled", False):
                     ChEMBLCompoundDatabaseDownloadUtility.download_v_release(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -139,11 +171,15 @@ class ChEMBLCompoundDatabase(DataSourceBase):
                         )
                     )
 
-                if version.startswith("v_release"):
+                if version.startswith("v_release") and not (
+                    kwargs.get("is_streaming_enabled", False) or kwargs.get("is_virtual_extraction_enabled", False)
+                ):
                     ChEMBLCompoundDatabaseExtractionUtility.extract_v_release(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False)
                     )
 
                 if self.logger is not None:
@@ -199,11 +235,26 @@ class ChEMBLCompoundDatabase(DataSourceBase):
                     )
 
                 if version.startswith("v_release"):
-                    ChEMBLCompoundDatabaseFormattingUtility.format_v_release(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+                    if kwargs.get("is_streaming_enabled", False):
+                        ChEMBLCompoundDatabaseFormattingUtility.format_v_release_from_stream(
+                            version=version,
+                            output_directory_path=output_directory_path,
+                            number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                            output_file_format=kwargs.get("output_file_format", "csv"),
+                            number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
+                        )
+
+                    else:
+                        ChEMBLCompoundDatabaseFormattingUtility.format_v_release(
+                            version=version,
+                            input_directory_path=input_directory_path,
+                            output_directory_path=output_directory_path,
+                            is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                            is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                            number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                            output_file_format=kwargs.get("output_file_format", "csv"),
+                            number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
+                        )
 
                 if self.logger is not None:
                     self.logger.info(
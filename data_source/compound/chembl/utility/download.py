@@ -1,7 +1,8 @@
 """ The ``data_source.compound.chembl.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -10,15 +11,15 @@ class ChEMBLCompoundDatabaseDownloadUtility:
     """ The `ChEMBL <https://www.ebi.ac.uk/chembl>`_ chemical compound database download utility class. """
 
     @staticmethod
-    def download_v_release(
-            version: str,
-            output_directory_path: Union[str, PathLike[str]]
-    ) -> None:
+    def get_v_release_file_url_and_name(
+            version: str
+    ) -> Tuple[str, str]:
         """
-        Download the data from a `v_release_*` version of the database.
+        Get the URL and name of the file of a `v_release_*` version of the database.
 
         :parameter version: The version of the database.
-        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+
+        :returns: The URL and name of the file.
         """
 
         release_number = version.split(
@@ -36,8 +37,35 @@ class ChEMBLCompoundDatabaseDownloadUtility:
             file_name=file_name
         )
 
+        return file_url, file_name
+
+    @staticmethod
+    def download_v_release(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> None:
+        """
+        Download the data from a `v_release_*` version of the database.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+        """
+
+        file_url, file_name = ChEMBLCompoundDatabaseDownloadUtility.get_v_release_file_url_and_name(
+            version=version
+        )
+
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            number_of_segments=4,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
@@ -2,10 +2,9 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
-from gzip import GzipFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
 
 
 class ChEMBLCompoundDatabaseExtractionUtility:
@@ -15,7 +14,9 @@ class ChEMBLCompoundDatabaseExtractionUtility:
     def extract_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False
     ) -> None:
         """
         Extract the data from a `v_release_*` version of the database.
@@ -23,6 +24,9 @@ class ChEMBLCompoundDatabaseExtractionUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after the
+            extraction.
         """
 
         input_file_name = "chembl_{release_number:s}_chemreps.txt.gz".format(
@@ -33,14 +37,9 @@ class ChEMBLCompoundDatabaseExtractionUtility:
 
         output_file_name = input_file_name[:-3]
 
-        with GzipFile(
-            filename=Path(input_directory_path, input_file_name)
-        ) as gzip_archive_file_handle:
-            with open(
-                file=Path(output_directory_path, output_file_name),
-                mode="wb"
-            ) as destination_file_handle:
-                copyfileobj(
-                    fsrc=gzip_archive_file_handle,
-                    fdst=destination_file_handle
-                )
+        DataSourceExtractionUtility.decompress_gzip_file(
+            input_file_path=Path(input_directory_path, input_file_name),
+            output_file_path=Path(output_directory_path, output_file_name),
+            number_of_threads=number_of_processes,
+            is_input_file_deleted=is_input_file_deleted
+        )
@@ -3,9 +3,16 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
-from pandas import read_csv
+from gzip import GzipFile
+
+from data_source.base.utility.download import DataSourceDownloadUtility
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
+from data_source.compound.chembl.utility.download import ChEMBLCompoundDatabaseDownloadUtility
 
 
 class ChEMBLCompoundDatabaseFormattingUtility:
@@ -15,7 +22,12 @@ class ChEMBLCompoundDatabaseFormattingUtility:
     def format_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            is_input_file_deleted: bool = False,
+            number_of_rows_per_chunk: Optional[int] = None,
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_release_*` version of the database.
@@ -23,6 +35,14 @@ class ChEMBLCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after it is read.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the whole file should be parsed at once.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "chembl_{release_number:s}_chemreps.txt".format(
@@ -38,15 +58,109 @@ class ChEMBLCompoundDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            sep="\t",
-            header=0
+        input_archive_file_name = "{file_name:s}.gz".format(
+            file_name=input_file_name
+        ) if is_virtual_extraction_enabled else None
+
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
+        ) as dataframe_writer:
+            with DataSourceExtractionUtility.open_input_file(
+                input_directory_path=input_directory_path,
+                input_file_name=input_file_name,
+                archive_file_name=input_archive_file_name
+            ) as input_file_handle:
+                for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                    number_of_rows_per_chunk=number_of_rows_per_chunk,
+                    filepath_or_buffer=input_file_handle,
+                    sep="\t",
+                    header=0,
+                    dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                        data_source_name="chembl",
+                        version=version
+                    )
+                ):
+                    dataframe_chunk["file_name"] = input_file_name
+
+                    dataframe_writer.write(
+                        dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                            dataframe=dataframe_chunk,
+                            data_source_name="chembl",
+                            version=version
+                        )
+                    )
+
+        if is_input_file_deleted:
+            Path(input_directory_path, input_archive_file_name or input_file_name).unlink(
+                missing_ok=True
+            )
+
+    @staticmethod
+    def format_v_release_from_stream(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_rows_per_chunk: Optional[int] = None,
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
+    ) -> None:
+        """
+        Format the data from a `v_release_*` version of the database by decompressing and parsing the downloaded data
+        on the fly, without writing the downloaded or extracted file to the disk.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the chunks of 1000000 rows should be parsed.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
+        """
+
+        file_url, file_name = ChEMBLCompoundDatabaseDownloadUtility.get_v_release_file_url_and_name(
+            version=version
         )
 
-        dataframe["file_name"] = input_file_name
+        input_file_name = file_name[:-3]
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        output_file_name = "{timestamp:s}_chembl_{version:s}.csv".format(
+            timestamp=datetime.now().strftime(
+                format="%Y%m%d%H%M%S"
+            ),
+            version=version
         )
+
+        if number_of_rows_per_chunk is None:
+            number_of_rows_per_chunk = 1000000
+
+        with DataSourceDownloadUtility.get_resumable_stream(
+            url=file_url
+        ) as file_download_stream_handle:
+            with GzipFile(
+                fileobj=file_download_stream_handle
+            ) as gzip_archive_file_handle:
+                with DataSourceDataFrameWriter(
+                    output_file_path=Path(output_directory_path, output_file_name),
+                    output_file_format=output_file_format,
+                    number_of_rows_per_row_group=number_of_rows_per_row_group
+                ) as dataframe_writer:
+                    for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                        number_of_rows_per_chunk=number_of_rows_per_chunk,
+                        filepath_or_buffer=gzip_archive_file_handle,
+                        sep="\t",
+                        header=0,
+                        dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                            data_source_name="chembl",
+                            version=version
+                        )
+                    ):
+                        dataframe_chunk["file_name"] = input_file_name
+
+                        dataframe_writer.write(
+                            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                                dataframe=dataframe_chunk,
+                                data_source_name="chembl",
+                                version=version
+                            )
+                        )
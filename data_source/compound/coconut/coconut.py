@@ -25,6 +25,24 @@ class COCONUTCompoundDatabase(DataSourceBase):
             "v_2_0_complete_by_20241126_chandrasekhar_v_et_al": "https://doi.org/10.5281/zenodo.13382750",
         }
 
+    def _is_chunked_formatting_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the database is formatted in chunks of the number of rows that is
+        specified by the `number_of_rows_per_chunk` keyword argument.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database is formatted in chunks.
+        """
+
+        return version in [
+            "v_2_0_by_20241126_chandrasekhar_v_et_al",
+            "v_2_0_complete_by_20241126_chandrasekhar_v_et_al",
+        ]
+
     def download(
             self,
             version: str,
@@ -55,7 +73,9 @@ class COCONUTCompoundDatabase(DataSourceBase):
                 ]:
                     COCONUTCompoundDatabaseDownloadUtility.download_v_2_0_by_20241126_chandrasekhar_v_et_al(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -113,7 +133,7 @@ class COCONUTCompoundDatabase(DataSourceBase):
                 if version in [
                     "v_2_0_by_20241126_chandrasekhar_v_et_al",
                     "v_2_0_complete_by_20241126_chandrasekhar_v_et_al",
-                ]:
+                ] and not kwargs.get("is_virtual_extraction_enabled", False):
                     COCONUTCompoundDatabaseExtractionUtility.extract_v_2_0_by_20241126_chandrasekhar_v_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
@@ -179,7 +199,11 @@ class COCONUTCompoundDatabase(DataSourceBase):
                     COCONUTCompoundDatabaseFormattingUtility.format_v_2_0_by_20241126_chandrasekhar_v_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -1,7 +1,8 @@
 """ The ``data_source.compound.coconut.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -12,13 +13,19 @@ class COCONUTCompoundDatabaseDownloadUtility:
     @staticmethod
     def download_v_2_0_by_20241126_chandrasekhar_v_et_al(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_2_0_*_by_20241126_chandrasekhar_v_et_al` version of the database.
 
         :parameter version: The version of the database.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_2_0_by_20241126_chandrasekhar_v_et_al":
@@ -41,5 +48,7 @@ class COCONUTCompoundDatabaseDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
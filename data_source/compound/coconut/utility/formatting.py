@@ -3,9 +3,12 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
-from pandas import read_csv
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
 
 
 class COCONUTCompoundDatabaseFormattingUtility:
@@ -15,7 +18,11 @@ class COCONUTCompoundDatabaseFormattingUtility:
     def format_v_2_0_by_20241126_chandrasekhar_v_et_al(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            number_of_rows_per_chunk: Optional[int] = None,
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_2_0_*_by_20241126_chandrasekhar_v_et_al` version of the database.
@@ -23,6 +30,13 @@ class COCONUTCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the whole file should be parsed at once.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_2_0_by_20241126_chandrasekhar_v_et_al":
@@ -47,15 +61,35 @@ class COCONUTCompoundDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            header=0,
-            low_memory=False
-        )
-
-        dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
+        ) as dataframe_writer:
+            with DataSourceExtractionUtility.open_input_file(
+                input_directory_path=input_directory_path,
+                input_file_name=input_file_name,
+                archive_file_name="{file_name:s}.zip".format(
+                    file_name=input_file_name
+                ) if is_virtual_extraction_enabled else None,
+                archive_member_name=input_file_name
+            ) as input_file_handle:
+                for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                    number_of_rows_per_chunk=number_of_rows_per_chunk,
+                    filepath_or_buffer=input_file_handle,
+                    header=0,
+                    dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                        data_source_name="coconut",
+                        version=version
+                    ),
+                    low_memory=False
+                ):
+                    dataframe_chunk["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                    dataframe_writer.write(
+                        dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                            dataframe=dataframe_chunk,
+                            data_source_name="coconut",
+                            version=version
+                        )
+                    )
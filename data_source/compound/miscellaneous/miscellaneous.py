@@ -49,7 +49,9 @@ class MiscellaneousCompoundDataSource(DataSourceBase):
 
                 if version == "v_moses_by_20201218_polykovskiy_d_et_al":
                     MiscellaneousCompoundDataSourceDownloadUtility.download_v_moses_by_20201218_polykovskiy_d_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -159,7 +161,9 @@ class MiscellaneousCompoundDataSource(DataSourceBase):
                 if version == "v_moses_by_20201218_polykovskiy_d_et_al":
                     MiscellaneousCompoundDataSourceFormattingUtility.format_v_moses_by_20201218_polykovskiy_d_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -1,7 +1,8 @@
 """ The ``data_source.compound.miscellaneous.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -11,12 +12,18 @@ class MiscellaneousCompoundDataSourceDownloadUtility:
 
     @staticmethod
     def download_v_moses_by_20201218_polykovskiy_d_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_moses_by_20201218_polykovskiy_d_et_al` version of the data source.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://media.githubusercontent.com/media/molecularsets/moses/master/data/dataset_v1.csv"
@@ -26,5 +33,7 @@ class MiscellaneousCompoundDataSourceDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
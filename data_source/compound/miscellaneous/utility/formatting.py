@@ -3,10 +3,12 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from pandas import read_csv
 
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+
 
 class MiscellaneousCompoundDataSourceFormattingUtility:
     """ The miscellaneous chemical compound data source formatting utility class. """
@@ -14,13 +16,18 @@ class MiscellaneousCompoundDataSourceFormattingUtility:
     @staticmethod
     def format_v_moses_by_20201218_polykovskiy_d_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_moses_by_20201218_polykovskiy_d_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "dataset_v1.csv"
@@ -38,7 +45,9 @@ class MiscellaneousCompoundDataSourceFormattingUtility:
 
         dataframe["FILE_NAME"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe,
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
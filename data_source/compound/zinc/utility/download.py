@@ -1,7 +1,8 @@
 """ The ``data_source.compound.zinc.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -10,15 +11,15 @@ class ZINCCompoundDatabaseDownloadUtility:
     """ The `ZINC <https://zinc.docking.org>`_ chemical compound database download utility class. """
 
     @staticmethod
-    def download_v_building_block(
-            version: str,
-            output_directory_path: Union[str, PathLike[str]]
-    ) -> None:
+    def get_v_building_block_file_url_and_name(
+            version: str
+    ) -> Tuple[str, str]:
         """
-        Download the data from a `v_building_block_*` version of the database.
+        Get the URL and name of the file of a `v_building_block_*` version of the database.
 
         :parameter version: The version of the database.
-        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+
+        :returns: The URL and name of the file.
         """
 
         file_name = "{file_name_prefix:s}.smi.gz".format(
@@ -32,22 +33,54 @@ class ZINCCompoundDatabaseDownloadUtility:
             file_name=file_name
         )
 
+        return file_url, file_name
+
+    @staticmethod
+    def download_v_building_block(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
+    ) -> None:
+        """
+        Download the data from a `v_building_block_*` version of the database.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
+        """
+
+        file_url, file_name = ZINCCompoundDatabaseDownloadUtility.get_v_building_block_file_url_and_name(
+            version=version
+        )
+
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_catalog(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_catalog_*` version of the database.
 
         :parameter version: The version of the database.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_name = "{file_name_prefix:s}.src.txt".format(
@@ -64,5 +97,7 @@ class ZINCCompoundDatabaseDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
@@ -3,9 +3,15 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
-from pandas import read_csv
+from gzip import GzipFile
+
+from data_source.base.utility.download import DataSourceDownloadUtility
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
+from data_source.compound.zinc.utility.download import ZINCCompoundDatabaseDownloadUtility
 
 
 class ZINCCompoundDatabaseFormattingUtility:
@@ -15,7 +21,11 @@ class ZINCCompoundDatabaseFormattingUtility:
     def format_v_building_block(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_input_file_deleted: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_building_block_*` version of the database.
@@ -23,6 +33,11 @@ class ZINCCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after it is read.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "{input_file_name_prefix:s}.smi".format(
@@ -39,10 +54,15 @@ class ZINCCompoundDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
+        dataframe = DataSourceFormattingUtility.read_csv_file(
+            reader_backend=reader_backend,
             filepath_or_buffer=Path(input_directory_path, input_file_name),
             sep=r"\s+",
-            header=None
+            header=None,
+            dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                data_source_name="zinc",
+                version=version
+            )
         ).rename(
             columns={
                 0: "smiles",
@@ -50,18 +70,111 @@ class ZINCCompoundDatabaseFormattingUtility:
             }
         )
 
+        if is_input_file_deleted:
+            Path(input_directory_path, input_file_name).unlink(
+                missing_ok=True
+            )
+
         dataframe["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                dataframe=dataframe,
+                data_source_name="zinc",
+                version=version
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
+        )
+
+    @staticmethod
+    def format_v_building_block_from_stream(
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
+    ) -> None:
+        """
+        Format the data from a `v_building_block_*` version of the database by decompressing and parsing the downloaded
+        data on the fly, without writing the downloaded or extracted file to the disk.
+
+        :parameter version: The version of the database.
+        :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the chunks of 1000000 rows should be parsed.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
+        """
+
+        file_url, file_name = ZINCCompoundDatabaseDownloadUtility.get_v_building_block_file_url_and_name(
+            version=version
         )
 
+        input_file_name = file_name[:-3]
+
+        output_file_name = "{timestamp:s}_zinc_{version:s}.csv".format(
+            timestamp=datetime.now().strftime(
+                format="%Y%m%d%H%M%S"
+            ),
+            version=version
+        )
+
+        if number_of_rows_per_chunk is None:
+            number_of_rows_per_chunk = 1000000
+
+        with DataSourceDownloadUtility.get_resumable_stream(
+            url=file_url
+        ) as file_download_stream_handle:
+            with GzipFile(
+                fileobj=file_download_stream_handle
+            ) as gzip_archive_file_handle:
+                with DataSourceDataFrameWriter(
+                    output_file_path=Path(output_directory_path, output_file_name),
+                    output_file_format=output_file_format,
+                    number_of_rows_per_row_group=number_of_rows_per_row_group
+                ) as dataframe_writer:
+                    for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                        number_of_rows_per_chunk=number_of_rows_per_chunk,
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=gzip_archive_file_handle,
+                        sep=r"\s+",
+                        header=None,
+                        dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                            data_source_name="zinc",
+                            version=version
+                        )
+                    ):
+                        dataframe_chunk = dataframe_chunk.rename(
+                            columns={
+                                0: "smiles",
+                                1: "id",
+                            }
+                        )
+
+                        dataframe_chunk["file_name"] = input_file_name
+
+                        dataframe_writer.write(
+                            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                                dataframe=dataframe_chunk,
+                                data_source_name="zinc",
+                                version=version
+                            )
+                        )
+
     @staticmethod
     def format_v_catalog(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_input_file_deleted: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_catalog_*` version of the database.
@@ -69,6 +182,11 @@ class ZINCCompoundDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after it is read.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "{input_file_name_prefix:s}.src.txt".format(
@@ -85,10 +203,15 @@ class ZINCCompoundDatabaseFormattingUtility:
             version=version.replace("-", "_")
         )
 
-        dataframe = read_csv(
+        dataframe = DataSourceFormattingUtility.read_csv_file(
+            reader_backend=reader_backend,
             filepath_or_buffer=Path(input_directory_path, input_file_name),
             sep=r"\s+",
-            header=None
+            header=None,
+            dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                data_source_name="zinc",
+                version=version
+            )
         ).rename(
             columns={
                 0: "smiles",
@@ -96,9 +219,20 @@ class ZINCCompoundDatabaseFormattingUtility:
             }
         )
 
+        if is_input_file_deleted:
+            Path(input_directory_path, input_file_name).unlink(
+                missing_ok=True
+            )
+
         dataframe["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                dataframe=dataframe,
+                data_source_name="zinc",
+                version=version
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
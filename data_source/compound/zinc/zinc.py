@@ -34,9 +34,9 @@ class ZINCCompoundDatabase(DataSourceBase):
 
             for file_name in findall(
                 pattern=r"href=\"([^\.]+)\.smi\.gz",
-                string=DataSourceDownloadUtility.send_http_get_request(
+                string=DataSourceDownloadUtility.get_http_response_text(
                     http_get_request_url=http_get_request_url
-                ).text
+                )
             ):
                 supported_versions[
                     "v_building_block_{file_name:s}".format(
@@ -48,9 +48,9 @@ class ZINCCompoundDatabase(DataSourceBase):
 
             for file_name in findall(
                 pattern=r"href=\"([^\.]+)\.src\.txt",
-                string=DataSourceDownloadUtility.send_http_get_request(
+                string=DataSourceDownloadUtility.get_http_response_text(
                     http_get_request_url=http_get_request_url
-                ).text
+                )
             ):
                 supported_versions[
                     "v_catalog_{file_name:s}".format(
@@ -68,6 +68,21 @@ class ZINCCompoundDatabase(DataSourceBase):
 
             raise
 
+    def _is_streaming_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the database can be formatted directly from the download stream.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database can be formatted directly from the download
+            stream.
+        """
+
+        return version.startswith("v_building_block")
+
     def download(
             self,
             version: str,
@@ -92,16 +107,20 @@ class ZINCCompoundDatabase(DataSourceBase):
                         )
                     )
 
-                if version.startswith("v_building_block"):
+                if version.startswith("v_building_block") and not kwargs.get("is_streaming_enabled", False):
                     ZINCCompoundDatabaseDownloadUtility.download_v_building_block(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version.startswith("v_catalog"):
                     ZINCCompoundDatabaseDownloadUtility.download_v_catalog(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -156,11 +175,13 @@ class ZINCCompoundDatabase(DataSourceBase):
                         )
                     )
 
-                if version.startswith("v_building_block"):
+                if version.startswith("v_building_block") and not kwargs.get("is_streaming_enabled", False):
                     ZINCCompoundDatabaseExtractionUtility.extract_v_building_block(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False)
                     )
 
                 if self.logger is not None:
@@ -216,17 +237,36 @@ class ZINCCompoundDatabase(DataSourceBase):
                     )
 
                 if version.startswith("v_building_block"):
-                    ZINCCompoundDatabaseFormattingUtility.format_v_building_block(
-                        version=version,
-                        input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
-                    )
+                    if kwargs.get("is_streaming_enabled", False):
+                        ZINCCompoundDatabaseFormattingUtility.format_v_building_block_from_stream(
+                            version=version,
+                            output_directory_path=output_directory_path,
+                            number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                            reader_backend=kwargs.get("reader_backend", "pandas"),
+                            output_file_format=kwargs.get("output_file_format", "csv"),
+                            number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
+                        )
+
+                    else:
+                        ZINCCompoundDatabaseFormattingUtility.format_v_building_block(
+                            version=version,
+                            input_directory_path=input_directory_path,
+                            output_directory_path=output_directory_path,
+                            is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                            reader_backend=kwargs.get("reader_backend", "pandas"),
+                            output_file_format=kwargs.get("output_file_format", "csv"),
+                            number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
+                        )
 
                 if version.startswith("v_catalog"):
                     ZINCCompoundDatabaseFormattingUtility.format_v_catalog(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -2,7 +2,7 @@
 
 from logging import Logger
 from os import PathLike
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from data_source.base.base import DataSourceBase
 from data_source.compound_pattern.rdkit.rdkit import RDKitCompoundPatternDataset
@@ -107,6 +107,42 @@ class CompoundPatternDataSource(DataSourceBase):
 
             raise exception_handle
 
+    async def download_async(
+            self,
+            name: str,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            **kwargs
+    ) -> None:
+        """
+        Download the data from a data source without blocking the event loop.
+
+        :parameter name: The name of the data source.
+        :parameter version: The version of the data source.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        """
+
+        if name in self.get_names_of_supported_data_sources():
+            await self.supported_data_sources[name].download_async(
+                version=version,
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+
+        else:
+            exception_handle = ValueError(
+                "The chemical compound pattern data source name '{name:s}' is not supported.".format(
+                    name=name
+                )
+            )
+
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise exception_handle
+
     def extract(
             self,
             name: str,
@@ -184,3 +220,76 @@ class CompoundPatternDataSource(DataSourceBase):
                 )
 
             raise exception_handle
+
+    def estimate_resource_usage(
+            self,
+            name: str,
+            version: str,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Estimate the resource usage of the download, extraction, and formatting of the data from a data source.
+
+        :parameter name: The name of the data source.
+        :parameter version: The version of the data source.
+
+        :returns: The estimated resource usage of the data source.
+        """
+
+        if name in self.get_names_of_supported_data_sources():
+            return self.supported_data_sources[name].estimate_resource_usage(
+                version=version,
+                **kwargs
+            )
+
+        else:
+            exception_handle = ValueError(
+                "The chemical compound pattern data source name '{name:s}' is not supported.".format(
+                    name=name
+                )
+            )
+
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise exception_handle
+
+    def check_resource_usage(
+            self,
+            name: str,
+            version: str,
+            output_directory_path: Union[str, PathLike[str]],
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Check whether the estimated resource usage of a data source is within the limits.
+
+        :parameter name: The name of the data source.
+        :parameter version: The version of the data source.
+        :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+
+        :returns: The keyword arguments of the `download`, `extract`, and `format` methods that should be utilized.
+        """
+
+        if name in self.get_names_of_supported_data_sources():
+            return self.supported_data_sources[name].check_resource_usage(
+                version=version,
+                output_directory_path=output_directory_path,
+                **kwargs
+            )
+
+        else:
+            exception_handle = ValueError(
+                "The chemical compound pattern data source name '{name:s}' is not supported.".format(
+                    name=name
+                )
+            )
+
+            if self.logger is not None:
+                self.logger.error(
+                    msg=exception_handle
+                )
+
+            raise exception_handle
@@ -50,12 +50,16 @@ class RDKitCompoundPatternDataset(DataSourceBase):
 
                 if version == "v_htl_by_20080307_brenk_r_et_al":
                     RDKitCompoundPatternDatasetDownloadUtility.download_v_htl_by_20080307_brenk_r_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_pains_by_20100204_baell_j_b_and_holloway_g_a":
                     RDKitCompoundPatternDatasetDownloadUtility.download_v_pains_by_20100204_baell_j_b_and_holloway_g_a(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -165,13 +169,17 @@ class RDKitCompoundPatternDataset(DataSourceBase):
                 if version == "v_htl_by_20080307_brenk_r_et_al":
                     RDKitCompoundPatternDatasetFormattingUtility.format_v_htl_by_20080307_brenk_r_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_pains_by_20100204_baell_j_b_and_holloway_g_a":
                     RDKitCompoundPatternDatasetFormattingUtility.format_v_pains_by_20100204_baell_j_b_and_holloway_g_a(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -1,7 +1,8 @@
 """ The ``data_source.compound_pattern.rdkit.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -11,12 +12,18 @@ class RDKitCompoundPatternDatasetDownloadUtility:
 
     @staticmethod
     def download_v_htl_by_20080307_brenk_r_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_htl_by_20080307_brenk_r_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://github.com/rdkit/rdkit/raw/refs/heads/master/Code/GraphMol/FilterCatalog/brenk.in"
@@ -26,17 +33,25 @@ class RDKitCompoundPatternDatasetDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_pains_by_20100204_baell_j_b_and_holloway_g_a(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_pains_by_20100204_baell_j_b_and_holloway_g_a` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_urls = [
@@ -45,11 +60,16 @@ class RDKitCompoundPatternDatasetDownloadUtility:
             "https://github.com/rdkit/rdkit/raw/refs/heads/master/Code/GraphMol/FilterCatalog/pains_c.in",
         ]
 
-        for file_url in file_urls:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
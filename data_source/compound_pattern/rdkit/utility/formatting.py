@@ -4,11 +4,13 @@ from ast import literal_eval
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from re import DOTALL, search, sub
-from typing import Union
+from re import sub
+from typing import Optional, Union
 
 from pandas import DataFrame
 
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+
 
 class RDKitCompoundPatternDatasetFormattingUtility:
     """ The `RDKit <https://www.rdkit.org>`_ chemical compound pattern dataset formatting utility class. """
@@ -16,13 +18,18 @@ class RDKitCompoundPatternDatasetFormattingUtility:
     @staticmethod
     def format_v_htl_by_20080307_brenk_r_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_htl_by_20080307_brenk_r_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "brenk.in"
@@ -35,54 +42,55 @@ class RDKitCompoundPatternDatasetFormattingUtility:
 
         dataframe_rows = list()
 
-        with open(
-            file=Path(input_directory_path, input_file_name)
-        ) as source_file_handle:
-            source_file_content_string = search(
-                pattern=r"\{(.*)\};",
-                string=source_file_handle.read(),
-                flags=DOTALL
-            ).group(1).replace("{", "[").replace("}", "]")
-
-            source_file_content_string = sub(
-                pattern=r",\s*\"\"\s*\]",
-                repl=", \"\"]",
-                string=source_file_content_string
-            )
-
-            for compound_pattern_name, compound_pattern_smarts, _, _ in literal_eval(
-                node_or_string="[{source_file_content_string:s}]".format(
-                    source_file_content_string=source_file_content_string
+        for compound_pattern_record in DataSourceFormattingUtility.iterate_file_records(
+            file_path=Path(input_directory_path, input_file_name),
+            record_start_marker=b"{",
+            content_start_marker=b"{",
+            content_end_marker=b"};"
+        ):
+            compound_pattern_name, compound_pattern_smarts, _, _ = literal_eval(
+                node_or_string=sub(
+                    pattern=r",\s*\"\"\s*\]",
+                    repl=", \"\"]",
+                    string=compound_pattern_record.strip().rstrip(",").replace("{", "[").replace("}", "]")
                 )
-            ):
-                dataframe_rows.append((
-                    compound_pattern_name,
-                    compound_pattern_smarts,
-                    input_file_name,
-                ))
+            )
 
-        DataFrame(
-            data=dataframe_rows,
-            columns=[
-                "compound_pattern_name",
-                "compound_pattern_smarts",
-                "file_name",
-            ]
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+            dataframe_rows.append((
+                compound_pattern_name,
+                compound_pattern_smarts,
+                input_file_name,
+            ))
+
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataFrame(
+                data=dataframe_rows,
+                columns=[
+                    "compound_pattern_name",
+                    "compound_pattern_smarts",
+                    "file_name",
+                ]
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_pains_by_20100204_baell_j_b_and_holloway_g_a(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_pains_by_20100204_baell_j_b_and_holloway_g_a` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -100,40 +108,36 @@ class RDKitCompoundPatternDatasetFormattingUtility:
         dataframe_rows = list()
 
         for input_file_name in input_file_names:
-            with open(
-                file=Path(input_directory_path, input_file_name)
-            ) as source_file_handle:
-                source_file_content_string = search(
-                    pattern=r"\{(.*)\};",
-                    string=source_file_handle.read(),
-                    flags=DOTALL
-                ).group(1).replace("{", "[").replace("}", "]")
-
-                source_file_content_string = sub(
-                    pattern=r",\s*\"\"\s*\]",
-                    repl=", \"\"]",
-                    string=source_file_content_string
+            for compound_pattern_record in DataSourceFormattingUtility.iterate_file_records(
+                file_path=Path(input_directory_path, input_file_name),
+                record_start_marker=b"{",
+                content_start_marker=b"{",
+                content_end_marker=b"};"
+            ):
+                compound_pattern_name, compound_pattern_smarts, _, _ = literal_eval(
+                    node_or_string=sub(
+                        pattern=r",\s*\"\"\s*\]",
+                        repl=", \"\"]",
+                        string=compound_pattern_record.strip().rstrip(",").replace("{", "[").replace("}", "]")
+                    )
                 )
 
-                for compound_pattern_name, compound_pattern_smarts, _, _ in literal_eval(
-                    node_or_string="[{source_file_content_string:s}]".format(
-                        source_file_content_string=source_file_content_string
-                    )
-                ):
-                    dataframe_rows.append((
-                        compound_pattern_name,
-                        compound_pattern_smarts,
-                        input_file_name,
-                    ))
-
-        DataFrame(
-            data=dataframe_rows,
-            columns=[
-                "compound_pattern_name",
-                "compound_pattern_smarts",
-                "file_name",
-            ]
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+                dataframe_rows.append((
+                    compound_pattern_name,
+                    compound_pattern_smarts,
+                    input_file_name,
+                ))
+
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataFrame(
+                data=dataframe_rows,
+                columns=[
+                    "compound_pattern_name",
+                    "compound_pattern_smarts",
+                    "file_name",
+                ]
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
@@ -27,6 +27,21 @@ class ChemicalReactionDatabase(DataSourceBase):
             "v_reaction_smiles_1976_to_2024": "https://doi.org/10.6084/m9.figshare.28230053.v1",
         }
 
+    def _is_chunked_formatting_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the database is formatted in chunks of the number of rows that is
+        specified by the `number_of_rows_per_chunk` keyword argument.
+
+        :parameter version: The version of the database.
+
+        :returns: The indicator of whether the version of the database is formatted in chunks.
+        """
+
+        return version in self.get_supported_versions().keys()
+
     def download(
             self,
             version: str,
@@ -59,7 +74,9 @@ class ChemicalReactionDatabase(DataSourceBase):
                 ]:
                     ChemicalReactionDatabaseDownloadUtility.download_v_reaction_smiles(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -182,7 +199,11 @@ class ChemicalReactionDatabase(DataSourceBase):
                     ChemicalReactionDatabaseFormattingUtility.format_v_reaction_smiles(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -1,7 +1,8 @@
 """ The ``data_source.reaction.crd.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -12,13 +13,19 @@ class ChemicalReactionDatabaseDownloadUtility:
     @staticmethod
     def download_v_reaction_smiles(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_reaction_smiles_*` version of the database.
 
         :parameter version: The version of the database.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_reaction_smiles_2001_to_2021":
@@ -49,5 +56,8 @@ class ChemicalReactionDatabaseDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            number_of_segments=4,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
@@ -4,7 +4,8 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from zipfile import ZipFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.reaction.crd.utility.formatting import ChemicalReactionDatabaseFormattingUtility
 
 
 class ChemicalReactionDatabaseExtractionUtility:
@@ -36,9 +37,12 @@ class ChemicalReactionDatabaseExtractionUtility:
                 )
             )
 
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+        input_file_name_patterns = ChemicalReactionDatabaseFormattingUtility.get_input_file_name_patterns(
+            version=version
+        )
+
+        DataSourceExtractionUtility.extract_zip_archive(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns
+        )
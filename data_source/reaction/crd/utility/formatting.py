@@ -3,19 +3,66 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import List, Optional, Union
 
-from pandas import read_csv
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
 
 
 class ChemicalReactionDatabaseFormattingUtility:
     """ The `Chemical Reaction Database (CRD) <https://kmt.vander-lingen.nl>`_ formatting utility class. """
 
+    @staticmethod
+    def get_input_file_name_patterns(
+            version: str
+    ) -> List[str]:
+        """
+        Get the glob patterns of the names of the input files that are read when formatting a version of the database.
+
+        :parameter version: The version of the database.
+
+        :returns: The glob patterns of the names of the input files.
+        """
+
+        if version == "v_reaction_smiles_2001_to_2021":
+            return [
+                "reactionSmilesFigShare.txt",
+            ]
+
+        elif version == "v_reaction_smiles_2001_to_2023":
+            return [
+                "reactionSmilesFigShare2023.txt",
+            ]
+
+        elif version == "v_reaction_smiles_2023":
+            return [
+                "reactionSmilesFigShareUSPTO2023.txt",
+            ]
+
+        elif version == "v_reaction_smiles_1976_to_2024":
+            return [
+                "reactionSmilesFigShare2024.txt",
+            ]
+
+        else:
+            raise ValueError(
+                "The formatting of the data from the {data_source:s} is not supported.".format(
+                    data_source="Chemical Reaction Database ({version:s})".format(
+                        version=version
+                    )
+                )
+            )
+
     @staticmethod
     def format_v_reaction_smiles(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_reaction_smiles_*` version of the database.
@@ -23,6 +70,12 @@ class ChemicalReactionDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the whole file should be parsed at once.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_reaction_smiles_2001_to_2021":
@@ -53,18 +106,33 @@ class ChemicalReactionDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
-            filepath_or_buffer=Path(input_directory_path, input_file_name),
-            header=None
-        ).rename(
-            columns={
-                0: "reaction_smiles",
-            }
-        )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
+        ) as dataframe_writer:
+            for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                number_of_rows_per_chunk=number_of_rows_per_chunk,
+                reader_backend=reader_backend,
+                filepath_or_buffer=Path(input_directory_path, input_file_name),
+                header=None,
+                dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                    data_source_name="crd",
+                    version=version
+                )
+            ):
+                dataframe_chunk = dataframe_chunk.rename(
+                    columns={
+                        0: "reaction_smiles",
+                    }
+                )
 
-        dataframe["file_name"] = input_file_name
+                dataframe_chunk["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                        dataframe=dataframe_chunk,
+                        data_source_name="crd",
+                        version=version
+                    )
+                )
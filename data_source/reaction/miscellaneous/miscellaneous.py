@@ -58,12 +58,16 @@ class MiscellaneousReactionDataSource(DataSourceBase):
 
                 if version == "v_20131008_kraut_h_et_al":
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_20131008_kraut_h_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_20161014_wei_j_n_et_al":
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_20161014_wei_j_n_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version in [
@@ -72,17 +76,23 @@ class MiscellaneousReactionDataSource(DataSourceBase):
                 ]:
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_20200508_grambow_c_et_al(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_golden_dataset_by_20211102_lin_a_et_al":
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_golden_dataset_by_20211102_lin_a_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_rdb7_by_20220718_spiekermann_k_et_al":
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_rdb7_by_20220718_spiekermann_k_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version in [
@@ -92,7 +102,9 @@ class MiscellaneousReactionDataSource(DataSourceBase):
                 ]:
                     MiscellaneousReactionDataSourceDownloadUtility.download_v_orderly(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -214,13 +226,17 @@ class MiscellaneousReactionDataSource(DataSourceBase):
                 if version == "v_20131008_kraut_h_et_al":
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_20131008_kraut_h_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_20161014_wei_j_n_et_al":
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_20161014_wei_j_n_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version in [
@@ -230,19 +246,25 @@ class MiscellaneousReactionDataSource(DataSourceBase):
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_20200508_grambow_c_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_golden_dataset_by_20211102_lin_a_et_al":
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_golden_dataset_by_20211102_lin_a_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_rdb7_by_20220718_spiekermann_k_et_al":
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_rdb7_by_20220718_spiekermann_k_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version in [
@@ -253,7 +275,9 @@ class MiscellaneousReactionDataSource(DataSourceBase):
                     MiscellaneousReactionDataSourceFormattingUtility.format_v_orderly(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
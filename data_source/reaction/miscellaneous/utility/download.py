@@ -1,7 +1,8 @@
 """ The ``data_source.reaction.miscellaneous.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -11,12 +12,18 @@ class MiscellaneousReactionDataSourceDownloadUtility:
 
     @staticmethod
     def download_v_20131008_kraut_h_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_20131008_kraut_h_et_al` version of the data source.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://ndownloader.figstatic.com/files/3988891"
@@ -25,17 +32,25 @@ class MiscellaneousReactionDataSourceDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_20161014_wei_j_n_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_20161014_wei_j_n_et_al` version of the data source.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_urls = [
@@ -49,25 +64,36 @@ class MiscellaneousReactionDataSourceDownloadUtility:
             ),
         ]
 
-        for file_url in file_urls:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_20200508_grambow_c_et_al(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_*_20200508_grambow_c_et_al` version of the data source.
 
         :parameter version: The version of the data source.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_20200508_grambow_c_et_al":
@@ -91,23 +117,34 @@ class MiscellaneousReactionDataSourceDownloadUtility:
                 )
             )
 
-        for file_url in file_urls:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_golden_dataset_by_20211102_lin_a_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_golden_dataset_by_20211102_lin_a_et_al` version of the data source.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = (
@@ -120,17 +157,25 @@ class MiscellaneousReactionDataSourceDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_rdb7_by_20220718_spiekermann_k_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_rdb7_by_20220718_spiekermann_k_et_al` version of the data source.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_urls = [
@@ -140,25 +185,36 @@ class MiscellaneousReactionDataSourceDownloadUtility:
             "https://zenodo.org/records/6618262/files/ccsdtf12_tz.csv",
         ]
 
-        for file_url in file_urls:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_orderly(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_orderly_*` version of the database.
 
         :parameter version: The version of the database.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_orderly_condition_by_20240422_wigh_d_s_et_al":
@@ -214,9 +270,9 @@ class MiscellaneousReactionDataSourceDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
@@ -4,7 +4,8 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from zipfile import ZipFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.reaction.miscellaneous.utility.formatting import MiscellaneousReactionDataSourceFormattingUtility
 
 
 class MiscellaneousReactionDataSourceExtractionUtility:
@@ -24,12 +25,15 @@ class MiscellaneousReactionDataSourceExtractionUtility:
 
         input_file_name = "ci400442f_si_002.zip"
 
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+        input_file_name_patterns = MiscellaneousReactionDataSourceFormattingUtility.get_input_file_name_patterns(
+            version="v_20131008_kraut_h_et_al"
+        )
+
+        DataSourceExtractionUtility.extract_zip_archive(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns
+        )
 
     @staticmethod
     def extract_v_golden_dataset_by_20211102_lin_a_et_al(
@@ -45,9 +49,12 @@ class MiscellaneousReactionDataSourceExtractionUtility:
 
         input_file_name = "golden_dataset.zip"
 
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+        input_file_name_patterns = MiscellaneousReactionDataSourceFormattingUtility.get_input_file_name_patterns(
+            version="v_golden_dataset_by_20211102_lin_a_et_al"
+        )
+
+        DataSourceExtractionUtility.extract_zip_archive(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns
+        )
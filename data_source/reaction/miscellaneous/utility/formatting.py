@@ -3,26 +3,68 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import List, Optional, Union
 
-from pandas import DataFrame, concat, read_csv, read_parquet
+from pandas import DataFrame, read_csv, read_parquet
 
 from rdkit.Chem.rdChemReactions import ReactionFromRxnBlock, ReactionToSmiles
 
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.writer import DataSourceDataFrameWriter
+
 
 class MiscellaneousReactionDataSourceFormattingUtility:
     """ The miscellaneous chemical reaction data source formatting utility class. """
 
+    @staticmethod
+    def get_input_file_name_patterns(
+            version: str
+    ) -> List[str]:
+        """
+        Get the glob patterns of the names of the input files that are read when formatting a version of the data
+        source.
+
+        :parameter version: The version of the data source.
+
+        :returns: The glob patterns of the names of the input files.
+        """
+
+        if version == "v_20131008_kraut_h_et_al":
+            return [
+                "MapTestExamplesV1.0.rdf",
+                "MapTestExamplesV1_ICMapRctCpy.rdf",
+                "MapTestExamplesV1_ICMap.rdf",
+            ]
+
+        elif version == "v_golden_dataset_by_20211102_lin_a_et_al":
+            return [
+                "golden_dataset.rdf",
+            ]
+
+        else:
+            raise ValueError(
+                "The formatting of the data from the {data_source:s} is not supported.".format(
+                    data_source="miscellaneous chemical reaction data source ({version:s})".format(
+                        version=version
+                    )
+                )
+            )
+
     @staticmethod
     def format_v_20131008_kraut_h_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_20131008_kraut_h_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -40,50 +82,53 @@ class MiscellaneousReactionDataSourceFormattingUtility:
         dataframe_rows = list()
 
         for input_file_name in input_file_names:
-            with open(
-                file=Path(input_directory_path, input_file_name)
-            ) as input_file_handle:
-                for reaction_rxn_block_without_identifier in input_file_handle.read().split(
-                    sep="$RXN"
-                )[1:]:
-                    reaction_rxn = ReactionFromRxnBlock(
-                        rxnblock="$RXN{reaction_rxn_block_without_identifier:s}".format(
-                            reaction_rxn_block_without_identifier=reaction_rxn_block_without_identifier
-                        )
-                    )
-
-                    if reaction_rxn is not None:
-                        reaction_smiles = ReactionToSmiles(
-                            reaction=reaction_rxn
-                        )
+            for reaction_rxn_block in DataSourceFormattingUtility.iterate_file_records(
+                file_path=Path(input_directory_path, input_file_name),
+                record_start_marker=b"$RXN"
+            ):
+                reaction_rxn = ReactionFromRxnBlock(
+                    rxnblock=reaction_rxn_block
+                )
 
-                        if reaction_smiles is not None:
-                            dataframe_rows.append((
-                                reaction_smiles,
-                                input_file_name,
-                            ))
+                if reaction_rxn is not None:
+                    reaction_smiles = ReactionToSmiles(
+                        reaction=reaction_rxn
+                    )
 
-        DataFrame(
-            data=dataframe_rows,
-            columns=[
-                "reaction_smiles",
-                "file_name",
-            ]
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+                    if reaction_smiles is not None:
+                        dataframe_rows.append((
+                            reaction_smiles,
+                            input_file_name,
+                        ))
+
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataFrame(
+                data=dataframe_rows,
+                columns=[
+                    "reaction_smiles",
+                    "file_name",
+                ]
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_20161014_wei_j_n_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_20161014_wei_j_n_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -97,36 +142,35 @@ class MiscellaneousReactionDataSourceFormattingUtility:
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                header=None
-            ).rename(
-                columns={
-                    0: "reaction_smiles",
-                }
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                dataframe = read_csv(
+                    filepath_or_buffer=Path(input_directory_path, input_file_name),
+                    header=None
+                ).rename(
+                    columns={
+                        0: "reaction_smiles",
+                    }
+                )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_20200508_grambow_c_et_al(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_*_20200508_grambow_c_et_al` version of the data source.
@@ -134,6 +178,9 @@ class MiscellaneousReactionDataSourceFormattingUtility:
         :parameter version: The version of the data source.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_20200508_grambow_c_et_al":
@@ -164,37 +211,39 @@ class MiscellaneousReactionDataSourceFormattingUtility:
             version=version
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                header=0
-            )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                dataframe = read_csv(
+                    filepath_or_buffer=Path(input_directory_path, input_file_name),
+                    header=0
+                )
 
-            dataframe["file_name"] = input_file_name
+                dataframe["file_name"] = input_file_name
 
-            dataframes.append(
-                dataframe
-            )
-
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_golden_dataset_by_20211102_lin_a_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_golden_dataset_by_20211102_lin_a_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "golden_dataset.rdf"
@@ -207,28 +256,24 @@ class MiscellaneousReactionDataSourceFormattingUtility:
 
         dataframe_rows = list()
 
-        with open(
-            file=Path(input_directory_path, input_file_name)
-        ) as input_file_handle:
-            for reaction_rxn_block_without_identifier in input_file_handle.read().split(
-                sep="$RXN"
-            )[1:]:
-                reaction_rxn = ReactionFromRxnBlock(
-                    rxnblock="$RXN{reaction_rxn_block_without_identifier:s}".format(
-                        reaction_rxn_block_without_identifier=reaction_rxn_block_without_identifier
-                    )
+        for reaction_rxn_block in DataSourceFormattingUtility.iterate_file_records(
+            file_path=Path(input_directory_path, input_file_name),
+            record_start_marker=b"$RXN"
+        ):
+            reaction_rxn = ReactionFromRxnBlock(
+                rxnblock=reaction_rxn_block
+            )
+
+            if reaction_rxn is not None:
+                reaction_smiles = ReactionToSmiles(
+                    reaction=reaction_rxn
                 )
 
-                if reaction_rxn is not None:
-                    reaction_smiles = ReactionToSmiles(
-                        reaction=reaction_rxn
+                if reaction_smiles is not None:
+                    dataframe_rows.append(
+                        reaction_smiles
                     )
 
-                    if reaction_smiles is not None:
-                        dataframe_rows.append(
-                            reaction_smiles
-                        )
-
         dataframe = DataFrame(
             data=dataframe_rows,
             columns=[
@@ -238,21 +283,28 @@ class MiscellaneousReactionDataSourceFormattingUtility:
 
         dataframe["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe,
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_rdb7_by_20220718_spiekermann_k_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_rdb7_by_20220718_spiekermann_k_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -268,32 +320,31 @@ class MiscellaneousReactionDataSourceFormattingUtility:
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                header=0
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                dataframe = read_csv(
+                    filepath_or_buffer=Path(input_directory_path, input_file_name),
+                    header=0
+                )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_orderly(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_orderly_*` version of the database.
@@ -301,6 +352,9 @@ class MiscellaneousReactionDataSourceFormattingUtility:
         :parameter version: The version of the chemical reaction database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_orderly_condition_by_20240422_wigh_d_s_et_al":
@@ -339,22 +393,19 @@ class MiscellaneousReactionDataSourceFormattingUtility:
             version=version
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_parquet(
-                path=Path(input_directory_path, input_file_name)
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                dataframe = read_parquet(
+                    path=Path(input_directory_path, input_file_name)
+                )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
@@ -55,7 +55,9 @@ class OpenReactionDatabase(DataSourceBase):
                 ]:
                     OpenReactionDatabaseDownloadUtility.download_v_release(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -118,7 +120,9 @@ class OpenReactionDatabase(DataSourceBase):
                     OpenReactionDatabaseExtractionUtility.extract_v_release(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False)
                     )
 
                 if self.logger is not None:
@@ -182,7 +186,10 @@ class OpenReactionDatabase(DataSourceBase):
                         version=version,
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path,
-                        **kwargs
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -4,7 +4,8 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from zipfile import ZipFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.reaction.ord.utility.formatting import OpenReactionDatabaseFormattingUtility
 
 
 class OpenReactionDatabaseExtractionUtility:
@@ -14,7 +15,9 @@ class OpenReactionDatabaseExtractionUtility:
     def extract_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False
     ) -> None:
         """
         Extract the data from a `v_release_*` version of the database.
@@ -22,6 +25,9 @@ class OpenReactionDatabaseExtractionUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after the
+            extraction.
         """
 
         if version == "v_release_0_1_0":
@@ -39,9 +45,14 @@ class OpenReactionDatabaseExtractionUtility:
                 )
             )
 
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+        input_file_name_patterns = OpenReactionDatabaseFormattingUtility.get_input_file_name_patterns(
+            version=version
+        )
+
+        DataSourceExtractionUtility.extract_zip_archive(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns,
+            number_of_processes=number_of_processes,
+            is_archive_deleted=is_input_file_deleted
+        )
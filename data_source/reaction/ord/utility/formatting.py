@@ -14,18 +14,53 @@ from pqdm.processes import pqdm
 
 from rdkit.rdBase import DisableLog
 
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+
 
 class OpenReactionDatabaseFormattingUtility:
     """ The `Open Reaction Database (ORD) <https://open-reaction-database.org>`_ formatting utility class. """
 
+    @staticmethod
+    def get_input_file_name_patterns(
+            version: str
+    ) -> List[str]:
+        """
+        Get the glob patterns of the names of the input files that are read when formatting a version of the database.
+
+        :parameter version: The version of the database.
+
+        :returns: The glob patterns of the names of the input files.
+        """
+
+        if version == "v_release_0_1_0":
+            return [
+                "ord-data-0.1.0/data/*.pb.gz",
+            ]
+
+        elif version == "v_release_main":
+            return [
+                "ord-data-main/data/*.pb.gz",
+            ]
+
+        else:
+            raise ValueError(
+                "The formatting of the data from the {data_source:s} is not supported.".format(
+                    data_source="Open Reaction Database ({version:s})".format(
+                        version=version
+                    )
+                )
+            )
+
     @staticmethod
     def _parse_v_release_file(
-            input_file_path: Union[str, PathLike[str]]
+            input_file_path: Union[str, PathLike[str]],
+            is_input_file_deleted: bool = False
     ) -> List[Tuple[Optional[str], ...]]:
         """
         Parse a file from a `v_release_*` version of the database.
 
         :parameter input_file_path: The path to the input file.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after it is parsed.
 
         :returns: The parsed input file.
         """
@@ -38,6 +73,11 @@ class OpenReactionDatabaseFormattingUtility:
                 message_type=Dataset
             )
 
+            if is_input_file_deleted:
+                Path(input_file_path).unlink(
+                    missing_ok=True
+                )
+
             for reaction_protocol_buffer_message in dataset_protocol_buffer_message.reactions:
                 try:
                     parsed_input_file.append((
@@ -66,7 +106,10 @@ class OpenReactionDatabaseFormattingUtility:
             version: str,
             input_directory_path: Union[str, PathLike[str]],
             output_directory_path: Union[str, PathLike[str]],
-            number_of_processes: int = 1
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False,
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_release_*` version of the database.
@@ -75,6 +118,11 @@ class OpenReactionDatabaseFormattingUtility:
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input files should be deleted after they are
+            parsed.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_release_0_1_0":
@@ -117,9 +165,15 @@ class OpenReactionDatabaseFormattingUtility:
         dataframe_rows = list()
 
         for reaction_data in pqdm(
-            array=file_paths,
+            array=[
+                {
+                    "input_file_path": file_path,
+                    "is_input_file_deleted": is_input_file_deleted,
+                } for file_path in file_paths
+            ],
             function=OpenReactionDatabaseFormattingUtility._parse_v_release_file,
             n_jobs=number_of_processes,
+            argument_type="kwargs",
             desc="Parsing the files",
             total=len(file_paths),
             ncols=150
@@ -128,15 +182,17 @@ class OpenReactionDatabaseFormattingUtility:
                 reaction_data
             )
 
-        DataFrame(
-            data=dataframe_rows,
-            columns=[
-                "dataset_id",
-                "reaction_id",
-                "reaction_smiles",
-                "file_name",
-            ]
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataFrame(
+                data=dataframe_rows,
+                columns=[
+                    "dataset_id",
+                    "reaction_id",
+                    "reaction_smiles",
+                    "file_name",
+                ]
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
@@ -30,14 +30,14 @@ class RheaReactionDatabase(DataSourceBase):
         try:
             http_get_request_url = "https://ftp.expasy.org/databases/rhea/rhea-release.properties"
 
-            http_get_request_response = DataSourceDownloadUtility.send_http_get_request(
+            http_get_request_response_text = DataSourceDownloadUtility.get_http_response_text(
                 http_get_request_url=http_get_request_url
             )
 
             latest_release_number = int(
                 search(
                     pattern=r"rhea\.release\.number=(\d+)",
-                    string=http_get_request_response.text
+                    string=http_get_request_response_text
                 ).group(1)
             )
 
@@ -83,7 +83,9 @@ class RheaReactionDatabase(DataSourceBase):
                 if version.startswith("v_release"):
                     RheaReactionDatabaseDownloadUtility.download_v_release(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -142,7 +144,8 @@ class RheaReactionDatabase(DataSourceBase):
                     RheaReactionDatabaseExtractionUtility.extract_v_release(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1)
                     )
 
                 if self.logger is not None:
@@ -201,7 +204,10 @@ class RheaReactionDatabase(DataSourceBase):
                     RheaReactionDatabaseFormattingUtility.format_v_release(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
@@ -2,10 +2,9 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
-from tarfile import TarFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
 
 
 class RheaReactionDatabaseExtractionUtility:
@@ -15,14 +14,20 @@ class RheaReactionDatabaseExtractionUtility:
     def extract_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1
     ) -> None:
         """
         Extract the data from a `v_release_*` version of the database.
 
+        The archive member is located using the cached block index of the release archive, so only the blocks that
+        contain it are decompressed, concurrently if more than one process is utilized. The archive is read sequentially
+        if it cannot be indexed.
+
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
         """
 
         input_file_name = "{release_number:s}.tar.bz2".format(
@@ -33,23 +38,16 @@ class RheaReactionDatabaseExtractionUtility:
 
         output_file_name = "rhea-reaction-smiles.tsv"
 
-        with TarFile.open(
-            name=Path(input_directory_path, input_file_name),
-            mode="r:bz2"
-        ) as tar_archive_file_handle:
-            with tar_archive_file_handle.extractfile(
-                member="{release_number:s}/tsv/{output_file_name:s}".format(
-                    release_number=version.split(
-                        sep="_"
-                    )[-1],
-                    output_file_name=output_file_name
-                )
-            ) as source_file_handle:
-                with open(
-                    file=Path(output_directory_path, output_file_name),
-                    mode="wb"
-                ) as destination_file_handle:
-                    copyfileobj(
-                        fsrc=source_file_handle,
-                        fdst=destination_file_handle
-                    )
+        archive_member_name = "{release_number:s}/tsv/{output_file_name:s}".format(
+            release_number=version.split(
+                sep="_"
+            )[-1],
+            output_file_name=output_file_name
+        )
+
+        DataSourceExtractionUtility.extract_tar_archive_member(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            archive_member_name=archive_member_name,
+            output_file_path=Path(output_directory_path, output_file_name),
+            number_of_processes=number_of_processes
+        )
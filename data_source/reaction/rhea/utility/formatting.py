@@ -3,9 +3,10 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
-from pandas import read_csv
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
 
 
 class RheaReactionDatabaseFormattingUtility:
@@ -15,7 +16,10 @@ class RheaReactionDatabaseFormattingUtility:
     def format_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_release_*` version of the database.
@@ -23,6 +27,10 @@ class RheaReactionDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "rhea-reaction-smiles.tsv"
@@ -34,20 +42,31 @@ class RheaReactionDatabaseFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
+        dataframe = DataSourceFormattingUtility.read_csv_file(
+            reader_backend=reader_backend,
             filepath_or_buffer=Path(input_directory_path, input_file_name),
             sep="\t",
-            header=None
+            header=None,
+            dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                data_source_name="rhea",
+                version=version
+            )
         )
 
         dataframe["file_name"] = input_file_name
 
-        dataframe.rename(
-            columns={
-                0: "id",
-                1: "reaction_smiles",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                dataframe=dataframe.rename(
+                    columns={
+                        0: "id",
+                        1: "reaction_smiles",
+                    }
+                ),
+                data_source_name="rhea",
+                version=version
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
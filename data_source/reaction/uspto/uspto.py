@@ -43,6 +43,24 @@ class USPTOReactionDataset(DataSourceBase):
             "v_mech_31k_by_20240810_chen_s_et_al": "https://doi.org/10.6084/m9.figshare.24797220.v2",
         }
 
+    def _is_chunked_formatting_supported(
+            self,
+            version: str
+    ) -> bool:
+        """
+        Get the indicator of whether a version of the dataset is formatted in chunks of the number of rows that is
+        specified by the `number_of_rows_per_chunk` keyword argument.
+
+        :parameter version: The version of the dataset.
+
+        :returns: The indicator of whether the version of the dataset is formatted in chunks.
+        """
+
+        return version in [
+            "v_1976_to_2013_rsmi_by_20121009_lowe_d_m",
+            "v_1976_to_2016_rsmi_by_20121009_lowe_d_m",
+        ]
+
     def download(
             self,
             version: str,
@@ -70,22 +88,30 @@ class USPTOReactionDataset(DataSourceBase):
                 if version == "v_1976_to_2013_rsmi_by_20121009_lowe_d_m":
                     USPTOReactionDatasetDownloadUtility.download_v_1976_to_2013_by_20121009_lowe_d_m(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_50k_by_20141226_schneider_n_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_50k_by_20141226_schneider_n_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_50k_by_20161122_schneider_n_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_50k_by_20161122_schneider_n_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_15k_by_20170418_coley_c_w_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_15k_by_20170418_coley_c_w_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version in [
@@ -94,22 +120,30 @@ class USPTOReactionDataset(DataSourceBase):
                 ]:
                     USPTOReactionDatasetDownloadUtility.download_v_1976_to_2016_by_20121009_lowe_d_m(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_50k_by_20170905_liu_b_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_50k_by_20170905_liu_b_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_50k_by_20171116_coley_c_w_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_50k_by_20171116_coley_c_w_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_480k_or_mit_by_20171204_jin_w_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_480k_or_mit_by_20171204_jin_w_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version in [
@@ -117,22 +151,30 @@ class USPTOReactionDataset(DataSourceBase):
                     "v_stereo_by_20180622_schwaller_p_et_al",
                 ]:
                     USPTOReactionDatasetDownloadUtility.download_v_by_20180622_schwaller_p_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_lef_by_20181221_bradshaw_j_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_lef_by_20181221_bradshaw_j_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_1k_tpl_by_20210128_schwaller_p_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_1k_tpl_by_20210128_schwaller_p_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al":
                     USPTOReactionDatasetDownloadUtility.download_v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version in [
@@ -142,7 +184,9 @@ class USPTOReactionDataset(DataSourceBase):
                 ]:
                     USPTOReactionDatasetDownloadUtility.download_v_chen_s_et_al(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -197,25 +241,30 @@ class USPTOReactionDataset(DataSourceBase):
                         )
                     )
 
+                is_virtual_extraction_enabled = kwargs.get("is_virtual_extraction_enabled", False)
+
                 if version == "v_1976_to_2013_rsmi_by_20121009_lowe_d_m":
                     USPTOReactionDatasetExtractionUtility.extract_v_1976_to_2013_rsmi_by_20121009_lowe_d_m(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False)
                     )
 
-                if version == "v_50k_by_20141226_schneider_n_et_al":
+                if version == "v_50k_by_20141226_schneider_n_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_50k_by_20141226_schneider_n_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1)
                     )
 
-                if version == "v_50k_by_20161122_schneider_n_et_al":
+                if version == "v_50k_by_20161122_schneider_n_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_50k_by_20161122_schneider_n_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
                     )
 
-                if version == "v_15k_by_20170418_coley_c_w_et_al":
+                if version == "v_15k_by_20170418_coley_c_w_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_15k_by_20170418_coley_c_w_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
@@ -228,10 +277,12 @@ class USPTOReactionDataset(DataSourceBase):
                     USPTOReactionDatasetExtractionUtility.extract_v_1976_to_2016_by_20121009_lowe_d_m(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False)
                     )
 
-                if version == "v_480k_or_mit_by_20171204_jin_w_et_al":
+                if version == "v_480k_or_mit_by_20171204_jin_w_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_480k_or_mit_by_20171204_jin_w_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
@@ -240,26 +291,28 @@ class USPTOReactionDataset(DataSourceBase):
                 if version in [
                     "v_480k_or_mit_by_20180622_schwaller_p_et_al",
                     "v_stereo_by_20180622_schwaller_p_et_al",
-                ]:
+                ] and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_by_20180622_schwaller_p_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
                     )
 
-                if version == "v_lef_by_20181221_bradshaw_j_et_al":
+                if version == "v_lef_by_20181221_bradshaw_j_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_lef_by_20181221_bradshaw_j_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
                     )
 
-                if version == "v_1k_tpl_by_20210128_schwaller_p_et_al":
+                if version == "v_1k_tpl_by_20210128_schwaller_p_et_al" and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_1k_tpl_by_20210128_schwaller_p_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
                     )
 
-                if version == "v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al":
+                if version in [
+                    "v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al",
+                ] and not is_virtual_extraction_enabled:
                     USPTOReactionDatasetExtractionUtility.extract_v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al(
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path
@@ -320,25 +373,41 @@ class USPTOReactionDataset(DataSourceBase):
                 if version == "v_1976_to_2013_rsmi_by_20121009_lowe_d_m":
                     USPTOReactionDatasetFormattingUtility.format_v_1976_to_2013_rsmi_by_20121009_lowe_d_m(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                        number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_50k_by_20141226_schneider_n_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_50k_by_20141226_schneider_n_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_50k_by_20161122_schneider_n_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_50k_by_20161122_schneider_n_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_15k_by_20170418_coley_c_w_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_15k_by_20170418_coley_c_w_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version in [
@@ -349,25 +418,40 @@ class USPTOReactionDataset(DataSourceBase):
                         version=version,
                         input_directory_path=input_directory_path,
                         output_directory_path=output_directory_path,
-                        number_of_processes=kwargs.get("number_of_processes", 1)
+                        number_of_processes=kwargs.get("number_of_processes", 1),
+                        is_input_file_deleted=kwargs.get("is_input_file_deletion_enabled", False),
+                        number_of_rows_per_chunk=kwargs.get("number_of_rows_per_chunk", None),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_50k_by_20170905_liu_b_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_50k_by_20170905_liu_b_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_50k_by_20171116_coley_c_w_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_50k_by_20171116_coley_c_w_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_480k_or_mit_by_20171204_jin_w_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_480k_or_mit_by_20171204_jin_w_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version in [
@@ -377,25 +461,41 @@ class USPTOReactionDataset(DataSourceBase):
                     USPTOReactionDatasetFormattingUtility.format_v_by_20180622_schwaller_p_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_lef_by_20181221_bradshaw_j_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_lef_by_20181221_bradshaw_j_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_1k_tpl_by_20210128_schwaller_p_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_1k_tpl_by_20210128_schwaller_p_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al":
                     USPTOReactionDatasetFormattingUtility.format_v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        is_virtual_extraction_enabled=kwargs.get("is_virtual_extraction_enabled", False),
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version in [
@@ -406,7 +506,10 @@ class USPTOReactionDataset(DataSourceBase):
                     USPTOReactionDatasetFormattingUtility.format_v_chen_s_et_al(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        reader_backend=kwargs.get("reader_backend", "pandas"),
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
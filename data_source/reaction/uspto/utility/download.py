@@ -1,7 +1,8 @@
 """ The ``data_source.reaction.uspto.utility`` package ``download`` module. """
 
 from os import PathLike
-from typing import Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
 from data_source.base.utility.download import DataSourceDownloadUtility
 
@@ -15,13 +16,19 @@ class USPTOReactionDatasetDownloadUtility:
     @staticmethod
     def download_v_1976_to_2013_by_20121009_lowe_d_m(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_1976_to_2013_*_by_20121009_lowe_d_m` version of the dataset.
 
         :parameter version: The version of the dataset.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_1976_to_2013_by_20121009_lowe_d_m":
@@ -65,21 +72,28 @@ class USPTOReactionDatasetDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path,
+            number_of_segments_per_file=4,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_50k_by_20141226_schneider_n_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_50k_by_20141226_schneider_n_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://ndownloader.figstatic.com/files/3848755"
@@ -88,17 +102,25 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_50k_by_20161122_schneider_n_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_50k_by_20161122_schneider_n_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://ndownloader.figstatic.com/files/7005749"
@@ -107,17 +129,25 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_15k_by_20170418_coley_c_w_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_15k_by_20170418_coley_c_w_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://raw.githubusercontent.com/wengong-jin/nips17-rexgen/master/USPTO-15K/data.zip"
@@ -127,19 +157,27 @@ class USPTOReactionDatasetDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_1976_to_2016_by_20121009_lowe_d_m(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_1976_to_2016_*_by_20121009_lowe_d_m` version of the dataset.
 
         :parameter version: The version of the dataset.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_1976_to_2016_by_20121009_lowe_d_m":
@@ -183,21 +221,28 @@ class USPTOReactionDatasetDownloadUtility:
                 )
             )
 
-        for file_url, file_name in file_urls_and_names:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_name,
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=file_urls_and_names,
+            output_directory_path=output_directory_path,
+            number_of_segments_per_file=4,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_50k_by_20170905_liu_b_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_50k_by_20170905_liu_b_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_urls = [
@@ -227,23 +272,34 @@ class USPTOReactionDatasetDownloadUtility:
             ),
         ]
 
-        for file_url in file_urls:
-            DataSourceDownloadUtility.download_file(
-                file_url=file_url,
-                file_name=file_url.split(
-                    sep="/"
-                )[-1],
-                output_directory_path=output_directory_path
-            )
+        DataSourceDownloadUtility.download_files(
+            file_urls_and_names=[
+                (
+                    file_url,
+                    file_url.split(
+                        sep="/"
+                    )[-1],
+                ) for file_url in file_urls
+            ],
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
+        )
 
     @staticmethod
     def download_v_50k_by_20171116_coley_c_w_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_50k_by_20171116_coley_c_w_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://raw.githubusercontent.com/connorcoley/retrosim/master/retrosim/data/data_processed.csv"
@@ -253,17 +309,25 @@ class USPTOReactionDatasetDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_480k_or_mit_by_20171204_jin_w_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_480k_or_mit_by_20171204_jin_w_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://raw.githubusercontent.com/wengong-jin/nips17-rexgen/master/USPTO/data.zip"
@@ -273,17 +337,25 @@ class USPTOReactionDatasetDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_by_20180622_schwaller_p_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_*_by_20180622_schwaller_p_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = DataSourceDownloadUtility.send_http_get_request(
@@ -300,17 +372,25 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_lef_by_20181221_bradshaw_j_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_lef_by_20181221_bradshaw_j_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = "https://raw.githubusercontent.com/john-bradshaw/electro/master/lef_uspto.zip"
@@ -320,17 +400,25 @@ class USPTOReactionDatasetDownloadUtility:
             file_name=file_url.split(
                 sep="/"
             )[-1],
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_1k_tpl_by_20210128_schwaller_p_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_1k_tpl_by_20210128_schwaller_p_et_al` version of the dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = DataSourceDownloadUtility.send_http_get_request(
@@ -347,18 +435,26 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al(
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from the `v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al` version of the chemical
         reaction dataset.
 
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         file_url = DataSourceDownloadUtility.send_http_get_request(
@@ -375,19 +471,27 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
 
     @staticmethod
     def download_v_chen_s_et_al(
             version: str,
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            file_download_recorder: Optional[List[Tuple[str, str]]] = None,
+            download_cancellation_event: Optional[Event] = None
     ) -> None:
         """
         Download the data from a `v_*_chen_s_et_al` version of the dataset.
 
         :parameter version: The version of the dataset.
         :parameter output_directory_path: The path to the output directory where the data should be downloaded.
+        :parameter file_download_recorder: The list to which the URLs and names of the files are appended instead of
+            downloading the files. The value `None` indicates that the files should be downloaded.
+        :parameter download_cancellation_event: The event that is set to cancel the download. The value `None`
+            indicates that the download cannot be cancelled.
         """
 
         if version == "v_1976_to_2016_remapped_by_20240313_chen_s_et_al":
@@ -414,5 +518,7 @@ class USPTOReactionDatasetDownloadUtility:
         DataSourceDownloadUtility.download_file(
             file_url=file_url,
             file_name=file_name,
-            output_directory_path=output_directory_path
+            output_directory_path=output_directory_path,
+            file_download_recorder=file_download_recorder,
+            download_cancellation_event=download_cancellation_event
         )
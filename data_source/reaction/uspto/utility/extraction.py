@@ -7,10 +7,11 @@ from typing import Union
 
 from gzip import GzipFile
 
-from py7zr import SevenZipFile
-
 from zipfile import ZipFile
 
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.reaction.uspto.utility.formatting import USPTOReactionDatasetFormattingUtility
+
 
 class USPTOReactionDatasetExtractionUtility:
     """
@@ -21,13 +22,18 @@ class USPTOReactionDatasetExtractionUtility:
     @staticmethod
     def extract_v_1976_to_2013_rsmi_by_20121009_lowe_d_m(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False
     ) -> None:
         """
         Extract the data from the `v_1976_to_2013_rsmi_by_20121009_lowe_d_m` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input files should be deleted after the
+            extraction.
         """
 
         input_file_names = [
@@ -35,24 +41,32 @@ class USPTOReactionDatasetExtractionUtility:
             "2001-2013_USPTOapplications_reactionSmiles_feb2014filters.7z",
         ]
 
-        for input_file_name in input_file_names:
-            with SevenZipFile(
-                file=Path(input_directory_path, input_file_name)
-            ) as seven_zip_archive_file_handle:
-                seven_zip_archive_file_handle.extractall(
-                    path=output_directory_path
-                )
+        input_file_name_patterns = USPTOReactionDatasetFormattingUtility.get_input_file_name_patterns(
+            version="v_1976_to_2013_rsmi_by_20121009_lowe_d_m"
+        )
+
+        DataSourceExtractionUtility.extract_archives(
+            archive_file_paths=[
+                Path(input_directory_path, input_file_name) for input_file_name in input_file_names
+            ],
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns,
+            number_of_processes=number_of_processes,
+            is_archive_deleted=is_input_file_deleted
+        )
 
     @staticmethod
     def extract_v_50k_by_20141226_schneider_n_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1
     ) -> None:
         """
         Extract the data from the `v_50k_by_20141226_schneider_n_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
         """
 
         input_file_name = "ci5006614_si_002.zip"
@@ -82,17 +96,11 @@ class USPTOReactionDatasetExtractionUtility:
                         )
 
                 if output_file_name.endswith(".gz"):
-                    with GzipFile(
-                        filename=Path(output_directory_path, output_file_name),
-                    ) as gzip_archive_file_handle:
-                        with open(
-                            file=Path(output_directory_path, output_file_name[:-3]),
-                            mode="wb"
-                        ) as destination_file_handle:
-                            copyfileobj(
-                                fsrc=gzip_archive_file_handle,
-                                fdst=destination_file_handle
-                            )
+                    DataSourceExtractionUtility.decompress_gzip_file(
+                        input_file_path=Path(output_directory_path, output_file_name),
+                        output_file_path=Path(output_directory_path, output_file_name[:-3]),
+                        number_of_threads=number_of_processes
+                    )
 
     @staticmethod
     def extract_v_50k_by_20161122_schneider_n_et_al(
@@ -173,7 +181,9 @@ class USPTOReactionDatasetExtractionUtility:
     def extract_v_1976_to_2016_by_20121009_lowe_d_m(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False
     ) -> None:
         """
         Extract the data from a `v_1976_to_2016_*_by_20121009_lowe_d_m` version of the dataset.
@@ -181,6 +191,9 @@ class USPTOReactionDatasetExtractionUtility:
         :parameter version: The version of the dataset.
         :parameter input_directory_path: The path to the input directory where the data is downloaded.
         :parameter output_directory_path: The path to the output directory where the data should be extracted.
+        :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input files should be deleted after the
+            extraction.
         """
 
         if version == "v_1976_to_2016_by_20121009_lowe_d_m":
@@ -189,13 +202,14 @@ class USPTOReactionDatasetExtractionUtility:
                 "cml_xsd.zip",
             ]
 
-            for input_file_name in input_file_names:
-                with ZipFile(
-                    file=Path(input_directory_path, input_file_name)
-                ) as zip_archive_file_handle:
-                    zip_archive_file_handle.extractall(
-                        path=output_directory_path
-                    )
+            DataSourceExtractionUtility.extract_archives(
+                archive_file_paths=[
+                    Path(input_directory_path, input_file_name) for input_file_name in input_file_names
+                ],
+                output_directory_path=output_directory_path,
+                number_of_processes=number_of_processes,
+                is_archive_deleted=is_input_file_deleted
+            )
 
             input_file_names = [
                 "1976_Sep2016_USPTOgrants_cml.7z",
@@ -225,13 +239,23 @@ class USPTOReactionDatasetExtractionUtility:
                 )
             )
 
-        for input_file_name in input_file_names:
-            with SevenZipFile(
-                file=Path(input_directory_path, input_file_name)
-            ) as seven_zip_archive_file_handle:
-                seven_zip_archive_file_handle.extractall(
-                    path=output_directory_path
-                )
+        if version == "v_1976_to_2016_by_20121009_lowe_d_m":
+            input_file_name_patterns = None
+
+        else:
+            input_file_name_patterns = USPTOReactionDatasetFormattingUtility.get_input_file_name_patterns(
+                version=version
+            )
+
+        DataSourceExtractionUtility.extract_archives(
+            archive_file_paths=[
+                Path(input_directory_path, input_file_name) for input_file_name in input_file_names
+            ],
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns,
+            number_of_processes=number_of_processes,
+            is_archive_deleted=is_input_file_deleted
+        )
 
     @staticmethod
     def extract_v_480k_or_mit_by_20171204_jin_w_et_al(
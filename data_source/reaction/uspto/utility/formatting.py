@@ -6,12 +6,17 @@ from pathlib import Path
 from pickle import load
 from typing import List, Optional, Tuple, Union
 
-from pandas import DataFrame, concat, read_csv
+from pandas import DataFrame, concat
 
 from pqdm.processes import pqdm
 
 from xml.etree import ElementTree
 
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.schema import DataSourceSchemaRegistry
+from data_source.base.utility.writer import DataSourceDataFrameWriter
+
 
 class USPTOReactionDatasetFormattingUtility:
     """
@@ -19,16 +24,68 @@ class USPTOReactionDatasetFormattingUtility:
     chemical reaction dataset formatting utility class.
     """
 
+    @staticmethod
+    def get_input_file_name_patterns(
+            version: str
+    ) -> List[str]:
+        """
+        Get the glob patterns of the names of the input files that are read when formatting a version of the dataset.
+
+        :parameter version: The version of the dataset.
+
+        :returns: The glob patterns of the names of the input files.
+        """
+
+        if version == "v_1976_to_2013_rsmi_by_20121009_lowe_d_m":
+            return [
+                "1976-2013_USPTOgrants_reactionSmiles_feb2014filters.rsmi",
+                "2001-2013_USPTOapplications_reactionSmiles_feb2014filters.rsmi",
+            ]
+
+        elif version == "v_1976_to_2016_cml_by_20121009_lowe_d_m":
+            return [
+                "grants/*.xml",
+                "applications/*.xml",
+            ]
+
+        elif version == "v_1976_to_2016_rsmi_by_20121009_lowe_d_m":
+            return [
+                "1976_Sep2016_USPTOgrants_smiles.rsmi",
+                "2001_Sep2016_USPTOapplications_smiles.rsmi",
+            ]
+
+        else:
+            raise ValueError(
+                "The formatting of the data from the {data_source:s} is not supported.".format(
+                    data_source="USPTO chemical reaction dataset ({version:s})".format(
+                        version=version
+                    )
+                )
+            )
+
     @staticmethod
     def format_v_1976_to_2013_rsmi_by_20121009_lowe_d_m(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_input_file_deleted: bool = False,
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_1976_to_2013_rsmi_by_20121009_lowe_d_m` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_input_file_deleted: The indicator of whether the input files should be deleted after they are
+            read.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the whole file should be parsed at once.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -42,45 +99,65 @@ class USPTOReactionDatasetFormattingUtility:
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep="\t",
-                header=None,
-                low_memory=False
-            )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                    number_of_rows_per_chunk=number_of_rows_per_chunk,
+                    reader_backend=reader_backend,
+                    filepath_or_buffer=Path(input_directory_path, input_file_name),
+                    sep="\t",
+                    header=None,
+                    dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                        data_source_name="uspto",
+                        version="v_1976_to_2013_rsmi_by_20121009_lowe_d_m"
+                    )
+                ):
+                    dataframe_chunk = dataframe_chunk.rename(
+                        columns={
+                            0: "ReactionSmiles",
+                            1: "PatentNumber",
+                            2: "ParagraphNum",
+                        }
+                    )
 
-            dataframe["FileName"] = input_file_name
+                    dataframe_chunk["FileName"] = input_file_name
 
-            dataframes.append(
-                dataframe
-            )
+                    dataframe_writer.write(
+                        dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                            dataframe=dataframe_chunk,
+                            data_source_name="uspto",
+                            version="v_1976_to_2013_rsmi_by_20121009_lowe_d_m"
+                        )
+                    )
 
-        concat(
-            objs=dataframes
-        ).rename(
-            columns={
-                0: "ReactionSmiles",
-                1: "PatentNumber",
-                2: "ParagraphNum",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                if is_input_file_deleted:
+                    Path(input_directory_path, input_file_name).unlink(
+                        missing_ok=True
+                    )
 
     @staticmethod
     def format_v_50k_by_20141226_schneider_n_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_50k_by_20141226_schneider_n_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -89,76 +166,98 @@ class USPTOReactionDatasetFormattingUtility:
             "names_rTypes_classes_superclasses_training_test_set_patent_data.pkl",
         ]
 
+        input_archive_file_name = "ci5006614_si_002.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_50k_by_20141226_schneider_n_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        with open(
-            file=Path(input_directory_path, input_file_names[-1]),
-            mode="rb"
-        ) as input_file_handle:
-            reaction_clas_id_to_name = load(
-                file=input_file_handle
-            )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            with DataSourceExtractionUtility.open_input_file(
+                input_directory_path=input_directory_path,
+                input_file_name=input_file_names[-1],
+                archive_file_name=input_archive_file_name,
+                archive_member_name="ChemReactionClassification/data/{file_name:s}".format(
+                    file_name=input_file_names[-1]
+                )
+            ) as input_file_handle:
+                reaction_clas_id_to_name = load(
+                    file=input_file_handle
+                )
 
-        for input_file_name in input_file_names[0:-1]:
-            dataframe_rows = list()
+            for input_file_name in input_file_names[0:-1]:
+                dataframe_rows = list()
 
-            with open(
-                file=Path(input_directory_path, input_file_name),
-                mode="rb"
-            ) as input_file_handle:
-                while True:
-                    try:
-                        dataframe_rows.append(
-                            load(
-                                file=input_file_handle
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="ChemReactionClassification/data/{file_name:s}.gz".format(
+                        file_name=input_file_name
+                    ),
+                    is_gzip_decompressed=True
+                ) as input_file_handle:
+                    while True:
+                        try:
+                            dataframe_rows.append(
+                                load(
+                                    file=input_file_handle
+                                )
                             )
-                        )
 
-                    except:
-                        break
+                        except:
+                            break
 
-            dataframe = DataFrame(
-                data=dataframe_rows,
-                columns=[
-                    "reaction_smiles",
-                    "patent_number",
-                    "reaction_class_id",
-                ]
-            )
-
-            dataframe["reaction_class_name"] = dataframe["reaction_class_id"].map(
-                arg=reaction_clas_id_to_name
-            )
+                dataframe = DataFrame(
+                    data=dataframe_rows,
+                    columns=[
+                        "reaction_smiles",
+                        "patent_number",
+                        "reaction_class_id",
+                    ]
+                )
 
-            dataframe["file_name"] = input_file_name
+                dataframe["reaction_class_name"] = dataframe["reaction_class_id"].map(
+                    arg=reaction_clas_id_to_name
+                )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                        dataframe=dataframe,
+                        data_source_name="uspto",
+                        version="v_50k_by_20141226_schneider_n_et_al"
+                    )
+                )
 
     @staticmethod
     def format_v_50k_by_20161122_schneider_n_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_50k_by_20161122_schneider_n_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -166,44 +265,62 @@ class USPTOReactionDatasetFormattingUtility:
             "dataSetB.csv",
         ]
 
+        input_archive_file_name = "ci6b00564_si_002.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_50k_by_20161122_schneider_n_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep=",",
-                header=0
-            )
-
-            dataframe["file_Name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="data/{file_name:s}".format(
+                        file_name=input_file_name
+                    )
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        sep=",",
+                        header=0
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_Name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_15k_by_20170418_coley_c_w_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_15k_by_20170418_coley_c_w_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -212,55 +329,72 @@ class USPTOReactionDatasetFormattingUtility:
             "test.txt",
         ]
 
+        input_archive_file_name = "data.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_15k_by_20170418_coley_c_w_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep="\t",
-                header=None
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="data/{file_name:s}".format(
+                        file_name=input_file_name
+                    )
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        sep="\t",
+                        header=None
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).rename(
-            columns={
-                0: "reaction_smiles",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe.rename(
+                        columns={
+                            0: "reaction_smiles",
+                        }
+                    )
+                )
 
     @staticmethod
     def _parse_v_1976_to_2016_cml_by_20121009_lowe_d_m_file(
-            input_file_path: Union[str, PathLike[str]]
+            input_file_path: Union[str, PathLike[str]],
+            is_input_file_deleted: bool = False
     ) -> List[Tuple[Optional[Union[int, str]], ...]]:
         """
         Parse a file from the `v_1976_to_2016_cml_by_20121009_lowe_d_m` version of the dataset.
 
         :parameter input_file_path: The path to the input file.
+        :parameter is_input_file_deleted: The indicator of whether the input file should be deleted after it is parsed.
 
         :returns: The parsed input file.
         """
 
         parsed_input_file = list()
 
-        for xml_element in ElementTree.parse(
+        xml_root_element = ElementTree.parse(
             source=input_file_path
-        ).getroot():
+        ).getroot()
+
+        if is_input_file_deleted:
+            Path(input_file_path).unlink(
+                missing_ok=True
+            )
+
+        for xml_element in xml_root_element:
             document_id = xml_element.find(
                 path="{xml_element_name_prefix:s}{xml_element_name:s}".format(
                     xml_element_name_prefix="{http://bitbucket.org/dan2097}source/{http://bitbucket.org/dan2097}",
@@ -317,7 +451,12 @@ class USPTOReactionDatasetFormattingUtility:
             version: str,
             input_directory_path: Union[str, PathLike[str]],
             output_directory_path: Union[str, PathLike[str]],
-            number_of_processes: int = 1
+            number_of_processes: int = 1,
+            is_input_file_deleted: bool = False,
+            number_of_rows_per_chunk: Optional[int] = None,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_1976_to_2016_*_by_20121009_lowe_d_m` version of the dataset.
@@ -326,8 +465,23 @@ class USPTOReactionDatasetFormattingUtility:
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
         :parameter number_of_processes: The number of processes.
+        :parameter is_input_file_deleted: The indicator of whether the input files should be deleted after they are
+            read.
+        :parameter number_of_rows_per_chunk: The number of rows that are parsed and written at a time. The value
+            `None` indicates that the whole file should be parsed at once.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
+        output_file_name = "{timestamp:s}_uspto_{version:s}.csv".format(
+            timestamp=datetime.now().strftime(
+                format="%Y%m%d%H%M%S"
+            ),
+            version=version
+        )
+
         if version == "v_1976_to_2016_cml_by_20121009_lowe_d_m":
             input_directory_names = [
                 "grants",
@@ -349,9 +503,15 @@ class USPTOReactionDatasetFormattingUtility:
             dataframe_rows = list()
 
             for parsed_input_file in pqdm(
-                array=input_file_paths,
+                array=[
+                    {
+                        "input_file_path": input_file_path,
+                        "is_input_file_deleted": is_input_file_deleted,
+                    } for input_file_path in input_file_paths
+                ],
                 function=USPTOReactionDatasetFormattingUtility._parse_v_1976_to_2016_cml_by_20121009_lowe_d_m_file,
                 n_jobs=number_of_processes,
+                argument_type="kwargs",
                 desc="Parsing the files",
                 total=len(input_file_paths),
                 ncols=150
@@ -360,17 +520,26 @@ class USPTOReactionDatasetFormattingUtility:
                     parsed_input_file
                 )
 
-            dataframe = DataFrame(
-                data=dataframe_rows,
-                columns=[
-                    "year",
-                    "document_id",
-                    "paragraph_number",
-                    "heading_text",
-                    "paragraph_text",
-                    "reaction_smiles",
-                    "file_name",
-                ]
+            DataSourceFormattingUtility.write_dataframe(
+                dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                    dataframe=DataFrame(
+                        data=dataframe_rows,
+                        columns=[
+                            "year",
+                            "document_id",
+                            "paragraph_number",
+                            "heading_text",
+                            "paragraph_text",
+                            "reaction_smiles",
+                            "file_name",
+                        ]
+                    ),
+                    data_source_name="uspto",
+                    version=version
+                ),
+                output_file_path=Path(output_directory_path, output_file_name),
+                output_file_format=output_file_format,
+                number_of_rows_per_row_group=number_of_rows_per_row_group
             )
 
         elif version == "v_1976_to_2016_rsmi_by_20121009_lowe_d_m":
@@ -379,25 +548,38 @@ class USPTOReactionDatasetFormattingUtility:
                 "2001_Sep2016_USPTOapplications_smiles.rsmi",
             ]
 
-            dataframes = list()
-
-            for input_file_name in input_file_names:
-                dataframe = read_csv(
-                    filepath_or_buffer=Path(input_directory_path, input_file_name),
-                    sep="\t",
-                    header=0,
-                    low_memory=False
-                )
-
-                dataframe["FileName"] = input_file_name
-
-                dataframes.append(
-                    dataframe
-                )
+            with DataSourceDataFrameWriter(
+                output_file_path=Path(output_directory_path, output_file_name),
+                output_file_format=output_file_format,
+                number_of_rows_per_row_group=number_of_rows_per_row_group,
+                is_empty_output_allowed=False
+            ) as dataframe_writer:
+                for input_file_name in input_file_names:
+                    for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+                        number_of_rows_per_chunk=number_of_rows_per_chunk,
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=Path(input_directory_path, input_file_name),
+                        sep="\t",
+                        header=0,
+                        dtype=DataSourceSchemaRegistry.get_input_column_data_types(
+                            data_source_name="uspto",
+                            version=version
+                        )
+                    ):
+                        dataframe_chunk["FileName"] = input_file_name
+
+                        dataframe_writer.write(
+                            dataframe=DataSourceSchemaRegistry.apply_output_column_data_types(
+                                dataframe=dataframe_chunk,
+                                data_source_name="uspto",
+                                version=version
+                            )
+                        )
 
-            dataframe = concat(
-                objs=dataframes
-            )
+                    if is_input_file_deleted:
+                        Path(input_directory_path, input_file_name).unlink(
+                            missing_ok=True
+                        )
 
         else:
             raise ValueError(
@@ -408,28 +590,23 @@ class USPTOReactionDatasetFormattingUtility:
                 )
             )
 
-        output_file_name = "{timestamp:s}_uspto_{version:s}.csv".format(
-            timestamp=datetime.now().strftime(
-                format="%Y%m%d%H%M%S"
-            ),
-            version=version
-        )
-
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
-
     @staticmethod
     def format_v_50k_by_20170905_liu_b_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_50k_by_20170905_liu_b_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name_prefixes = [
@@ -444,61 +621,67 @@ class USPTOReactionDatasetFormattingUtility:
             )
         )
 
-        dataframes = list()
-
-        for input_file_name_prefix in input_file_name_prefixes:
-            dataframe = concat(
-                objs=[
-                    read_csv(
-                        filepath_or_buffer=Path(
-                            input_directory_path,
-                            "{input_file_name_prefix:s}_targets".format(
-                                input_file_name_prefix=input_file_name_prefix
-                            )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name_prefix in input_file_name_prefixes:
+                dataframe = concat(
+                    objs=[
+                        DataSourceFormattingUtility.read_csv_file(
+                            reader_backend=reader_backend,
+                            filepath_or_buffer=Path(
+                                input_directory_path,
+                                "{input_file_name_prefix:s}_targets".format(
+                                    input_file_name_prefix=input_file_name_prefix
+                                )
+                            ),
+                            header=None
                         ),
-                        header=None
-                    ),
-                    read_csv(
-                        filepath_or_buffer=Path(
-                            input_directory_path,
-                            "{input_file_name_prefix:s}_sources".format(
-                                input_file_name_prefix=input_file_name_prefix
-                            )
+                        DataSourceFormattingUtility.read_csv_file(
+                            reader_backend=reader_backend,
+                            filepath_or_buffer=Path(
+                                input_directory_path,
+                                "{input_file_name_prefix:s}_sources".format(
+                                    input_file_name_prefix=input_file_name_prefix
+                                )
+                            ),
+                            header=None
                         ),
-                        header=None
-                    ),
-                ],
-                axis=1
-            )
-
-            dataframe["file_name_prefix"] = input_file_name_prefix
+                    ],
+                    axis=1
+                )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name_prefix"] = input_file_name_prefix
 
-        concat(
-            objs=dataframes
-        ).rename(
-            columns={
-                0: "targets",
-                1: "sources",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe.rename(
+                        columns={
+                            0: "targets",
+                            1: "sources",
+                        }
+                    )
+                )
 
     @staticmethod
     def format_v_50k_by_20171116_coley_c_w_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_50k_by_20171116_coley_c_w_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "data_processed.csv"
@@ -509,7 +692,8 @@ class USPTOReactionDatasetFormattingUtility:
             )
         )
 
-        dataframe = read_csv(
+        dataframe = DataSourceFormattingUtility.read_csv_file(
+            reader_backend=reader_backend,
             filepath_or_buffer=Path(input_directory_path, input_file_name),
             header=0,
             index_col=0
@@ -517,21 +701,33 @@ class USPTOReactionDatasetFormattingUtility:
 
         dataframe["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe,
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_480k_or_mit_by_20171204_jin_w_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_480k_or_mit_by_20171204_jin_w_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -540,43 +736,55 @@ class USPTOReactionDatasetFormattingUtility:
             "test.txt",
         ]
 
+        input_archive_file_name = "data.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_480k_or_mit_by_20171204_jin_w_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep="\t",
-                header=None
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="data/{file_name:s}".format(
+                        file_name=input_file_name
+                    )
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        sep="\t",
+                        header=None
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).rename(
-            columns={
-                0: "reaction_smiles",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe.rename(
+                        columns={
+                            0: "reaction_smiles",
+                        }
+                    )
+                )
 
     @staticmethod
     def format_v_by_20180622_schwaller_p_et_al(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_*_by_20180622_schwaller_p_et_al` version of the dataset.
@@ -584,89 +792,122 @@ class USPTOReactionDatasetFormattingUtility:
         :parameter version: The version of the dataset.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
-        dataframes = list()
+        input_archive_file_name = "ReactionSeq2Seq_Dataset.zip" if is_virtual_extraction_enabled else None
 
-        if version == "v_480k_or_mit_by_20180622_schwaller_p_et_al":
-            input_file_names = [
-                "Jin_USPTO_1product_train.txt",
-                "Jin_USPTO_1product_valid.txt",
-                "Jin_USPTO_1product_test.txt",
-            ]
+        output_file_name = "{timestamp:s}_uspto_{version:s}.csv".format(
+            timestamp=datetime.now().strftime(
+                format="%Y%m%d%H%M%S"
+            ),
+            version=version
+        )
 
-            for input_file_name in input_file_names:
-                dataframe = read_csv(
-                    filepath_or_buffer=Path(input_directory_path, input_file_name),
-                    sep="\t",
-                    header=None,
-                    skiprows=[0, ]
-                ).rename(
-                    columns={
-                        0: "reaction_smiles",
-                    }
-                )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            if version == "v_480k_or_mit_by_20180622_schwaller_p_et_al":
+                input_file_names = [
+                    "Jin_USPTO_1product_train.txt",
+                    "Jin_USPTO_1product_valid.txt",
+                    "Jin_USPTO_1product_test.txt",
+                ]
 
-                dataframe["file_name"] = input_file_name
+                for input_file_name in input_file_names:
+                    with DataSourceExtractionUtility.open_input_file(
+                        input_directory_path=input_directory_path,
+                        input_file_name=input_file_name,
+                        archive_file_name=input_archive_file_name,
+                        archive_member_name="ReactionSeq2Seq_Dataset/{file_name:s}".format(
+                            file_name=input_file_name
+                        )
+                    ) as input_file_handle:
+                        dataframe = DataSourceFormattingUtility.read_csv_file(
+                            reader_backend=reader_backend,
+                            filepath_or_buffer=input_file_handle,
+                            sep="\t",
+                            header=None,
+                            skiprows=[0, ]
+                        ).rename(
+                            columns={
+                                0: "reaction_smiles",
+                            }
+                        )
 
-                dataframes.append(
-                    dataframe
-                )
+                    dataframe["file_name"] = input_file_name
 
-        elif version == "v_stereo_by_20180622_schwaller_p_et_al":
-            input_file_names = [
-                "US_patents_1976-Sep2016_1product_reactions_train.csv",
-                "US_patents_1976-Sep2016_1product_reactions_valid.csv",
-                "US_patents_1976-Sep2016_1product_reactions_test.csv",
-            ]
+                    dataframe_writer.write(
+                        dataframe=dataframe
+                    )
 
-            for input_file_name in input_file_names:
-                dataframe = read_csv(
-                    filepath_or_buffer=Path(input_directory_path, input_file_name),
-                    sep="\t",
-                    header=2,
-                    low_memory=False
-                )
+            elif version == "v_stereo_by_20180622_schwaller_p_et_al":
+                input_file_names = [
+                    "US_patents_1976-Sep2016_1product_reactions_train.csv",
+                    "US_patents_1976-Sep2016_1product_reactions_valid.csv",
+                    "US_patents_1976-Sep2016_1product_reactions_test.csv",
+                ]
 
-                dataframe["FileName"] = input_file_name
+                for input_file_name in input_file_names:
+                    with DataSourceExtractionUtility.open_input_file(
+                        input_directory_path=input_directory_path,
+                        input_file_name=input_file_name,
+                        archive_file_name=input_archive_file_name,
+                        archive_member_name="ReactionSeq2Seq_Dataset/{file_name:s}".format(
+                            file_name=input_file_name
+                        )
+                    ) as input_file_handle:
+                        dataframe = DataSourceFormattingUtility.read_csv_file(
+                            reader_backend=reader_backend,
+                            filepath_or_buffer=input_file_handle,
+                            sep="\t",
+                            header=2,
+                            low_memory=False
+                        )
 
-                dataframes.append(
-                    dataframe
-                )
+                    dataframe["FileName"] = input_file_name
 
-        else:
-            raise ValueError(
-                "The formatting of the data from the {data_source:s} is not supported.".format(
-                    data_source="USPTO chemical reaction dataset ({version:s})".format(
-                        version=version
+                    dataframe_writer.write(
+                        dataframe=dataframe
                     )
-                )
-            )
-
-        output_file_name = "{timestamp:s}_uspto_{version:s}.csv".format(
-            timestamp=datetime.now().strftime(
-                format="%Y%m%d%H%M%S"
-            ),
-            version=version
-        )
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+            else:
+                raise ValueError(
+                    "The formatting of the data from the {data_source:s} is not supported.".format(
+                        data_source="USPTO chemical reaction dataset ({version:s})".format(
+                            version=version
+                        )
+                    )
+                )
 
     @staticmethod
     def format_v_lef_by_20181221_bradshaw_j_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_lef_by_20181221_bradshaw_j_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -675,47 +916,65 @@ class USPTOReactionDatasetFormattingUtility:
             "filtered_test.txt",
         ]
 
+        input_archive_file_name = "lef_uspto.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_lef_by_20181221_bradshaw_j_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                header=None
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="lef_uspto/{file_name:s}".format(
+                        file_name=input_file_name
+                    )
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        header=None
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).rename(
-            columns={
-                0: "reaction_smiles",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe.rename(
+                        columns={
+                            0: "reaction_smiles",
+                        }
+                    )
+                )
 
     @staticmethod
     def format_v_1k_tpl_by_20210128_schwaller_p_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_1k_tpl_by_20210128_schwaller_p_et_al` version of the dataset.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -723,39 +982,52 @@ class USPTOReactionDatasetFormattingUtility:
             "uspto_1k_TPL_train_valid.tsv",
         ]
 
+        input_archive_file_name = "MappingChemicalReactions.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_1k_tpl_by_20210128_schwaller_p_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep="\t",
-                header=0,
-                index_col=0
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="data_set/{file_name:s}.gzip".format(
+                        file_name=input_file_name
+                    ),
+                    is_gzip_decompressed=True
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        sep="\t",
+                        header=0,
+                        index_col=0
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_1976_to_2016_remapped_by_20210407_schwaller_p_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            is_virtual_extraction_enabled: bool = False,
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_1976_to_2016_by_20210407_schwaller_p_et_al` version of the chemical reaction
@@ -763,6 +1035,12 @@ class USPTOReactionDatasetFormattingUtility:
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter is_virtual_extraction_enabled: The indicator of whether the data should be read directly from the
+            downloaded archive instead of the extracted files.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_names = [
@@ -770,40 +1048,51 @@ class USPTOReactionDatasetFormattingUtility:
             "2001_Sep2016_USPTOapplications_smiles_mapped.tsv",
         ]
 
+        input_archive_file_name = "USPTO_remapped.zip" if is_virtual_extraction_enabled else None
+
         output_file_name = "{timestamp:s}_uspto_v_1976_to_2016_by_20210407_schwaller_p_et_al.csv".format(
             timestamp=datetime.now().strftime(
                 format="%Y%m%d%H%M%S"
             )
         )
 
-        dataframes = list()
-
-        for input_file_name in input_file_names:
-            dataframe = read_csv(
-                filepath_or_buffer=Path(input_directory_path, input_file_name),
-                sep="\t",
-                header=0,
-                index_col=0
-            )
-
-            dataframe["file_name"] = input_file_name
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for input_file_name in input_file_names:
+                with DataSourceExtractionUtility.open_input_file(
+                    input_directory_path=input_directory_path,
+                    input_file_name=input_file_name,
+                    archive_file_name=input_archive_file_name,
+                    archive_member_name="USPTO_remapped/{file_name:s}".format(
+                        file_name=input_file_name
+                    )
+                ) as input_file_handle:
+                    dataframe = DataSourceFormattingUtility.read_csv_file(
+                        reader_backend=reader_backend,
+                        filepath_or_buffer=input_file_handle,
+                        sep="\t",
+                        header=0,
+                        index_col=0
+                    )
 
-            dataframes.append(
-                dataframe
-            )
+                dataframe["file_name"] = input_file_name
 
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+                dataframe_writer.write(
+                    dataframe=dataframe
+                )
 
     @staticmethod
     def format_v_chen_s_et_al(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            reader_backend: str = "pandas",
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_*_chen_s_et_al` version of the dataset.
@@ -811,6 +1100,10 @@ class USPTOReactionDatasetFormattingUtility:
         :parameter version: The version of the dataset.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter reader_backend: The backend that is used to read the input files. (_i.e._, pandas or pyarrow)
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_1976_to_2016_remapped_by_20240313_chen_s_et_al":
@@ -838,14 +1131,17 @@ class USPTOReactionDatasetFormattingUtility:
             version=version
         )
 
-        dataframe = read_csv(
+        dataframe = DataSourceFormattingUtility.read_csv_file(
+            reader_backend=reader_backend,
             filepath_or_buffer=Path(input_directory_path, input_file_name),
             header=0
         )
 
         dataframe["file_name"] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe,
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
@@ -62,18 +62,24 @@ class MiscellaneousReactionPatternDataSource(DataSourceBase):
                 if version == "v_retro_transform_db_by_20180421_avramova_s_et_al":
                     MiscellaneousReactionPatternDataSourceDownloadUtility.\
                         download_v_retro_transform_db_by_20180421_avramova_s_et_al(
-                            output_directory_path=output_directory_path
+                            output_directory_path=output_directory_path,
+                            file_download_recorder=kwargs.get("file_download_recorder"),
+                            download_cancellation_event=kwargs.get("download_cancellation_event")
                         )
 
                 if version == "v_dingos_by_20190701_button_a_et_al":
                     MiscellaneousReactionPatternDataSourceDownloadUtility.download_v_dingos_by_20190701_button_a_et_al(
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if version == "v_auto_template_by_20240627_chen_l_and_li_y":
                     MiscellaneousReactionPatternDataSourceDownloadUtility.\
                         download_v_auto_template_by_20240627_chen_l_and_li_y(
-                            output_directory_path=output_directory_path
+                            output_directory_path=output_directory_path,
+                            file_download_recorder=kwargs.get("file_download_recorder"),
+                            download_cancellation_event=kwargs.get("download_cancellation_event")
                         )
 
                 if self.logger is not None:
@@ -197,7 +203,9 @@ class MiscellaneousReactionPatternDataSource(DataSourceBase):
                 if version == "v_dingos_by_20190701_button_a_et_al":
                     MiscellaneousReactionPatternDataSourceFormattingUtility.format_v_dingos_by_20190701_button_a_et_al(
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if version == "v_auto_template_by_20240627_chen_l_and_li_y":
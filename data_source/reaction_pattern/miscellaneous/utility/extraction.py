@@ -4,7 +4,10 @@ from os import PathLike
 from pathlib import Path
 from typing import Union
 
-from zipfile import ZipFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
+from data_source.reaction_pattern.miscellaneous.utility.formatting import (
+    MiscellaneousReactionPatternDataSourceFormattingUtility
+)
 
 
 class MiscellaneousReactionPatternDataSourceExtractionUtility:
@@ -24,9 +27,12 @@ class MiscellaneousReactionPatternDataSourceExtractionUtility:
 
         input_file_name = "AutoTemplate-main.zip"
 
-        with ZipFile(
-            file=Path(input_directory_path, input_file_name)
-        ) as zip_archive_file_handle:
-            zip_archive_file_handle.extractall(
-                path=output_directory_path
-            )
+        input_file_name_patterns = MiscellaneousReactionPatternDataSourceFormattingUtility.get_input_file_name_patterns(
+            version="v_auto_template_by_20240627_chen_l_and_li_y"
+        )
+
+        DataSourceExtractionUtility.extract_zip_archive(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            output_directory_path=output_directory_path,
+            archive_member_name_patterns=input_file_name_patterns
+        )
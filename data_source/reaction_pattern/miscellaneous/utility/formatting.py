@@ -3,24 +3,60 @@
 from datetime import datetime
 from os import PathLike, walk
 from pathlib import Path
-from typing import Union
+from typing import List, Optional, Union
 
-from pandas import concat, read_csv
+from pandas import read_csv
+
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+from data_source.base.utility.writer import DataSourceDataFrameWriter
 
 
 class MiscellaneousReactionPatternDataSourceFormattingUtility:
     """ The miscellaneous chemical reaction pattern data source formatting utility class. """
 
+    @staticmethod
+    def get_input_file_name_patterns(
+            version: str
+    ) -> List[str]:
+        """
+        Get the glob patterns of the names of the input files that are read when formatting a version of the data
+        source.
+
+        :parameter version: The version of the data source.
+
+        :returns: The glob patterns of the names of the input files.
+        """
+
+        if version == "v_auto_template_by_20240627_chen_l_and_li_y":
+            return [
+                "AutoTemplate-main/data/all_templates_used.csv",
+                "AutoTemplate-main/data/*/all_templates_used.csv",
+            ]
+
+        else:
+            raise ValueError(
+                "The formatting of the data from the {data_source:s} is not supported.".format(
+                    data_source="miscellaneous chemical reaction pattern data source ({version:s})".format(
+                        version=version
+                    )
+                )
+            )
+
     @staticmethod
     def format_v_retro_transform_db_by_20180421_avramova_s_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_retro_transform_db_by_20180421_avramova_s_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "RetroTransformDB-v-1-0.txt"
@@ -41,25 +77,32 @@ class MiscellaneousReactionPatternDataSourceFormattingUtility:
 
         dataframe["FileName"] = input_file_name
 
-        dataframe.astype(
-            dtype={
-                "ID": int,
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe.astype(
+                dtype={
+                    "ID": int,
+                }
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_dingos_by_20190701_button_a_et_al(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_dingos_by_20190701_button_a_et_al` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "rxn_set.txt"
@@ -78,27 +121,34 @@ class MiscellaneousReactionPatternDataSourceFormattingUtility:
 
         dataframe["file_name"] = input_file_name
 
-        dataframe.rename(
-            columns={
-                0: "reaction_name",
-                1: "reaction_smarts",
-                2: "reaction_label",
-            }
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe.rename(
+                columns={
+                    0: "reaction_name",
+                    1: "reaction_smarts",
+                    2: "reaction_label",
+                }
+            ),
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
 
     @staticmethod
     def format_v_auto_template_by_20240627_chen_l_and_li_y(
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from the `v_auto_template_by_20240627_chen_l_and_li_y` version of the data source.
 
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         input_file_name = "all_templates_used.csv"
@@ -109,32 +159,29 @@ class MiscellaneousReactionPatternDataSourceFormattingUtility:
             )
         )
 
-        dataframes = list()
-
-        for directory_path, _, file_names in walk(
-            top=Path(input_directory_path, "AutoTemplate-main/data")
-        ):
-            for file_name in file_names:
-                if file_name == input_file_name:
-                    dataframe = read_csv(
-                        filepath_or_buffer=Path(directory_path, file_name),
-                        header=0
-                    )
-
-                    dataframe["file_name"] = "{parent_directory_name:s}/{file_name:s}".format(
-                        parent_directory_name=directory_path.split(
-                            sep="/"
-                        )[-1],
-                        file_name=file_name
-                    )
-
-                    dataframes.append(
-                        dataframe
-                    )
-
-        concat(
-            objs=dataframes
-        ).to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
-        )
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group,
+            is_empty_output_allowed=False
+        ) as dataframe_writer:
+            for directory_path, _, file_names in walk(
+                top=Path(input_directory_path, "AutoTemplate-main/data")
+            ):
+                for file_name in file_names:
+                    if file_name == input_file_name:
+                        dataframe = read_csv(
+                            filepath_or_buffer=Path(directory_path, file_name),
+                            header=0
+                        )
+
+                        dataframe["file_name"] = "{parent_directory_name:s}/{file_name:s}".format(
+                            parent_directory_name=directory_path.split(
+                                sep="/"
+                            )[-1],
+                            file_name=file_name
+                        )
+
+                        dataframe_writer.write(
+                            dataframe=dataframe
+                        )
@@ -60,7 +60,9 @@ class RetroRulesReactionPatternDatabase(DataSourceBase):
                 if version.startswith("v_release"):
                     RetroRulesReactionPatternDatabaseDownloadUtility.download_v_release(
                         version=version,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        file_download_recorder=kwargs.get("file_download_recorder"),
+                        download_cancellation_event=kwargs.get("download_cancellation_event")
                     )
 
                 if self.logger is not None:
@@ -178,7 +180,9 @@ class RetroRulesReactionPatternDatabase(DataSourceBase):
                     RetroRulesReactionPatternDatabaseFormattingUtility.format_v_release(
                         version=version,
                         input_directory_path=input_directory_path,
-                        output_directory_path=output_directory_path
+                        output_directory_path=output_directory_path,
+                        output_file_format=kwargs.get("output_file_format", "csv"),
+                        number_of_rows_per_row_group=kwargs.get("number_of_rows_per_row_group", None)
                     )
 
                 if self.logger is not None:
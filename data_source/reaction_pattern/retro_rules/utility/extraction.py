@@ -2,10 +2,9 @@
 
 from os import PathLike
 from pathlib import Path
-from shutil import copyfileobj
 from typing import Union
 
-from tarfile import TarFile
+from data_source.base.utility.extraction import DataSourceExtractionUtility
 
 
 class RetroRulesReactionPatternDatabaseExtractionUtility:
@@ -66,18 +65,8 @@ class RetroRulesReactionPatternDatabaseExtractionUtility:
                 )
             )
 
-        with TarFile.open(
-            name=Path(input_directory_path, input_file_name),
-            mode="r:gz"
-        ) as tar_archive_file_handle:
-            with tar_archive_file_handle.extractfile(
-                member=output_file_path
-            ) as source_file_handle:
-                with open(
-                    file=Path(output_directory_path, output_file_name),
-                    mode="wb"
-                ) as destination_file_handle:
-                    copyfileobj(
-                        fsrc=source_file_handle,
-                        fdst=destination_file_handle
-                    )
+        DataSourceExtractionUtility.extract_tar_archive_member(
+            archive_file_path=Path(input_directory_path, input_file_name),
+            archive_member_name=output_file_path,
+            output_file_path=Path(output_directory_path, output_file_name)
+        )
@@ -3,10 +3,12 @@
 from datetime import datetime
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from pandas import read_csv
 
+from data_source.base.utility.formatting import DataSourceFormattingUtility
+
 
 class RetroRulesReactionPatternDatabaseFormattingUtility:
     """ The `RetroRules <https://retrorules.org>`_ chemical reaction pattern database formatting utility class. """
@@ -15,7 +17,9 @@ class RetroRulesReactionPatternDatabaseFormattingUtility:
     def format_v_release(
             version: str,
             input_directory_path: Union[str, PathLike[str]],
-            output_directory_path: Union[str, PathLike[str]]
+            output_directory_path: Union[str, PathLike[str]],
+            output_file_format: str = "csv",
+            number_of_rows_per_row_group: Optional[int] = None
     ) -> None:
         """
         Format the data from a `v_release_*` version of the database.
@@ -23,6 +27,9 @@ class RetroRulesReactionPatternDatabaseFormattingUtility:
         :parameter version: The version of the database.
         :parameter input_directory_path: The path to the input directory where the data is extracted.
         :parameter output_directory_path: The path to the output directory where the data should be formatted.
+        :parameter output_file_format: The format of the output file. (_i.e._, csv, parquet, or feather)
+        :parameter number_of_rows_per_row_group: The maximum number of rows per Parquet row group or Feather record
+            batch. The value `None` indicates that the default of the `pyarrow` package should be utilized.
         """
 
         if version == "v_release_rr01_rp2_hs":
@@ -64,7 +71,9 @@ class RetroRulesReactionPatternDatabaseFormattingUtility:
 
         dataframe[column_name] = input_file_name
 
-        dataframe.to_csv(
-            path_or_buf=Path(output_directory_path, output_file_name),
-            index=False
+        DataSourceFormattingUtility.write_dataframe(
+            dataframe=dataframe,
+            output_file_path=Path(output_directory_path, output_file_name),
+            output_file_format=output_file_format,
+            number_of_rows_per_row_group=number_of_rows_per_row_group
         )
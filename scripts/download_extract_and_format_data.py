@@ -6,6 +6,7 @@ from logging import Formatter, Logger, StreamHandler, getLogger
 from pathlib import Path
 from shutil import rmtree
 
+from data_source.base.utility import DataSourceDownloadUtility, DataSourceExtractionUtility
 from data_source.compound import CompoundDataSource
 from data_source.compound_pattern import CompoundPatternDataSource
 from data_source.reaction import ReactionDataSource
@@ -84,10 +85,148 @@ def get_script_arguments() -> Namespace:
         "-nop",
         "--number_of_processes",
         default=1,
-        type=str,
+        type=int,
         help="The number of processes, if relevant."
     )
 
+    argument_parser.add_argument(
+        "-cdp",
+        "--cache_directory_path",
+        default=None,
+        type=str,
+        help="The path to the directory where the downloaded files should be cached, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-mcs",
+        "--maximum_cache_size",
+        default=None,
+        type=int,
+        help="The maximum size of the cached files in bytes, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-dcr",
+        "--disable_cache_revalidation",
+        action="store_true",
+        help="The indicator of whether to use the cached files without revalidating them against the server."
+    )
+
+    argument_parser.add_argument(
+        "-dhrc",
+        "--disable_http_response_cache",
+        action="store_true",
+        help="The indicator of whether to disable the cache of the HTTP responses that are used to discover the "
+             "versions, which are otherwise cached in the '$XDG_CACHE_HOME/data_source/http_responses' directory "
+             "(i.e., '~/.cache' if the variable is not set) and reused for 24 hours."
+    )
+
+    argument_parser.add_argument(
+        "-sd",
+        "--stream_data",
+        action="store_true",
+        help="The indicator of whether to format the data directly from the download stream, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-ve",
+        "--virtual_extraction",
+        action="store_true",
+        help="The indicator of whether to format the data directly from the downloaded archives, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-dif",
+        "--delete_input_files",
+        action="store_true",
+        help="The indicator of whether to delete the downloaded and extracted files once consumed, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-nrc",
+        "--number_of_rows_per_chunk",
+        default=None,
+        type=int,
+        help="The number of rows that are formatted at a time to bound the memory usage, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-rb",
+        "--reader_backend",
+        default="pandas",
+        type=str,
+        choices=[
+            "pandas",
+            "pyarrow",
+        ],
+        help="The backend that is used to read the input files, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-off",
+        "--output_file_format",
+        default="csv",
+        type=str,
+        choices=[
+            "csv",
+            "parquet",
+            "feather",
+        ],
+        help="The format of the formatted output file."
+    )
+
+    argument_parser.add_argument(
+        "-nrrg",
+        "--number_of_rows_per_row_group",
+        default=None,
+        type=int,
+        help="The maximum number of rows per Parquet row group or Feather record batch, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-va",
+        "--verify_archives",
+        action="store_true",
+        help="The indicator of whether to verify the integrity of the downloaded archives before the extraction."
+    )
+
+    argument_parser.add_argument(
+        "-vac",
+        "--verify_archive_checksums",
+        action="store_true",
+        help="The indicator of whether to also verify the CRC-32 checksums of the archives, if relevant."
+    )
+
+    argument_parser.add_argument(
+        "-geru",
+        "--get_estimated_resource_usage",
+        action="store_true",
+        help="The indicator of whether to get the estimated disk and memory usage of the data source version."
+    )
+
+    argument_parser.add_argument(
+        "-crl",
+        "--check_resource_limits",
+        action="store_true",
+        help="The indicator of whether to delete the input files or stream the data if the limits would be exceeded."
+    )
+
+    argument_parser.add_argument(
+        "-mdu",
+        "--maximum_disk_usage",
+        default=None,
+        type=int,
+        help="The maximum disk usage in bytes, if relevant. The available disk space is used by default."
+    )
+
+    argument_parser.add_argument(
+        "-mmu",
+        "--maximum_memory_usage",
+        default=None,
+        type=int,
+        help="The maximum memory usage in bytes, if relevant. The available memory is used by default."
+    )
+
     return argument_parser.parse_args()
 
 
@@ -133,6 +272,17 @@ if __name__ == "__main__":
 
     script_logger = get_script_logger()
 
+    DataSourceDownloadUtility.configure_download_cache(
+        cache_directory_path=script_arguments.cache_directory_path,
+        maximum_cache_size=script_arguments.maximum_cache_size,
+        is_revalidation_enabled=not script_arguments.disable_cache_revalidation
+    )
+
+    if script_arguments.disable_http_response_cache:
+        DataSourceDownloadUtility.configure_http_response_cache(
+            cache_directory_path=None
+        )
+
     if script_arguments.data_source_category == "compound":
         data_source = CompoundDataSource(
             logger=script_logger
@@ -171,7 +321,34 @@ if __name__ == "__main__":
             name=script_arguments.data_source_name
         ))
 
+    elif script_arguments.get_estimated_resource_usage:
+        print(script_arguments.data_source_category)
+        print(script_arguments.data_source_name)
+        print(script_arguments.data_source_version)
+        print(data_source.estimate_resource_usage(
+            name=script_arguments.data_source_name,
+            version=script_arguments.data_source_version,
+            is_streaming_enabled=script_arguments.stream_data,
+            is_input_file_deletion_enabled=script_arguments.delete_input_files,
+            number_of_rows_per_chunk=script_arguments.number_of_rows_per_chunk
+        ))
+
     else:
+        if script_arguments.check_resource_limits:
+            data_source_kwargs = data_source.check_resource_usage(
+                name=script_arguments.data_source_name,
+                version=script_arguments.data_source_version,
+                output_directory_path=script_arguments.output_directory_path,
+                maximum_disk_usage=script_arguments.maximum_disk_usage,
+                maximum_memory_usage=script_arguments.maximum_memory_usage,
+                is_streaming_enabled=script_arguments.stream_data,
+                is_input_file_deletion_enabled=script_arguments.delete_input_files,
+                number_of_rows_per_chunk=script_arguments.number_of_rows_per_chunk
+            )
+
+            script_arguments.stream_data = data_source_kwargs["is_streaming_enabled"]
+            script_arguments.delete_input_files = data_source_kwargs["is_input_file_deletion_enabled"]
+
         temporary_output_directory_path = Path(
             script_arguments.output_directory_path,
             "{timestamp:s}_temporary_output_directory".format(
@@ -186,14 +363,28 @@ if __name__ == "__main__":
         data_source.download(
             name=script_arguments.data_source_name,
             version=script_arguments.data_source_version,
-            output_directory_path=temporary_output_directory_path
+            output_directory_path=temporary_output_directory_path,
+            is_streaming_enabled=script_arguments.stream_data
         )
 
+        if script_arguments.verify_archives:
+            DataSourceExtractionUtility.verify_archives(
+                archive_file_paths=sorted(
+                    file_path for file_path in temporary_output_directory_path.iterdir() if file_path.is_file()
+                ),
+                number_of_processes=script_arguments.number_of_processes,
+                is_checksum_verified=script_arguments.verify_archive_checksums
+            )
+
         data_source.extract(
             name=script_arguments.data_source_name,
             version=script_arguments.data_source_version,
             input_directory_path=temporary_output_directory_path,
-            output_directory_path=temporary_output_directory_path
+            output_directory_path=temporary_output_directory_path,
+            number_of_processes=script_arguments.number_of_processes,
+            is_streaming_enabled=script_arguments.stream_data,
+            is_virtual_extraction_enabled=script_arguments.virtual_extraction,
+            is_input_file_deletion_enabled=script_arguments.delete_input_files
         )
 
         data_source.format(
@@ -201,7 +392,14 @@ if __name__ == "__main__":
             version=script_arguments.data_source_version,
             input_directory_path=temporary_output_directory_path,
             output_directory_path=script_arguments.output_directory_path,
-            number_of_processes=script_arguments.number_of_processes
+            number_of_processes=script_arguments.number_of_processes,
+            is_streaming_enabled=script_arguments.stream_data,
+            is_virtual_extraction_enabled=script_arguments.virtual_extraction,
+            is_input_file_deletion_enabled=script_arguments.delete_input_files,
+            number_of_rows_per_chunk=script_arguments.number_of_rows_per_chunk,
+            reader_backend=script_arguments.reader_backend,
+            output_file_format=script_arguments.output_file_format,
+            number_of_rows_per_row_group=script_arguments.number_of_rows_per_row_group
         )
 
         rmtree(
@@ -0,0 +1,226 @@
+""" The ``tests`` package ``conftest`` module. """
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from re import fullmatch
+from threading import Lock, Thread
+from typing import Any, Dict, Iterator, List
+
+from pytest import fixture
+
+
+class LocalHTTPServer:
+    """ The local HTTP server class that stands in for the remote hosts of the data sources. """
+
+    def __init__(
+            self
+    ) -> None:
+        """ The `__init__` method of the class. """
+
+        self.files = dict()
+        self.is_range_supported = True
+        self.maximum_number_of_response_bytes = None
+        self.failing_range_start_positions = set()
+
+        self.requests = list()
+        self.number_of_sent_bytes = 0
+
+        self._lock = Lock()
+
+        self._http_server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            self._get_request_handler_class()
+        )
+
+        self._http_server.daemon_threads = True
+
+        self._thread = Thread(
+            target=self._http_server.serve_forever,
+            daemon=True
+        )
+
+    @property
+    def url(
+            self
+    ) -> str:
+        """
+        Get the value of the base URL of the server.
+
+        :returns: The value of the base URL of the server.
+        """
+
+        return "http://127.0.0.1:{port:d}".format(
+            port=self._http_server.server_address[1]
+        )
+
+    def add_file(
+            self,
+            file_name: str,
+            file_content: bytes,
+            etag: str = "\"v1\""
+    ) -> str:
+        """
+        Add a file to the server.
+
+        :parameter file_name: The name of the file.
+        :parameter file_content: The content of the file.
+        :parameter etag: The `ETag` validator of the file.
+
+        :returns: The URL of the file.
+        """
+
+        self.files[file_name] = {
+            "content": file_content,
+            "etag": etag,
+        }
+
+        return "{url:s}/{file_name:s}".format(
+            url=self.url,
+            file_name=file_name
+        )
+
+    def get_range_requests(
+            self
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the received requests that contain a `Range` header.
+
+        :returns: The received requests that contain a `Range` header.
+        """
+
+        with self._lock:
+            return [
+                request for request in self.requests if request["range"] is not None
+            ]
+
+    def _get_request_handler_class(
+            self
+    ) -> type:
+        """
+        Get the request handler class of the server.
+
+        :returns: The request handler class of the server.
+        """
+
+        local_http_server = self
+
+        class LocalHTTPRequestHandler(BaseHTTPRequestHandler):
+            """ The local HTTP request handler class. """
+
+            protocol_version = "HTTP/1.1"
+
+            def log_message(
+                    self,
+                    *args
+            ) -> None:
+                """ Suppress the logging of the requests. """
+
+            def do_GET(
+                    self
+            ) -> None:
+                """ Handle an HTTP GET request. """
+
+                file_entry = local_http_server.files.get(self.path.lstrip("/"), None)
+
+                with local_http_server._lock:
+                    local_http_server.requests.append({
+                        "path": self.path,
+                        "range": self.headers.get("Range", None),
+                    })
+
+                if file_entry is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+
+                    return
+
+                file_content = file_entry["content"]
+
+                range_match = fullmatch(
+                    pattern=r"bytes=(\d+)-(\d*)",
+                    string=self.headers.get("Range", "")
+                )
+
+                is_range_honoured = local_http_server.is_range_supported and range_match is not None and (
+                    self.headers.get("If-Range", None) in [None, file_entry["etag"], ]
+                )
+
+                if is_range_honoured:
+                    start_position = int(range_match.group(1))
+                    end_position = min(
+                        int(range_match.group(2)) if range_match.group(2) else len(file_content) - 1,
+                        len(file_content) - 1
+                    )
+
+                    if start_position in local_http_server.failing_range_start_positions:
+                        self.send_response(503)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+
+                        return
+
+                    response_content = file_content[start_position:end_position + 1]
+
+                    self.send_response(206)
+                    self.send_header("Content-Range", "bytes {start_position:d}-{end_position:d}/{size:d}".format(
+                        start_position=start_position,
+                        end_position=end_position,
+                        size=len(file_content)
+                    ))
+
+                else:
+                    response_content = file_content
+
+                    self.send_response(200)
+
+                if local_http_server.maximum_number_of_response_bytes is not None and range_match is not None and \
+                        range_match.group(0) != "bytes=0-0":
+                    response_content = response_content[:local_http_server.maximum_number_of_response_bytes]
+
+                if local_http_server.is_range_supported:
+                    self.send_header("Accept-Ranges", "bytes")
+
+                self.send_header("ETag", file_entry["etag"])
+                self.send_header("Content-Length", str(len(response_content)))
+                self.end_headers()
+
+                self.wfile.write(response_content)
+
+                with local_http_server._lock:
+                    local_http_server.number_of_sent_bytes += len(response_content)
+
+        return LocalHTTPRequestHandler
+
+    def start(
+            self
+    ) -> None:
+        """ Start the server. """
+
+        self._thread.start()
+
+    def stop(
+            self
+    ) -> None:
+        """ Stop the server. """
+
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+
+@fixture
+def local_http_server() -> Iterator[LocalHTTPServer]:
+    """
+    Get a local HTTP server that supports the HTTP range requests.
+
+    :returns: The local HTTP server.
+    """
+
+    local_http_server = LocalHTTPServer()
+
+    local_http_server.start()
+
+    try:
+        yield local_http_server
+
+    finally:
+        local_http_server.stop()
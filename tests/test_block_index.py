@@ -0,0 +1,95 @@
+""" The ``tests`` package ``test_block_index`` module. """
+
+from bz2 import compress
+from os import urandom
+from pathlib import Path
+
+from pytest import fixture, mark
+
+from data_source.base.utility import DataSourceBZ2BlockIndex
+
+
+@fixture(autouse=True)
+def disabled_cache(monkeypatch) -> None:
+    """ Disable the cache of the indices of the BZ2 files. """
+
+    monkeypatch.setattr(DataSourceBZ2BlockIndex, "_cache_configuration", {
+        "is_enabled": False,
+        "cache_directory_path": None,
+    })
+
+
+@fixture
+def file_contents() -> bytes:
+    """ Get the contents of a BZ2 file of multiple streams and blocks. """
+
+    return urandom(250 * 1024) + b"C>>CC\n" * 10000 + urandom(150 * 1024)
+
+
+@fixture
+def archive_file_path(tmp_path, file_contents) -> Path:
+    """ Get the path to a BZ2 file of multiple streams and blocks. """
+
+    Path(tmp_path, "input.txt.bz2").write_bytes(
+        compress(file_contents[:300 * 1024], compresslevel=1) + compress(file_contents[300 * 1024:], compresslevel=1)
+    )
+
+    return Path(tmp_path, "input.txt.bz2")
+
+
+@mark.parametrize("number_of_processes", [1, 2, ])
+def test_read(archive_file_path, file_contents, number_of_processes) -> None:
+    """ Test the reading of the ranges of the uncompressed data of a BZ2 file. """
+
+    block_index = DataSourceBZ2BlockIndex(
+        archive_file_path=archive_file_path,
+        number_of_processes=number_of_processes
+    )
+
+    assert len(block_index._get_index()["block_bit_offsets"]) == 6
+    assert block_index.get_uncompressed_size() == len(file_contents)
+    assert block_index.read(offset=0, size=len(file_contents)) == file_contents
+    assert block_index.read(offset=99 * 1024, size=4096) == file_contents[99 * 1024:103 * 1024]
+
+
+@mark.parametrize("magic_number_name", ["_block_magic_number", "_end_of_stream_magic_number", ])
+def test_read_with_false_positive_magic_number(
+        monkeypatch,
+        archive_file_path,
+        file_contents,
+        magic_number_name
+) -> None:
+    """ Test that a magic number that occurs by chance in the compressed data of a block is not a block boundary. """
+
+    find_magic_number_bit_offsets = DataSourceBZ2BlockIndex._find_magic_number_bit_offsets
+
+    block_bit_offsets = DataSourceBZ2BlockIndex(
+        archive_file_path=archive_file_path
+    )._get_index()["block_bit_offsets"]
+
+    # The false positive is placed in the middle of the second block of the first stream.
+    false_positive_bit_offset = (block_bit_offsets[1][0] + block_bit_offsets[1][1]) // 2 + 3
+
+    def find_magic_number_bit_offsets_with_false_positive(archive_file_handle, magic_number) -> list:
+        magic_number_bit_offsets = find_magic_number_bit_offsets(
+            archive_file_handle=archive_file_handle,
+            magic_number=magic_number
+        )
+
+        if magic_number == getattr(DataSourceBZ2BlockIndex, magic_number_name):
+            magic_number_bit_offsets = sorted(magic_number_bit_offsets + [false_positive_bit_offset, ])
+
+        return magic_number_bit_offsets
+
+    monkeypatch.setattr(
+        DataSourceBZ2BlockIndex,
+        "_find_magic_number_bit_offsets",
+        staticmethod(find_magic_number_bit_offsets_with_false_positive)
+    )
+
+    block_index = DataSourceBZ2BlockIndex(
+        archive_file_path=archive_file_path
+    )
+
+    assert block_index._get_index()["block_bit_offsets"] == block_bit_offsets
+    assert block_index.read(offset=0, size=len(file_contents)) == file_contents
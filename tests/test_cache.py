@@ -0,0 +1,142 @@
+""" The ``tests`` package ``test_cache`` module. """
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from data_source.base.utility import DataSourceCacheUtility, DataSourceDownloadCache, DataSourceDownloadUtility
+
+
+def _store_files(
+        cache_directory_path: str,
+        process_index: int,
+        number_of_files: int
+) -> None:
+    """ Store files in a cache from a separate process. """
+
+    download_cache = DataSourceDownloadCache(
+        cache_directory_path=cache_directory_path
+    )
+
+    for file_index in range(number_of_files):
+        file_path = Path(cache_directory_path, "{process_index:d}_{file_index:d}.txt".format(
+            process_index=process_index,
+            file_index=file_index
+        ))
+
+        file_path.write_bytes(file_path.name.encode())
+
+        download_cache.store_file(
+            file_url="https://example.com/{file_name:s}".format(
+                file_name=file_path.name
+            ),
+            file_validators={
+                "ETag": "\"{file_name:s}\"".format(
+                    file_name=file_path.name
+                ),
+            },
+            file_path=file_path
+        )
+
+
+def test_store_file_from_multiple_processes(tmp_path) -> None:
+    """ Test that the files that are stored concurrently by multiple processes are all kept in the index. """
+
+    with ProcessPoolExecutor(
+        max_workers=4
+    ) as process_pool_executor:
+        for future in [
+            process_pool_executor.submit(
+                _store_files,
+                cache_directory_path=str(tmp_path),
+                process_index=process_index,
+                number_of_files=25
+            ) for process_index in range(4)
+        ]:
+            future.result()
+
+    assert len(DataSourceDownloadCache(
+        cache_directory_path=tmp_path
+    )._read_index()) == 100
+
+    assert list(tmp_path.glob("index.json.*.tmp")) == list()
+
+
+def test_evict_least_recently_used_files(tmp_path) -> None:
+    """ Test the eviction of the least recently used files once the maximum size of the cache is exceeded. """
+
+    download_cache = DataSourceDownloadCache(
+        cache_directory_path=Path(tmp_path, "cache"),
+        maximum_cache_size=2048
+    )
+
+    for file_name in ["a.txt", "b.txt", "c.txt", ]:
+        Path(tmp_path, file_name).write_bytes(file_name[:1].encode() * 1024)
+
+        download_cache.store_file(
+            file_url="https://example.com/{file_name:s}".format(
+                file_name=file_name
+            ),
+            file_validators={
+                "ETag": file_name,
+            },
+            file_path=Path(tmp_path, file_name)
+        )
+
+        if file_name == "b.txt":
+            assert download_cache.restore_file(
+                file_url="https://example.com/a.txt",
+                file_validators=None,
+                output_file_path=Path(tmp_path, "a_restored.txt")
+            ) is not None
+
+    assert sorted(
+        file_entry["file_url"] for file_entry in download_cache._read_index().values()
+    ) == ["https://example.com/a.txt", "https://example.com/c.txt", ]
+
+    download_cache.maximum_cache_size = 512
+
+    Path(tmp_path, "d.txt").write_bytes(b"d" * 1024)
+
+    download_cache.store_file(
+        file_url="https://example.com/d.txt",
+        file_validators={
+            "ETag": "d.txt",
+        },
+        file_path=Path(tmp_path, "d.txt")
+    )
+
+    assert [
+        file_entry["file_url"] for file_entry in download_cache._read_index().values()
+    ] == ["https://example.com/d.txt", ]
+
+    assert len(list(Path(tmp_path, "cache", "objects").glob("*/*"))) == 1
+
+
+def test_get_cache_directory_path(monkeypatch, tmp_path) -> None:
+    """ Test that the default path to the directory of a cache is resolved after the package is imported. """
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert DataSourceCacheUtility.get_cache_directory_path(
+        cache_configuration=DataSourceDownloadUtility._http_response_cache_configuration,
+        cache_name="http_responses"
+    ) == Path(tmp_path, "data_source", "http_responses")
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setenv("HOME", str(Path(tmp_path, "home")))
+
+    assert DataSourceCacheUtility.get_cache_directory_path(
+        cache_configuration=DataSourceDownloadUtility._http_response_cache_configuration,
+        cache_name="http_responses"
+    ) == Path(tmp_path, "home", ".cache", "data_source", "http_responses")
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_http_response_cache_configuration", dict())
+
+    DataSourceDownloadUtility.configure_http_response_cache(
+        cache_directory_path=None
+    )
+
+    assert DataSourceCacheUtility.get_cache_directory_path(
+        cache_configuration=DataSourceDownloadUtility._http_response_cache_configuration,
+        cache_name="http_responses"
+    ) is None
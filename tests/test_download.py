@@ -0,0 +1,567 @@
+""" The ``tests`` package ``test_download`` module. """
+
+from asyncio import CancelledError, create_task, gather, run, sleep as sleep_async
+from concurrent.futures import CancelledError as DownloadCancelledError
+from gzip import GzipFile, compress
+from hashlib import md5, sha256
+from io import BytesIO
+from json import dump, load
+from os import urandom
+from pathlib import Path
+from threading import Event
+from time import sleep
+
+from pytest import fixture, mark, raises
+
+from data_source.base.base import DataSourceBase
+from data_source.base.utility import DataSourceDownloadUtility
+
+
+@fixture(autouse=True)
+def small_file_segments(monkeypatch) -> None:
+    """ Shrink the chunks, segments, and synchronization intervals of the downloads to the size of the test files. """
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_file_chunk_size", 1024)
+    monkeypatch.setattr(DataSourceDownloadUtility, "_file_synchronization_interval_size", 1024)
+    monkeypatch.setattr(DataSourceDownloadUtility, "_minimum_file_segment_size", 1024)
+
+    monkeypatch.setattr("data_source.base.utility.download.sleep", lambda seconds: None)
+
+
+def test_download_file_in_segments(local_http_server, tmp_path) -> None:
+    """ Test the download of a file in concurrent byte ranges. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=4
+    )
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert len(local_http_server.get_range_requests()) == 5
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["archive.zip", "archive.zip.digests.json", ]
+
+
+def test_download_file_in_segments_without_range_support(local_http_server, tmp_path) -> None:
+    """ Test the fallback to a single stream if the server does not support the HTTP range requests. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    local_http_server.is_range_supported = False
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=4
+    )
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert local_http_server.number_of_sent_bytes == 2 * len(file_content)
+
+
+def test_download_file_in_segments_resumes_across_calls(local_http_server, tmp_path) -> None:
+    """ Test the resumption of the interrupted byte ranges by the next download of the file. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    local_http_server.maximum_number_of_response_bytes = 4 * 1024
+
+    with raises(ConnectionError):
+        DataSourceDownloadUtility.download_file(
+            file_url=file_url,
+            file_name="archive.zip",
+            output_directory_path=tmp_path,
+            maximum_number_of_retries=0,
+            number_of_segments=4
+        )
+
+    with open(Path(tmp_path, "archive.zip.part.segments.json")) as segment_file_metadata_file_handle:
+        segment_file_metadata = load(segment_file_metadata_file_handle)
+
+    assert [
+        segment["durable_position"] - segment["start_position"] for segment in segment_file_metadata["segments"]
+    ] == [4 * 1024, ] * 4
+
+    local_http_server.maximum_number_of_response_bytes = None
+    local_http_server.requests.clear()
+    local_http_server.number_of_sent_bytes = 0
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=4
+    )
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert sorted(
+        request["range"] for request in local_http_server.get_range_requests() if request["range"] != "bytes=0-0"
+    ) == sorted(
+        "bytes={start_position:d}-{end_position:d}".format(
+            start_position=segment["start_position"] + 4 * 1024,
+            end_position=segment["end_position"]
+        ) for segment in segment_file_metadata["segments"]
+    )
+    assert local_http_server.number_of_sent_bytes == len(file_content) - 4 * 4 * 1024 + 1
+    assert not Path(tmp_path, "archive.zip.part.segments.json").exists()
+
+
+def test_download_file_in_segments_resumes_short_reads(local_http_server, tmp_path) -> None:
+    """ Test the resumption of the byte ranges whose responses end before the requested byte range. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    local_http_server.maximum_number_of_response_bytes = 6 * 1024
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        maximum_number_of_retries=2,
+        number_of_segments=4
+    )
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+
+
+def test_download_file_in_segments_stops_after_repeated_early_eof(local_http_server, tmp_path) -> None:
+    """ Test the limit on the retries of the byte ranges whose responses repeatedly end early. """
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=urandom(64 * 1024)
+    )
+
+    local_http_server.maximum_number_of_response_bytes = 0
+
+    with raises(ConnectionError):
+        DataSourceDownloadUtility.download_file(
+            file_url=file_url,
+            file_name="archive.zip",
+            output_directory_path=tmp_path,
+            maximum_number_of_retries=2,
+            number_of_segments=4
+        )
+
+    assert len(local_http_server.get_range_requests()) == 1 + 4 * 3
+    assert not Path(tmp_path, "archive.zip").exists()
+
+
+@fixture
+def consumed_numbers_of_bytes(monkeypatch) -> list:
+    """ Record the numbers of bytes that are consumed from the bandwidth rate limits. """
+
+    consumed_numbers_of_bytes = list()
+
+    def consume_rate_limits(url, number_of_requests=0, number_of_bytes=0) -> None:
+        consumed_numbers_of_bytes.append(number_of_bytes)
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_consume_rate_limits", consume_rate_limits)
+
+    return consumed_numbers_of_bytes
+
+
+def test_get_rate_limited_stream(consumed_numbers_of_bytes) -> None:
+    """ Test the consumption of the bandwidth rate limits by a GZIP stream that is decompressed on the fly. """
+
+    file_content = b"C>>CC\tid\n" * 100000
+
+    compressed_file_content = compress(file_content)
+
+    with GzipFile(
+        fileobj=DataSourceDownloadUtility.get_rate_limited_stream(
+            stream=BytesIO(compressed_file_content),
+            url="https://example.com/file.txt.gz"
+        )
+    ) as gzip_archive_file_handle:
+        assert gzip_archive_file_handle.read() == file_content
+
+    assert sum(consumed_numbers_of_bytes) == len(compressed_file_content)
+
+
+@mark.parametrize("number_of_segments", [1, 4, ])
+def test_download_file_consumes_rate_limits(
+        local_http_server,
+        tmp_path,
+        consumed_numbers_of_bytes,
+        number_of_segments
+) -> None:
+    """ Test the consumption of the bandwidth rate limits by the downloaded bytes. """
+
+    file_content = urandom(64 * 1024)
+
+    DataSourceDownloadUtility.download_file(
+        file_url=local_http_server.add_file(
+            file_name="archive.zip",
+            file_content=file_content
+        ),
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=number_of_segments
+    )
+
+    assert sum(consumed_numbers_of_bytes) == len(file_content)
+
+
+class LocalDataSource(DataSourceBase):
+    """ The data source class that downloads a file from the local HTTP server. """
+
+    def __init__(
+            self,
+            file_url: str
+    ) -> None:
+        """
+        The `__init__` method of the class.
+
+        :parameter file_url: The URL of the file.
+        """
+
+        super().__init__()
+
+        self.file_url = file_url
+        self.is_download_stopped = Event()
+
+    def download(
+            self,
+            **kwargs
+    ) -> None:
+        """ Download the data from the data source. """
+
+        try:
+            DataSourceDownloadUtility.download_file(
+                file_url=self.file_url,
+                file_name=self.file_url.split("/")[-1],
+                output_directory_path=kwargs["output_directory_path"],
+                download_cancellation_event=kwargs.get("download_cancellation_event")
+            )
+
+        finally:
+            self.is_download_stopped.set()
+
+    def extract(
+            self,
+            **kwargs
+    ) -> None:
+        """ Extract the data from the data source. """
+
+    def format(
+            self,
+            **kwargs
+    ) -> None:
+        """ Format the data from the data source. """
+
+
+def test_download_async_with_cancelled_data_source(monkeypatch, local_http_server, tmp_path) -> None:
+    """ Test that the cancellation of an asynchronous download stops only the download of the cancelled data source. """
+
+    slow_file_content = urandom(64 * 1024)
+    file_content = urandom(64 * 1024)
+
+    slow_data_source = LocalDataSource(
+        file_url=local_http_server.add_file(
+            file_name="slow_archive.zip",
+            file_content=slow_file_content
+        )
+    )
+
+    data_source = LocalDataSource(
+        file_url=local_http_server.add_file(
+            file_name="archive.zip",
+            file_content=file_content
+        )
+    )
+
+    is_slow_download_started = Event()
+
+    def consume_rate_limits(url, number_of_requests=0, number_of_bytes=0) -> None:
+        if url == slow_data_source.file_url and number_of_bytes > 0:
+            is_slow_download_started.set()
+
+            sleep(0.05)
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_consume_rate_limits", consume_rate_limits)
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_download_executor", None)
+    monkeypatch.setattr(DataSourceDownloadUtility, "_maximum_number_of_concurrent_downloads", 2)
+
+    async def download_data_sources() -> None:
+        slow_download_task = create_task(
+            slow_data_source.download_async(
+                output_directory_path=tmp_path
+            )
+        )
+
+        download_task = create_task(
+            data_source.download_async(
+                output_directory_path=tmp_path
+            )
+        )
+
+        while not is_slow_download_started.is_set():
+            await sleep_async(0.01)
+
+        slow_download_task.cancel()
+
+        slow_download_result, _ = await gather(slow_download_task, download_task, return_exceptions=True)
+
+        assert isinstance(slow_download_result, CancelledError)
+
+    run(download_data_sources())
+
+    assert slow_data_source.is_download_stopped.wait(timeout=5)
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert not Path(tmp_path, "slow_archive.zip").exists()
+    assert Path(tmp_path, "slow_archive.zip.part").stat().st_size < len(slow_file_content)
+
+
+def test_get_resumable_stream(local_http_server) -> None:
+    """ Test the resumption of an interrupted download stream from the last byte that was read. """
+
+    file_content = urandom(64 * 1024)
+
+    local_http_server.maximum_number_of_response_bytes = 20 * 1024
+
+    with DataSourceDownloadUtility.get_resumable_stream(
+        url=local_http_server.add_file(
+            file_name="archive.zip",
+            file_content=file_content
+        )
+    ) as file_download_stream_handle:
+        assert file_download_stream_handle.read() == file_content
+
+    assert [request["range"] for request in local_http_server.get_range_requests()] == [
+        "bytes=0-", "bytes=20480-", "bytes=40960-", "bytes=61440-",
+    ]
+
+
+def test_get_resumable_stream_with_changed_file(local_http_server) -> None:
+    """ Test that an interrupted download stream is not resumed if the file has changed. """
+
+    local_http_server.maximum_number_of_response_bytes = 20 * 1024
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=urandom(64 * 1024)
+    )
+
+    with DataSourceDownloadUtility.get_resumable_stream(
+        url=file_url
+    ) as file_download_stream_handle:
+        assert len(file_download_stream_handle.read(20 * 1024)) == 20 * 1024
+
+        local_http_server.add_file(
+            file_name="archive.zip",
+            file_content=urandom(64 * 1024),
+            etag="\"v2\""
+        )
+
+        with raises(ValueError):
+            file_download_stream_handle.read()
+
+
+def test_download_file_in_segments_with_download_cache(monkeypatch, local_http_server, tmp_path) -> None:
+    """ Test that the download cache and the segmented download share a single probe of the file. """
+
+    file_content = urandom(64 * 1024)
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_download_cache", None)
+
+    DataSourceDownloadUtility.configure_download_cache(
+        cache_directory_path=Path(tmp_path, "cache")
+    )
+
+    DataSourceDownloadUtility.download_file(
+        file_url=local_http_server.add_file(
+            file_name="archive.zip",
+            file_content=file_content
+        ),
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=4
+    )
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert [request["range"] for request in local_http_server.get_range_requests()].count("bytes=0-0") == 1
+
+
+def test_download_file_resumes_single_stream(monkeypatch, local_http_server, tmp_path) -> None:
+    """ Test the resumption of an interrupted single-stream download from the durably written bytes. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    download_cancellation_event = Event()
+
+    number_of_consumed_bytes = list()
+
+    def consume_rate_limits(url, number_of_requests=0, number_of_bytes=0) -> None:
+        number_of_consumed_bytes.append(number_of_bytes)
+
+        if sum(number_of_consumed_bytes) >= 16 * 1024:
+            download_cancellation_event.set()
+
+    monkeypatch.setattr(DataSourceDownloadUtility, "_consume_rate_limits", consume_rate_limits)
+
+    with raises(DownloadCancelledError):
+        DataSourceDownloadUtility.download_file(
+            file_url=file_url,
+            file_name="archive.zip",
+            output_directory_path=tmp_path,
+            download_cancellation_event=download_cancellation_event
+        )
+
+    with open(Path(tmp_path, "archive.zip.part.json")) as partial_file_metadata_file_handle:
+        partial_file_metadata = load(partial_file_metadata_file_handle)
+
+    assert partial_file_metadata["file_url"] == file_url
+    assert partial_file_metadata["validator"] == "\"v1\""
+    assert partial_file_metadata["number_of_durable_bytes"] == 16 * 1024
+    assert Path(tmp_path, "archive.zip.part").read_bytes() == file_content[:16 * 1024]
+
+    local_http_server.requests.clear()
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path
+    )
+
+    with open(Path(tmp_path, "archive.zip.digests.json")) as file_digest_manifest_file_handle:
+        file_digest_manifest = load(file_digest_manifest_file_handle)
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert [request["range"] for request in local_http_server.requests] == ["bytes=16384-", ]
+    assert file_digest_manifest["sha256"] == sha256(file_content).hexdigest()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["archive.zip", "archive.zip.digests.json", ]
+
+
+@mark.parametrize("validator, number_of_durable_bytes, file_range", [
+    ("\"v1\"", 16 * 1024, "bytes=16384-", ),
+    ("\"v0\"", 16 * 1024, "bytes=16384-", ),
+    ("\"v1\"", 8 * 1024, "bytes=8192-", ),
+])
+def test_download_file_resumes_single_stream_from_partial_file(
+        local_http_server,
+        tmp_path,
+        validator,
+        number_of_durable_bytes,
+        file_range
+) -> None:
+    """
+    Test that a single-stream download resumes after the durable prefix of the partial file, which is hashed again,
+    and restarts if the validator of the partial file does not match the `If-Range` validator of the server.
+    """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    # The bytes after the durable prefix are not trusted, so they are corrupted to check that they are overwritten.
+    Path(tmp_path, "archive.zip.part").write_bytes(
+        (file_content[:16 * 1024] if validator == "\"v1\"" else urandom(16 * 1024))[:number_of_durable_bytes] +
+        urandom(16 * 1024 - number_of_durable_bytes)
+    )
+
+    with open(Path(tmp_path, "archive.zip.part.json"), mode="w") as partial_file_metadata_file_handle:
+        dump({
+            "file_url": file_url,
+            "validator": validator,
+            "number_of_durable_bytes": number_of_durable_bytes,
+        }, partial_file_metadata_file_handle)
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path
+    )
+
+    with open(Path(tmp_path, "archive.zip.digests.json")) as file_digest_manifest_file_handle:
+        file_digest_manifest = load(file_digest_manifest_file_handle)
+
+    assert Path(tmp_path, "archive.zip").read_bytes() == file_content
+    assert [request["range"] for request in local_http_server.requests] == [file_range, ]
+    assert local_http_server.number_of_sent_bytes == len(file_content) - (
+        number_of_durable_bytes if validator == "\"v1\"" else 0
+    )
+    assert file_digest_manifest["sha256"] == sha256(file_content).hexdigest()
+
+
+@mark.parametrize("download_mode", ["plain", "resumed", "segmented", ])
+def test_get_file_digests(local_http_server, tmp_path, download_mode) -> None:
+    """ Test that the digests of the downloaded files match their contents until the files are modified. """
+
+    file_content = urandom(64 * 1024)
+
+    file_url = local_http_server.add_file(
+        file_name="archive.zip",
+        file_content=file_content
+    )
+
+    if download_mode == "resumed":
+        Path(tmp_path, "archive.zip.part").write_bytes(file_content[:24 * 1024])
+
+        with open(Path(tmp_path, "archive.zip.part.json"), mode="w") as partial_file_metadata_file_handle:
+            dump({
+                "file_url": file_url,
+                "validator": "\"v1\"",
+                "number_of_durable_bytes": 24 * 1024,
+            }, partial_file_metadata_file_handle)
+
+    DataSourceDownloadUtility.download_file(
+        file_url=file_url,
+        file_name="archive.zip",
+        output_directory_path=tmp_path,
+        number_of_segments=4 if download_mode == "segmented" else 1,
+        is_md5_digest_computed=True
+    )
+
+    file_digests = DataSourceDownloadUtility.get_file_digests(
+        file_path=Path(tmp_path, "archive.zip")
+    )
+
+    assert file_digests["file_url"] == file_url
+    assert file_digests["file_size"] == len(file_content)
+    assert file_digests["sha256"] == sha256(file_content).hexdigest()
+    assert file_digests["md5"] == md5(file_content).hexdigest()
+
+    with open(Path(tmp_path, "archive.zip"), mode="ab") as file_handle:
+        file_handle.write(b"\0")
+
+    assert DataSourceDownloadUtility.get_file_digests(
+        file_path=Path(tmp_path, "archive.zip")
+    ) is None
+
+    assert DataSourceDownloadUtility.read_file_digest_manifest(
+        file_path=Path(tmp_path, "archive.zip")
+    ) == file_digests
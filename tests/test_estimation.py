@@ -0,0 +1,120 @@
+""" The ``tests`` package ``test_estimation`` module. """
+
+from pytest import fixture
+
+from data_source.base.utility import DataSourceDownloadUtility, DataSourceEstimationUtility
+from data_source.reaction.crd.crd import ChemicalReactionDatabase
+from data_source.reaction.ord.ord import OpenReactionDatabase
+
+
+@fixture(autouse=True)
+def file_sizes(monkeypatch) -> None:
+    """ Replace the sizes of the remote files by fixed sizes. """
+
+    monkeypatch.setattr(DataSourceEstimationUtility, "get_file_sizes", lambda file_url, file_name: {
+        "download_size": 1024 ** 3,
+        "uncompressed_size": 1024 ** 3,
+        "is_archive": False,
+        "fetch_time": 0.0,
+    })
+
+
+def test_download_files_with_file_download_recorder(tmp_path) -> None:
+    """ Test the recording of the URLs and names of the files instead of downloading them. """
+
+    file_download_recorder = list()
+
+    DataSourceDownloadUtility.download_files(
+        file_urls_and_names=[("http://127.0.0.1:1/a", "a.txt", ), ("http://127.0.0.1:1/b", "b.txt", ), ],
+        output_directory_path=tmp_path,
+        file_download_recorder=file_download_recorder
+    )
+
+    DataSourceDownloadUtility.download_file(
+        file_url="http://127.0.0.1:1/c",
+        file_name="c.txt",
+        output_directory_path=tmp_path,
+        file_download_recorder=file_download_recorder
+    )
+
+    assert file_download_recorder == [
+        ("http://127.0.0.1:1/a", "a.txt", ),
+        ("http://127.0.0.1:1/b", "b.txt", ),
+        ("http://127.0.0.1:1/c", "c.txt", ),
+    ]
+
+    assert list(tmp_path.iterdir()) == list()
+
+
+def test_estimate_resource_usage_downloads_once(monkeypatch) -> None:
+    """ Test that the download of a version of a data source is only recorded once per estimate. """
+
+    data_source = ChemicalReactionDatabase()
+
+    download = data_source.download
+
+    download_kwargs = list()
+
+    def record_download(**kwargs) -> None:
+        download_kwargs.append(kwargs)
+
+        download(**kwargs)
+
+    monkeypatch.setattr(data_source, "download", record_download)
+
+    resource_usage = data_source.estimate_resource_usage(
+        version="v_reaction_smiles_2023",
+        is_streaming_enabled=True
+    )
+
+    assert len(download_kwargs) == 1
+    assert not resource_usage["is_streaming_enabled"]
+    assert resource_usage["download_size"] == 1024 ** 3
+
+
+def test_estimate_resource_usage_with_number_of_rows_per_chunk() -> None:
+    """ Test the peak memory usage of the versions that are formatted in chunks. """
+
+    resource_usage = ChemicalReactionDatabase().estimate_resource_usage(
+        version="v_reaction_smiles_2023"
+    )
+
+    chunked_resource_usage = ChemicalReactionDatabase().estimate_resource_usage(
+        version="v_reaction_smiles_2023",
+        number_of_rows_per_chunk=1000
+    )
+
+    unchunked_resource_usage = OpenReactionDatabase().estimate_resource_usage(
+        version="v_release_0_1_0",
+        number_of_rows_per_chunk=1000
+    )
+
+    assert chunked_resource_usage["peak_memory_usage"] == int(
+        1000 * DataSourceEstimationUtility._average_row_size * DataSourceEstimationUtility._memory_usage_factor
+    )
+
+    assert resource_usage["peak_memory_usage"] == int(1024 ** 3 * DataSourceEstimationUtility._memory_usage_factor)
+    assert unchunked_resource_usage["peak_memory_usage"] == resource_usage["peak_memory_usage"]
+
+
+def test_get_file_sizes_probes_file_once(monkeypatch, local_http_server) -> None:
+    """ Test that the sizes of a remote file are read from a single probe of the file. """
+
+    monkeypatch.undo()
+
+    monkeypatch.setattr(DataSourceEstimationUtility, "_file_size_catalog_configuration", {
+        "is_enabled": False,
+        "cache_directory_path": None,
+        "time_to_live": None,
+    })
+
+    file_sizes = DataSourceEstimationUtility.get_file_sizes(
+        file_url=local_http_server.add_file(
+            file_name="file.txt",
+            file_content=b"C>>CC\n" * 1024
+        ),
+        file_name="file.txt"
+    )
+
+    assert file_sizes["download_size"] == file_sizes["uncompressed_size"] == 6 * 1024
+    assert [request["range"] for request in local_http_server.requests] == ["bytes=0-0", ]
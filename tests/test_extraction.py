@@ -0,0 +1,429 @@
+""" The ``tests`` package ``test_extraction`` module. """
+
+from bz2 import compress as bz2_compress
+from gzip import compress
+from hashlib import sha256
+from io import BytesIO
+from json import dumps
+from os import urandom
+from pathlib import Path
+from pickle import dumps as pickle_dumps
+from queue import Queue
+from tarfile import TarFile, TarInfo
+from zipfile import ZipFile
+
+from pandas import read_csv
+from pandas.testing import assert_frame_equal
+
+from pytest import mark, raises
+
+from data_source.base.utility import DataSourceDownloadUtility, DataSourceExtractionUtility
+from data_source.reaction.uspto.utility.formatting import USPTOReactionDatasetFormattingUtility
+
+
+@mark.parametrize("number_of_threads", [1, 2, ])
+def test_decompress_multi_member_gzip_file(tmp_path, number_of_threads) -> None:
+    """ Test the decompression of a multi-member GZIP file. """
+
+    file_contents = [urandom(256 * 1024), b"C>>CC\n" * 100000, b"", urandom(1024), ]
+
+    Path(tmp_path, "input.txt.gz").write_bytes(b"".join(compress(file_content) for file_content in file_contents))
+
+    DataSourceExtractionUtility.decompress_gzip_file(
+        input_file_path=Path(tmp_path, "input.txt.gz"),
+        output_file_path=Path(tmp_path, "input.txt"),
+        number_of_threads=number_of_threads
+    )
+
+    assert Path(tmp_path, "input.txt").read_bytes() == b"".join(file_contents)
+
+
+def test_decompress_gzip_file_chunks_are_bounded(tmp_path, monkeypatch) -> None:
+    """ Test the limit on the size of the decompressed chunks of a highly compressed GZIP file. """
+
+    monkeypatch.setattr(DataSourceExtractionUtility, "_decompressed_chunk_size", 64 * 1024)
+
+    Path(tmp_path, "input.txt.gz").write_bytes(compress(b"\0" * 16 * 1024 * 1024))
+
+    decompressed_chunk_queue = Queue()
+
+    DataSourceExtractionUtility._decompress_gzip_file_chunks(
+        input_file_path=Path(tmp_path, "input.txt.gz"),
+        decompressed_chunk_queue=decompressed_chunk_queue
+    )
+
+    decompressed_chunks = list(iter(decompressed_chunk_queue.get, None))
+
+    assert max(len(decompressed_chunk) for decompressed_chunk in decompressed_chunks) == 64 * 1024
+    assert sum(len(decompressed_chunk) for decompressed_chunk in decompressed_chunks) == 16 * 1024 * 1024
+
+
+def test_decompress_truncated_gzip_file(tmp_path) -> None:
+    """ Test the rejection of a truncated GZIP file by the pipelined decompression. """
+
+    Path(tmp_path, "input.txt.gz").write_bytes(compress(urandom(256 * 1024))[:-1024])
+
+    with raises(EOFError):
+        DataSourceExtractionUtility.decompress_gzip_file(
+            input_file_path=Path(tmp_path, "input.txt.gz"),
+            output_file_path=Path(tmp_path, "input.txt"),
+            number_of_threads=2
+        )
+
+
+@mark.parametrize("is_checksum_verified", [False, True, ])
+@mark.parametrize("archive_file_name, compress_function", [
+    ("input.txt.gz", compress),
+    ("input.txt.bz2", bz2_compress),
+])
+def test_verify_archive(tmp_path, is_checksum_verified, archive_file_name, compress_function) -> None:
+    """ Test the verification of the intact GZIP and BZ2 archives. """
+
+    Path(tmp_path, archive_file_name).write_bytes(
+        compress_function(urandom(64 * 1024)) + compress_function(b"C>>CC\n" * 1000)
+    )
+
+    DataSourceExtractionUtility.verify_archive(
+        archive_file_path=Path(tmp_path, archive_file_name),
+        is_checksum_verified=is_checksum_verified
+    )
+
+
+@mark.parametrize("is_checksum_verified", [False, True, ])
+@mark.parametrize("archive_file_name, compress_function", [
+    ("input.txt.gz", compress),
+    ("input.txt.bz2", bz2_compress),
+])
+@mark.parametrize("number_of_truncated_bytes", [1, 4, 1024, ])
+def test_verify_truncated_archive(
+        tmp_path,
+        is_checksum_verified,
+        archive_file_name,
+        compress_function,
+        number_of_truncated_bytes
+) -> None:
+    """ Test the rejection of the truncated GZIP and BZ2 archives, including the verification of the headers only. """
+
+    Path(tmp_path, archive_file_name).write_bytes(
+        compress_function(urandom(64 * 1024))[:-number_of_truncated_bytes]
+    )
+
+    with raises(ValueError, match="is corrupt"):
+        DataSourceExtractionUtility.verify_archive(
+            archive_file_path=Path(tmp_path, archive_file_name),
+            is_checksum_verified=is_checksum_verified
+        )
+
+
+def test_verify_large_truncated_gzip_archive(tmp_path, monkeypatch) -> None:
+    """ Test the rejection of a large GZIP archive without its trailer by the verification of the header. """
+
+    monkeypatch.setattr(DataSourceExtractionUtility, "_maximum_fully_verified_gzip_file_size", 0)
+
+    Path(tmp_path, "input.txt.gz").write_bytes(compress(b"\0" * 16 * 1024 * 1024)[:-8])
+
+    with raises(ValueError, match="trailer"):
+        DataSourceExtractionUtility.verify_archive(
+            archive_file_path=Path(tmp_path, "input.txt.gz"),
+            is_checksum_verified=False
+        )
+
+
+def test_verify_large_gzip_archive_corrupt_after_header(tmp_path, monkeypatch) -> None:
+    """ Test the rejection of a large GZIP archive that is corrupt after its header and has no digest manifest. """
+
+    monkeypatch.setattr(DataSourceExtractionUtility, "_maximum_fully_verified_gzip_file_size", 0)
+
+    archive_file_content = bytearray(compress(urandom(256 * 1024)))
+    archive_file_content[len(archive_file_content) // 2] ^= 0xff
+
+    Path(tmp_path, "input.txt.gz").write_bytes(archive_file_content)
+
+    with raises(ValueError, match="corrupt"):
+        DataSourceExtractionUtility.verify_archive(
+            archive_file_path=Path(tmp_path, "input.txt.gz"),
+            is_checksum_verified=False
+        )
+
+
+@mark.parametrize("corruption, corruption_reason", [
+    (None, None),
+    ("truncation", "differs from the size"),
+    ("bit_flip", "SHA-256"),
+])
+def test_verify_large_gzip_archive_with_digest_manifest(tmp_path, monkeypatch, corruption, corruption_reason) -> None:
+    """ Test the verification of a large GZIP archive against the digest manifest of the downloaded file. """
+
+    monkeypatch.setattr(DataSourceExtractionUtility, "_maximum_fully_verified_gzip_file_size", 0)
+    monkeypatch.setattr(DataSourceExtractionUtility, "_verified_archive_cache_configuration", {
+        "is_enabled": False,
+        "cache_directory_path": None,
+    })
+
+    archive_file_content = bytearray(compress(urandom(256 * 1024)))
+
+    DataSourceDownloadUtility.get_file_digest_manifest_path(
+        file_path=Path(tmp_path, "input.txt.gz")
+    ).write_text(dumps({
+        "file_url": "https://example.com/input.txt.gz",
+        "file_size": len(archive_file_content),
+        "sha256": sha256(archive_file_content).hexdigest(),
+    }))
+
+    if corruption == "truncation":
+        archive_file_content = archive_file_content[:len(archive_file_content) // 2] + archive_file_content[-8:]
+
+    elif corruption == "bit_flip":
+        archive_file_content[len(archive_file_content) // 2] ^= 0xff
+
+    Path(tmp_path, "input.txt.gz").write_bytes(archive_file_content)
+
+    if corruption_reason is None:
+        DataSourceExtractionUtility.verify_archive(
+            archive_file_path=Path(tmp_path, "input.txt.gz"),
+            is_checksum_verified=False
+        )
+
+    else:
+        with raises(ValueError, match=corruption_reason):
+            DataSourceExtractionUtility.verify_archive(
+                archive_file_path=Path(tmp_path, "input.txt.gz"),
+                is_checksum_verified=False
+            )
+
+
+@mark.parametrize("archive_file_name", ["archive.tar.gz", "archive.tar.bz2", ])
+def test_extract_tar_archive_member(tmp_path, archive_file_name) -> None:
+    """ Test the extraction of a member of a compressed TAR archive and the extraction manifest that it writes. """
+
+    file_content = b"C>>CC\t1\n" * 100000
+
+    with TarFile.open(
+        name=Path(tmp_path, archive_file_name),
+        mode="w:{compression:s}".format(
+            compression=archive_file_name.split(".")[-1]
+        )
+    ) as tar_archive_file_handle:
+        tar_archive_member = TarInfo(
+            name="release/tsv/reactions.tsv"
+        )
+
+        tar_archive_member.size = len(file_content)
+
+        tar_archive_file_handle.addfile(
+            tarinfo=tar_archive_member,
+            fileobj=BytesIO(file_content)
+        )
+
+    Path(tmp_path, "output").mkdir()
+
+    DataSourceExtractionUtility.extract_tar_archive_member(
+        archive_file_path=Path(tmp_path, archive_file_name),
+        archive_member_name="release/tsv/reactions.tsv",
+        output_file_path=Path(tmp_path, "output", "reactions.tsv")
+    )
+
+    assert Path(tmp_path, "output", "reactions.tsv").read_bytes() == file_content
+
+    assert DataSourceExtractionUtility.is_extraction_up_to_date(
+        archive_file_path=Path(tmp_path, archive_file_name),
+        output_directory_path=Path(tmp_path, "output"),
+        archive_member_name_patterns=["release/tsv/reactions.tsv", ]
+    )
+
+    assert sorted(file_path.name for file_path in Path(tmp_path, "output").iterdir()) == [
+        "{archive_file_name:s}.extraction.json".format(
+            archive_file_name=archive_file_name
+        ),
+        "reactions.tsv",
+    ]
+
+
+@mark.parametrize("archive_file_name, archive_member_name, is_gzip_decompressed", [
+    ("input.zip", "data/input.txt", False),
+    ("input.zip", "data/input.txt.gzip", True),
+    ("input.zip", "data/input.pkl.gz", True),
+    ("input.tar", "data/input.txt", False),
+    ("input.tar.gz", "data/input.txt.gz", True),
+    ("input.txt.gz", None, False),
+])
+def test_open_input_file(tmp_path, archive_file_name, archive_member_name, is_gzip_decompressed) -> None:
+    """ Test that an input file is read identically from its archive and from the input directory. """
+
+    file_content = b"C>>CC\n" * 1000 + urandom(1024)
+
+    archive_member_content = compress(file_content) if is_gzip_decompressed else file_content
+
+    if archive_file_name.endswith(".zip"):
+        with ZipFile(Path(tmp_path, archive_file_name), mode="w") as zip_archive_file_handle:
+            zip_archive_file_handle.writestr(archive_member_name, archive_member_content)
+
+    elif archive_member_name is not None:
+        with TarFile.open(
+            Path(tmp_path, archive_file_name),
+            mode="w" if archive_file_name.endswith(".tar") else "w:gz"
+        ) as tar_archive_file_handle:
+            tar_info = TarInfo(
+                name=archive_member_name
+            )
+
+            tar_info.size = len(archive_member_content)
+
+            tar_archive_file_handle.addfile(tar_info, BytesIO(archive_member_content))
+
+    else:
+        Path(tmp_path, archive_file_name).write_bytes(compress(file_content))
+
+    Path(tmp_path, "input.txt").write_bytes(file_content)
+
+    for input_archive_file_name in [archive_file_name, None, ]:
+        with DataSourceExtractionUtility.open_input_file(
+            input_directory_path=tmp_path,
+            input_file_name="input.txt",
+            archive_file_name=input_archive_file_name,
+            archive_member_name=archive_member_name,
+            is_gzip_decompressed=is_gzip_decompressed
+        ) as input_file_handle:
+            assert input_file_handle.read() == file_content
+
+
+def test_open_archive_member_that_is_not_regular_file(tmp_path) -> None:
+    """ Test the rejection of the TAR archive members that are not regular files. """
+
+    with TarFile.open(Path(tmp_path, "input.tar"), mode="w") as tar_archive_file_handle:
+        tar_info = TarInfo(
+            name="data"
+        )
+
+        tar_info.type = b"5"
+
+        tar_archive_file_handle.addfile(tar_info)
+
+    with raises(ValueError):
+        with DataSourceExtractionUtility.open_archive_member(
+            archive_file_path=Path(tmp_path, "input.tar"),
+            archive_member_name="data"
+        ):
+            pass
+
+
+def _get_formatted_dataframe(
+        output_directory_path: Path
+):
+    """
+    Get the formatted data from the output file in an output directory.
+
+    :parameter output_directory_path: The path to the output directory where the data is formatted.
+
+    :returns: The formatted data.
+    """
+
+    return read_csv(next(output_directory_path.glob("*.csv")))
+
+
+def test_format_v_1k_tpl_by_20210128_schwaller_p_et_al_from_archive(tmp_path) -> None:
+    """ Test that the GZIP files in a ZIP archive are formatted as their extracted files are. """
+
+    for directory_name in ["input", "output_from_archive", "output_from_directory", ]:
+        Path(tmp_path, directory_name).mkdir()
+
+    with ZipFile(Path(tmp_path, "input", "MappingChemicalReactions.zip"), mode="w") as zip_archive_file_handle:
+        for input_file_name in ["uspto_1k_TPL_test.tsv", "uspto_1k_TPL_train_valid.tsv", ]:
+            file_content = ("\tcanonical_rxn\tlabels\n" + "".join(
+                "{index:d}\tC>>C{carbon_atoms:s}\t{index:d}\n".format(
+                    index=index,
+                    carbon_atoms="C" * (index % 5)
+                ) for index in range(100)
+            )).encode()
+
+            Path(tmp_path, "input", input_file_name).write_bytes(file_content)
+
+            zip_archive_file_handle.writestr(
+                "data_set/{input_file_name:s}.gzip".format(
+                    input_file_name=input_file_name
+                ),
+                compress(file_content)
+            )
+
+    for output_directory_name, is_virtual_extraction_enabled in [
+        ("output_from_archive", True, ),
+        ("output_from_directory", False, ),
+    ]:
+        USPTOReactionDatasetFormattingUtility.format_v_1k_tpl_by_20210128_schwaller_p_et_al(
+            input_directory_path=Path(tmp_path, "input"),
+            output_directory_path=Path(tmp_path, output_directory_name),
+            is_virtual_extraction_enabled=is_virtual_extraction_enabled
+        )
+
+    assert len(_get_formatted_dataframe(Path(tmp_path, "output_from_archive"))) == 200
+
+    assert_frame_equal(
+        _get_formatted_dataframe(Path(tmp_path, "output_from_archive")),
+        _get_formatted_dataframe(Path(tmp_path, "output_from_directory"))
+    )
+
+
+def test_format_v_50k_by_20141226_schneider_n_et_al_from_archive(tmp_path) -> None:
+    """ Test that the pickled GZIP files in a ZIP archive are formatted as their extracted files are. """
+
+    for directory_name in ["input", "output_from_archive", "output_from_directory", ]:
+        Path(tmp_path, directory_name).mkdir()
+
+    with ZipFile(Path(tmp_path, "input", "ci5006614_si_002.zip"), mode="w") as zip_archive_file_handle:
+        for input_file_name in ["training_test_set_patent_data.pkl", "unclassified_reactions_patent_data.pkl", ]:
+            file_content = b"".join(
+                pickle_dumps((
+                    "C>>C{carbon_atoms:s}".format(
+                        carbon_atoms="C" * (index % 5)
+                    ),
+                    "US{index:d}".format(
+                        index=index
+                    ),
+                    "1.2.{class_index:d}".format(
+                        class_index=index % 3
+                    ),
+                )) for index in range(100)
+            )
+
+            Path(tmp_path, "input", input_file_name).write_bytes(file_content)
+
+            zip_archive_file_handle.writestr(
+                "ChemReactionClassification/data/{input_file_name:s}.gz".format(
+                    input_file_name=input_file_name
+                ),
+                compress(file_content)
+            )
+
+        file_content = pickle_dumps({
+            "1.2.{class_index:d}".format(
+                class_index=class_index
+            ): "Reaction class {class_index:d}".format(
+                class_index=class_index
+            ) for class_index in range(3)
+        })
+
+        Path(tmp_path, "input", "names_rTypes_classes_superclasses_training_test_set_patent_data.pkl").write_bytes(
+            file_content
+        )
+
+        zip_archive_file_handle.writestr(
+            "ChemReactionClassification/data/names_rTypes_classes_superclasses_training_test_set_patent_data.pkl",
+            file_content
+        )
+
+    for output_directory_name, is_virtual_extraction_enabled in [
+        ("output_from_archive", True, ),
+        ("output_from_directory", False, ),
+    ]:
+        USPTOReactionDatasetFormattingUtility.format_v_50k_by_20141226_schneider_n_et_al(
+            input_directory_path=Path(tmp_path, "input"),
+            output_directory_path=Path(tmp_path, output_directory_name),
+            is_virtual_extraction_enabled=is_virtual_extraction_enabled
+        )
+
+    assert _get_formatted_dataframe(Path(tmp_path, "output_from_archive"))["reaction_class_name"].notna().all()
+
+    assert_frame_equal(
+        _get_formatted_dataframe(Path(tmp_path, "output_from_archive")),
+        _get_formatted_dataframe(Path(tmp_path, "output_from_directory"))
+    )
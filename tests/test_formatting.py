@@ -0,0 +1,311 @@
+""" The ``tests`` package ``test_formatting`` module. """
+
+from ast import literal_eval
+from gzip import GzipFile
+from pathlib import Path
+from re import DOTALL, search, sub
+
+from pandas import read_csv, read_parquet
+from pandas.testing import assert_frame_equal
+
+from pytest import mark, raises
+
+from rdkit.Chem.rdChemReactions import ReactionFromRxnBlock, ReactionFromSmarts, ReactionToRxnBlock, ReactionToSmiles
+
+from data_source.base.utility import DataSourceDataFrameWriter, DataSourceFormattingUtility
+from data_source.compound_pattern.rdkit.utility.formatting import RDKitCompoundPatternDatasetFormattingUtility
+from data_source.reaction.miscellaneous.utility.formatting import MiscellaneousReactionDataSourceFormattingUtility
+
+
+@mark.parametrize("file_content", [
+    b"C id_1\nCC id_2\nCCC id_3\n",
+    b"C\tid_1\nCC  id_2\nCCC \t id_3\n",
+])
+def test_read_csv_file_with_whitespace_delimiter(tmp_path, file_content) -> None:
+    """ Test the reading of the whitespace-separated files using the `pandas` reader backend. """
+
+    Path(tmp_path, "input.smi").write_bytes(file_content)
+
+    dataframe = DataSourceFormattingUtility.read_csv_file(
+        filepath_or_buffer=Path(tmp_path, "input.smi"),
+        sep=r"\s+",
+        header=None
+    )
+
+    assert dataframe.values.tolist() == [["C", "id_1", ], ["CC", "id_2", ], ["CCC", "id_3", ], ]
+
+
+@mark.parametrize("file_content", [
+    b"C id_1\nCC id_2\nCCC id_3\n",
+    b"C\tid_1\nCC\tid_2\nCCC\tid_3\n",
+])
+def test_read_csv_file_with_whitespace_delimiter_using_pyarrow(tmp_path, file_content) -> None:
+    """ Test the reading of the files separated by a single whitespace character using the `pyarrow` reader backend. """
+
+    Path(tmp_path, "input.smi").write_bytes(file_content)
+
+    assert_frame_equal(
+        DataSourceFormattingUtility.read_csv_file(
+            reader_backend="pyarrow",
+            filepath_or_buffer=Path(tmp_path, "input.smi"),
+            sep=r"\s+",
+            header=None,
+            dtype={
+                0: "string",
+                1: "string",
+            }
+        ),
+        DataSourceFormattingUtility.read_csv_file(
+            filepath_or_buffer=Path(tmp_path, "input.smi"),
+            sep=r"\s+",
+            header=None,
+            dtype={
+                0: "string",
+                1: "string",
+            }
+        )
+    )
+
+
+def test_read_csv_chunks_with_whitespace_delimiter_from_buffer_using_pyarrow(tmp_path) -> None:
+    """ Test the streaming of the chunks of a compressed whitespace-separated file using the `pyarrow` backend. """
+
+    with GzipFile(Path(tmp_path, "input.smi.gz"), mode="wb") as gzip_file_handle:
+        gzip_file_handle.write(b"".join(
+            "C{index:d} id_{index:d}\n".format(index=index).encode() for index in range(1000)
+        ))
+
+    with GzipFile(Path(tmp_path, "input.smi.gz"), mode="rb") as gzip_file_handle:
+        dataframe_chunks = list(DataSourceFormattingUtility.read_csv_chunks(
+            number_of_rows_per_chunk=100,
+            reader_backend="pyarrow",
+            filepath_or_buffer=gzip_file_handle,
+            sep=r"\s+",
+            header=None
+        ))
+
+    assert sum(len(dataframe_chunk) for dataframe_chunk in dataframe_chunks) == 1000
+    assert dataframe_chunks[-1].values.tolist()[-1] == ["C999", "id_999", ]
+
+
+@mark.parametrize("file_content", [
+    b"C\tid_1\nCC  id_2\n",
+    b"C id_1\nCC\tid_2\n",
+    b" C id_1\nCC id_2\n",
+])
+def test_read_csv_file_with_irregular_whitespace_delimiter_using_pyarrow(tmp_path, file_content) -> None:
+    """ Test the rejection of the files with the irregular whitespace delimiters by the `pyarrow` reader backend. """
+
+    Path(tmp_path, "input.smi").write_bytes(file_content)
+
+    with raises(ValueError):
+        DataSourceFormattingUtility.read_csv_file(
+            reader_backend="pyarrow",
+            filepath_or_buffer=Path(tmp_path, "input.smi"),
+            sep=r"\s+",
+            header=None
+        )
+
+
+def test_read_csv_chunks_pins_data_types_of_first_chunk(tmp_path) -> None:
+    """ Test the pinning of the data types of the chunks to the data types of the first chunk. """
+
+    Path(tmp_path, "input.tsv").write_text("ReactionSmiles\tParagraphNum\tTextMinedYield\tCalculatedYield\n" + "".join(
+        "C>>CC\t{index:d}\t{text_mined_yield:s}\t{calculated_yield:s}\n".format(
+            index=index,
+            text_mined_yield="" if index < 100 else "85%",
+            calculated_yield="50.5" if index < 150 else "50.5%"
+        ) for index in range(200)
+    ))
+
+    dataframe_chunks = list(DataSourceFormattingUtility.read_csv_chunks(
+        number_of_rows_per_chunk=50,
+        filepath_or_buffer=Path(tmp_path, "input.tsv"),
+        sep="\t",
+        header=0
+    ))
+
+    assert len(dataframe_chunks) == 4
+    assert all(
+        str(dataframe_chunk["TextMinedYield"].dtype) == "string" for dataframe_chunk in dataframe_chunks
+    )
+    assert dataframe_chunks[-1]["TextMinedYield"].tolist() == ["85%", ] * 50
+    assert dataframe_chunks[-1]["CalculatedYield"].tolist() == ["50.5%", ] * 50
+    assert [str(dataframe_chunk["ParagraphNum"].dtype) for dataframe_chunk in dataframe_chunks] == ["int64", ] * 4
+
+
+def test_read_csv_chunks_written_to_parquet(tmp_path) -> None:
+    """ Test the writing of the chunks whose inferred data types differ to a Parquet file. """
+
+    Path(tmp_path, "input.tsv").write_text("ReactionSmiles\tTextMinedYield\tYear\n" + "".join(
+        "C>>CC\t{text_mined_yield:s}\t{year:d}\n".format(
+            text_mined_yield="" if index < 100 else "85%",
+            year=1976 + index // 50
+        ) for index in range(200)
+    ))
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output.parquet"),
+        output_file_format="parquet"
+    ) as dataframe_writer:
+        for dataframe_chunk in DataSourceFormattingUtility.read_csv_chunks(
+            number_of_rows_per_chunk=50,
+            filepath_or_buffer=Path(tmp_path, "input.tsv"),
+            sep="\t",
+            header=0,
+            dtype={
+                "Year": "category",
+            }
+        ):
+            dataframe_writer.write(
+                dataframe=dataframe_chunk
+            )
+
+    dataframe = read_parquet(Path(tmp_path, "output.parquet"))
+
+    assert len(dataframe) == 200
+    assert dataframe["TextMinedYield"].isna().sum() == 100
+    assert dataframe["Year"].astype(int).tolist() == [1976 + index // 50 for index in range(200)]
+
+
+@mark.parametrize("file_content, record_start_marker, content_start_marker, content_end_marker, records", [
+    (b"", b"$RXN", None, None, list()),
+    (b"$RXN\na\n$RXN\nb\n", b"$RXN", b"{", None, list()),
+    (b"$RXN\na\n$RXN\nb\n", b"$RXN", None, b"};", list()),
+    (b"header\n$RXN\na\n$RXN\nb\n", b"$RXN", None, None, ["$RXN\na\n", "$RXN\nb\n", ]),
+    (b"header\r\n$RXN\r\na\r\n$RXN\r\nb\r\n", b"$RXN", None, None, ["$RXN\na\n", "$RXN\nb\n", ]),
+    (b"x = {\n{1},\n{2}};\n{3}", b"{", b"{", b"};", ["{1},\n", "{2}", ]),
+])
+def test_iterate_file_records(
+        tmp_path,
+        file_content,
+        record_start_marker,
+        content_start_marker,
+        content_end_marker,
+        records
+) -> None:
+    """ Test the iteration over the records of the memory-mapped text files. """
+
+    Path(tmp_path, "input.txt").write_bytes(file_content)
+
+    assert list(DataSourceFormattingUtility.iterate_file_records(
+        file_path=Path(tmp_path, "input.txt"),
+        record_start_marker=record_start_marker,
+        content_start_marker=content_start_marker,
+        content_end_marker=content_end_marker
+    )) == records
+
+
+@mark.parametrize("line_ending", ["\n", "\r\n", ])
+def test_format_rdf_file(tmp_path, line_ending) -> None:
+    """ Test that the records of the RDF files are parsed as they were when the whole file was read and split. """
+
+    Path(tmp_path, "input").mkdir()
+    Path(tmp_path, "output").mkdir()
+
+    Path(tmp_path, "input", "golden_dataset.rdf").write_bytes("$RDFILE 1\n$DATM 2021-11-02\n{rxn_blocks:s}".format(
+        rxn_blocks="".join(
+            "$RFMT $RIREG {index:d}\n{rxn_block:s}$DTYPE ID\n$DATUM {index:d}\n".format(
+                index=index,
+                rxn_block=ReactionToRxnBlock(
+                    reaction=ReactionFromSmarts(
+                        SMARTS=reaction_smarts,
+                        useSmiles=True
+                    )
+                )
+            ) for index, reaction_smarts in enumerate(["CC(=O)O.OCC>>CC(=O)OCC", "C=C.[H][H]>>CC", "CO>>C=O", ])
+        )
+    ).replace("\n", line_ending).encode())
+
+    reaction_smiles = list()
+
+    with open(Path(tmp_path, "input", "golden_dataset.rdf")) as input_file_handle:
+        for reaction_rxn_block_without_identifier in input_file_handle.read().split(
+            sep="$RXN"
+        )[1:]:
+            reaction_smiles.append(ReactionToSmiles(
+                reaction=ReactionFromRxnBlock(
+                    rxnblock="$RXN{reaction_rxn_block_without_identifier:s}".format(
+                        reaction_rxn_block_without_identifier=reaction_rxn_block_without_identifier
+                    )
+                )
+            ))
+
+    MiscellaneousReactionDataSourceFormattingUtility.format_v_golden_dataset_by_20211102_lin_a_et_al(
+        input_directory_path=Path(tmp_path, "input"),
+        output_directory_path=Path(tmp_path, "output")
+    )
+
+    assert len(reaction_smiles) == 3
+    assert read_csv(next(Path(tmp_path, "output").glob("*.csv")))["reaction_smiles"].tolist() == reaction_smiles
+
+
+@mark.parametrize("line_ending", ["\n", "\r\n", ])
+def test_format_filter_catalog_file(tmp_path, line_ending) -> None:
+    """ Test that the entries of the filter catalog files are parsed as they were when the whole file was evaluated. """
+
+    Path(tmp_path, "input").mkdir()
+    Path(tmp_path, "output").mkdir()
+
+    Path(tmp_path, "input", "brenk.in").write_bytes((
+        "// The Brenk filters.\n"
+        "const FilterData_t BRENK[] = {\n"
+        "  {\"2-halo_pyridine\", \"n1c([F,Cl,Br,I])cccc1\", \"\", \"\"},\n"
+        "  {\"acid_halide\", \"C(=O)[Cl,Br,I,F]\", \"\",\n"
+        "   \"\"},\n"
+        "  {\"aldehyde\", \"[CX3H1](=O)[#6]\", \"\", \"\" }};\n"
+        "const unsigned int NUM_BRENK = sizeof(BRENK) / sizeof(FilterData_t);\n"
+    ).replace("\n", line_ending).encode())
+
+    with open(Path(tmp_path, "input", "brenk.in")) as source_file_handle:
+        source_file_content_string = search(
+            pattern=r"\{(.*)\};",
+            string=source_file_handle.read(),
+            flags=DOTALL
+        ).group(1).replace("{", "[").replace("}", "]")
+
+        compound_patterns = [
+            [compound_pattern_name, compound_pattern_smarts, ]
+            for compound_pattern_name, compound_pattern_smarts, _, _ in literal_eval(
+                node_or_string="[{source_file_content_string:s}]".format(
+                    source_file_content_string=sub(
+                        pattern=r",\s*\"\"\s*\]",
+                        repl=", \"\"]",
+                        string=source_file_content_string
+                    )
+                )
+            )
+        ]
+
+    RDKitCompoundPatternDatasetFormattingUtility.format_v_htl_by_20080307_brenk_r_et_al(
+        input_directory_path=Path(tmp_path, "input"),
+        output_directory_path=Path(tmp_path, "output")
+    )
+
+    assert len(compound_patterns) == 3
+    assert read_csv(next(Path(tmp_path, "output").glob("*.csv")))[[
+        "compound_pattern_name",
+        "compound_pattern_smarts",
+    ]].values.tolist() == compound_patterns
+
+
+def test_format_filter_catalog_files_without_content(tmp_path) -> None:
+    """ Test that the filter catalog files that are empty or lack the array initializer contain no entries. """
+
+    Path(tmp_path, "input").mkdir()
+    Path(tmp_path, "output").mkdir()
+
+    Path(tmp_path, "input", "pains_a.in").write_bytes(b"")
+    Path(tmp_path, "input", "pains_b.in").write_bytes(b"// The PAINS filters.\r\n")
+    Path(tmp_path, "input", "pains_c.in").write_bytes(
+        b"const FilterData_t PAINS_C[] = {\r\n  {\"ene_one_A(13)\", \"C=CC(=O)\", \"\", \"\"}};\r\n"
+    )
+
+    RDKitCompoundPatternDatasetFormattingUtility.format_v_pains_by_20100204_baell_j_b_and_holloway_g_a(
+        input_directory_path=Path(tmp_path, "input"),
+        output_directory_path=Path(tmp_path, "output")
+    )
+
+    assert read_csv(next(Path(tmp_path, "output").glob("*.csv"))).values.tolist() == [
+        ["ene_one_A(13)", "C=CC(=O)", "pains_c.in", ],
+    ]
@@ -0,0 +1,71 @@
+""" The ``tests`` package ``test_schema`` module. """
+
+from pathlib import Path
+
+from pandas import read_parquet
+
+from pytest import mark, raises
+
+from data_source.base.utility import DataSourceSchemaRegistry
+from data_source.compound.coconut.utility.formatting import COCONUTCompoundDatabaseFormattingUtility
+
+
+@mark.parametrize("data_source_name, version", [
+    ("chembl", "v_release_35"),
+    ("coconut", "v_2_0_by_20241126_chandrasekhar_v_et_al"),
+    ("coconut", "v_2_0_complete_by_20241126_chandrasekhar_v_et_al"),
+    ("crd", "v_reaction_smiles_2023"),
+    ("zinc", "v_building_block_bb_01"),
+])
+def test_get_input_column_data_types(data_source_name, version) -> None:
+    """ Test that the registered versions of the data sources are parsed using fixed data types. """
+
+    assert DataSourceSchemaRegistry.get_input_column_data_types(
+        data_source_name=data_source_name,
+        version=version
+    ) is not None
+
+
+def test_register_schema_with_unsupported_data_type(monkeypatch) -> None:
+    """ Test the rejection of the schemas with unsupported column data types. """
+
+    monkeypatch.setattr(DataSourceSchemaRegistry, "_schemas", dict())
+
+    with raises(ValueError):
+        DataSourceSchemaRegistry.register_schema(
+            data_source_name="coconut",
+            version_pattern="v_*",
+            input_column_data_types={
+                "identifier": "object",
+            }
+        )
+
+
+def test_format_coconut_in_chunks(tmp_path) -> None:
+    """ Test that the columns of the COCONUT database keep their data types across the chunks. """
+
+    Path(tmp_path, "input").mkdir()
+    Path(tmp_path, "output").mkdir()
+
+    Path(tmp_path, "input", "coconut-10-2024.csv").write_text(
+        "identifier,canonical_smiles,standard_inchi,standard_inchi_key,molecular_weight\n"
+        "CNP0000001.0,C,,,16.04\n"
+        "CNP0000002.0,CC,,,30.07\n"
+        "CNP0000003.0,CCC,InChI=1S/C3H8/c1-3-2/h3H2;1-2H3,ATUOYWHBWRKTHZ-UHFFFAOYSA-N,44.10\n"
+    )
+
+    COCONUTCompoundDatabaseFormattingUtility.format_v_2_0_by_20241126_chandrasekhar_v_et_al(
+        version="v_2_0_by_20241126_chandrasekhar_v_et_al",
+        input_directory_path=Path(tmp_path, "input"),
+        output_directory_path=Path(tmp_path, "output"),
+        number_of_rows_per_chunk=2,
+        output_file_format="parquet"
+    )
+
+    dataframe = read_parquet(
+        path=next(Path(tmp_path, "output").glob("*.parquet"))
+    )
+
+    assert dataframe["standard_inchi_key"].tolist()[-1] == "ATUOYWHBWRKTHZ-UHFFFAOYSA-N"
+    assert str(dataframe["file_name"].dtype) == "category"
+    assert dataframe["molecular_weight"].tolist() == [16.04, 30.07, 44.10, ]
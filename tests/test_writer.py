@@ -0,0 +1,196 @@
+""" The ``tests`` package ``test_writer`` module. """
+
+from pathlib import Path
+
+from pandas import DataFrame, concat, read_csv, read_feather, read_parquet
+
+from pytest import mark, raises
+
+from data_source.base.utility import DataSourceDataFrameWriter
+
+
+@mark.parametrize("output_file_format", ["csv", "parquet", "feather", ])
+def test_write_dataframe_chunks(tmp_path, output_file_format) -> None:
+    """ Test the appending of the data frame chunks to the output file. """
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output.csv"),
+        output_file_format=output_file_format,
+        number_of_rows_per_row_group=2
+    ) as dataframe_writer:
+        for chunk_index in range(3):
+            dataframe_writer.write(
+                dataframe=DataFrame({
+                    "reaction_smiles": ["C>>CC", "CC>>CCC", ],
+                    "file_name": ["file_{chunk_index:d}.txt".format(chunk_index=chunk_index), ] * 2,
+                }).astype({
+                    "file_name": "category",
+                })
+            )
+
+    output_file_path = Path(tmp_path, "output.{output_file_format:s}".format(
+        output_file_format=output_file_format
+    ))
+
+    dataframe = {
+        "csv": read_csv,
+        "parquet": read_parquet,
+        "feather": read_feather,
+    }[output_file_format](output_file_path)
+
+    assert dataframe["reaction_smiles"].tolist() == ["C>>CC", "CC>>CCC", ] * 3
+    assert dataframe["file_name"].astype(str).tolist() == [
+        "file_{chunk_index:d}.txt".format(chunk_index=chunk_index) for chunk_index in range(3) for _ in range(2)
+    ]
+
+
+@mark.parametrize("output_file_format", ["parquet", "feather", ])
+def test_write_dataframe_chunks_with_different_data_types(tmp_path, output_file_format) -> None:
+    """ Test the conversion of the data frame chunks whose data types differ to the schema of the output file. """
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output"),
+        output_file_format=output_file_format
+    ) as dataframe_writer:
+        dataframe_writer.write(
+            dataframe=DataFrame({
+                "id": [1, 2, ],
+                "patent_number": ["US1", "US2", ],
+                "yield": [None, None, ],
+            })
+        )
+
+        dataframe_writer.write(
+            dataframe=DataFrame({
+                "id": [3.0, None, ],
+                "patent_number": [3, 4, ],
+                "yield": ["85%", None, ],
+            })
+        )
+
+    dataframe = {
+        "parquet": read_parquet,
+        "feather": read_feather,
+    }[output_file_format](dataframe_writer.output_file_path)
+
+    assert dataframe["id"].tolist()[:3] == [1, 2, 3, ]
+    assert dataframe["patent_number"].tolist() == ["US1", "US2", "3", "4", ]
+    assert dataframe["yield"].tolist()[2] == "85%"
+
+
+def test_write_dataframe_chunks_with_incompatible_data_types(tmp_path) -> None:
+    """ Test the rejection of the data frame chunks that cannot be converted to the schema of the output file. """
+
+    with raises(ValueError, match="'id'"):
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(tmp_path, "output"),
+            output_file_format="parquet"
+        ) as dataframe_writer:
+            dataframe_writer.write(
+                dataframe=DataFrame({
+                    "id": [1, 2, ],
+                })
+            )
+
+            dataframe_writer.write(
+                dataframe=DataFrame({
+                    "id": ["a", "b", ],
+                })
+            )
+
+    assert not Path(tmp_path, "output.parquet").exists()
+
+
+@mark.parametrize("output_file_format", ["csv", "parquet", "feather", ])
+def test_write_dataframe_chunks_with_different_columns(tmp_path, output_file_format) -> None:
+    """ Test that the columns of the output file are the union of the columns of the data frame chunks. """
+
+    dataframes = [
+        DataFrame({
+            "reaction_smiles": ["C>>CC", "CC>>CCC", ],
+            "file_name": ["file_0.txt", ] * 2,
+        }).astype({
+            "file_name": "category",
+        }),
+        DataFrame({
+            "file_name": ["file_1.txt", ],
+            "reaction_smiles": ["CCC>>CCCC", ],
+            "yield": [0.5, ],
+        }).astype({
+            "file_name": "category",
+        }),
+        DataFrame({
+            "reaction_smiles": ["CCCC>>CCCCC", ],
+            "patent_number": ["US1", ],
+        }),
+    ]
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output"),
+        output_file_format=output_file_format,
+        is_empty_output_allowed=False
+    ) as dataframe_writer:
+        for dataframe in dataframes:
+            dataframe_writer.write(
+                dataframe=dataframe
+            )
+
+    dataframe = {
+        "csv": read_csv,
+        "parquet": read_parquet,
+        "feather": read_feather,
+    }[output_file_format](dataframe_writer.output_file_path)
+
+    expected_dataframe = concat(dataframes).reset_index(drop=True)
+
+    assert dataframe.columns.tolist() == expected_dataframe.columns.tolist()
+    assert dataframe.astype(str).replace("<NA>", "nan").values.tolist() == \
+        expected_dataframe.astype(str).values.tolist()
+    assert list(tmp_path.glob("*.tmp")) == list()
+
+
+def test_write_no_dataframes(tmp_path) -> None:
+    """ Test the rejection of the output files to which no data frames are written, as in the case of concatenation. """
+
+    with raises(ValueError, match="No data frames"):
+        with DataSourceDataFrameWriter(
+            output_file_path=Path(tmp_path, "output"),
+            is_empty_output_allowed=False
+        ):
+            pass
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output")
+    ):
+        pass
+
+
+@mark.parametrize("output_file_format", ["parquet", "feather", ])
+def test_write_dataframe_chunks_with_different_numbers_of_categories(tmp_path, output_file_format) -> None:
+    """ Test the appending of the categorical columns whose indices differ in width to the output file. """
+
+    with DataSourceDataFrameWriter(
+        output_file_path=Path(tmp_path, "output"),
+        output_file_format=output_file_format
+    ) as dataframe_writer:
+        for number_of_categories in [3, 300, 70000, ]:
+            dataframe_writer.write(
+                dataframe=DataFrame({
+                    "file_name": [
+                        "file_{category_index:d}.txt".format(category_index=category_index)
+                        for category_index in range(number_of_categories)
+                    ],
+                }).astype({
+                    "file_name": "category",
+                })
+            )
+
+    dataframe = {
+        "parquet": read_parquet,
+        "feather": read_feather,
+    }[output_file_format](dataframe_writer.output_file_path)
+
+    assert dataframe["file_name"].astype(str).tolist() == [
+        "file_{category_index:d}.txt".format(category_index=category_index)
+        for number_of_categories in [3, 300, 70000, ] for category_index in range(number_of_categories)
+    ]